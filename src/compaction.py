@@ -0,0 +1,305 @@
+# src/compaction.py
+import os
+import re
+import sys
+import glob
+import zlib
+import json
+import codecs
+import logging
+import argparse
+from datetime import datetime
+
+try:
+    import zstandard
+except ImportError:  # Optional: only needed to read .zst JSONL parts
+    zstandard = None
+
+from .job_store import JobStore, job_key
+from .linkedin_actions.scrape import parse_job_id
+from .utils.logger_setup import setup_logging
+
+# Output files written by save_results / the streaming writers
+DEFAULT_PATTERNS = ("linkedin_jobs_*.json", "linkedin_jobs_*.txt", "linkedin_jobs_*.jsonl",
+                    "linkedin_jobs_*.jsonl.gz", "linkedin_jobs_*.jsonl.zst")
+
+_FILE_TIMESTAMP = re.compile(r"(\d{8}_\d{6})")
+_TXT_FIELDS = {"Title": "title", "Company": "company", "Location": "location",
+               "Posted": "date_posted", "URL": "url", "Description": "description"}
+_TXT_SEPARATOR = b"-" * 80
+# What the writers put in place of a missing field (see TxtWriter and JOB_DETAIL_FIELD_DEFAULTS)
+_PLACEHOLDERS = {
+    "title": {"Unknown", "Unknown Title"},
+    "company": {"Unknown", "Unknown Company"},
+    "location": {"Unknown", "Unknown Location"},
+    "date_posted": {"Unknown"},
+    "description": {"Description not available", "Description not available...",
+                    "No description available", "No description available..."},
+}
+_JSON_SKIP = " \t\r\n,"
+
+
+class _GzipTailReader:
+    """Minimal gzip reader that keeps the data of a member cut short by a crash.
+
+    gzip.GzipFile raises EOFError on a truncated stream and drops what it
+    decompressed in that read; JsonlWriter's sync-flushed parts are fully
+    recoverable up to the cut. Handles multi-member files (appended parts).
+    """
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._inflater = zlib.decompressobj(wbits=31)
+        self._pending = b""
+        self._position = 0
+        self._eof = False
+
+    def _fill(self, size):
+        while len(self._pending) < size and not self._eof:
+            data = self._inflater.unconsumed_tail or self._file.read(1 << 16)
+            if not data:
+                self._eof = True
+                if not self._inflater.eof:
+                    logging.warning("Compressed file ends early (interrupted write?); keeping the records before the cut.")
+                break
+            self._pending += self._inflater.decompress(data, 1 << 20)
+            if self._inflater.eof and self._inflater.unused_data:
+                # Next gzip member
+                rest = self._inflater.unused_data
+                self._inflater = zlib.decompressobj(wbits=31)
+                self._pending += self._inflater.decompress(rest, 1 << 20)
+
+    def read(self, size):
+        self._fill(size)
+        data, self._pending = self._pending[:size], self._pending[size:]
+        self._position += len(data)
+        return data
+
+    def seek(self, offset):
+        """Forward-only seek (from the start of the decompressed data)."""
+        while self._position < offset and self.read(min(1 << 20, offset - self._position)):
+            pass
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _open_binary(path):
+    if path.endswith(".gz"):
+        return _GzipTailReader(path)
+    if path.endswith(".zst"):
+        if zstandard is None:
+            raise ValueError(f"Reading {path} requires the 'zstandard' package")
+        return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+    return open(path, "rb")
+
+
+def _read_chunk(stream, size):
+    """Reads from a possibly truncated compressed stream, treating a cut-off end as EOF."""
+    try:
+        return stream.read(size)
+    except EOFError:
+        logging.warning("Compressed file ends early (interrupted write?); keeping the records before the cut.")
+        return b""
+
+
+def iter_json_records(stream, offset=0, chunk_size=1 << 20):
+    """Incrementally parses a JSON array or a stream of JSON values (JSON Lines).
+
+    Only the current chunk and the record being decoded are held in memory.
+    Yields (record, offset just past it) so a later run can resume at that byte offset.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    stream.seek(offset)
+    buffer, position = "", offset   # position = byte offset of buffer[0]
+    in_array = offset > 0           # resuming means the opening "[" is behind us
+    eof = False
+    while True:
+        index = 0
+        while index < len(buffer) and (buffer[index] in _JSON_SKIP or (buffer[index] == "[" and not in_array)):
+            in_array = in_array or buffer[index] == "["
+            index += 1
+        position += index  # skipped characters are all ASCII
+        buffer = buffer[index:]
+        if buffer.startswith("]"):
+            return
+        if buffer:
+            try:
+                record, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if eof:
+                    logging.warning(f"Unparseable trailing data at byte {position}; stopping here.")
+                    return
+            else:
+                # A number or literal at the very end of the buffer might continue in the next chunk
+                if end < len(buffer) or eof or isinstance(record, (dict, list, str)):
+                    position += len(buffer[:end].encode("utf-8"))
+                    buffer = buffer[end:]
+                    yield record, position
+                    continue
+        if eof:
+            return
+        chunk = _read_chunk(stream, chunk_size)
+        eof = not chunk
+        buffer += utf8.decode(chunk, final=eof)
+
+
+def iter_txt_records(stream, offset=0):
+    """Parses the "txt" output format; yields (record, offset just past it)."""
+    stream.seek(offset)
+    position = offset
+    record, field = {}, None
+    while True:
+        line = stream.readline()
+        if not line:
+            return
+        position += len(line)
+        stripped = line.rstrip(b"\r\n")
+        if stripped == _TXT_SEPARATOR:
+            if record:
+                description = record.get("description")
+                if description is not None:
+                    record["description"] = description.rstrip("\n")
+                yield record, position
+            record, field = {}, None
+            continue
+        text = stripped.decode("utf-8", errors="replace")
+        label, _, value = text.partition(": ")
+        if label in _TXT_FIELDS and (field != "description" or label == "Title"):
+            field = _TXT_FIELDS[label]
+            record[field] = value
+        elif field == "description":
+            record["description"] += "\n" + text  # Descriptions can span several lines
+
+
+def _file_scraped_at(path):
+    """Timestamp for records that lack scraped_at: from the file name, else the file's mtime."""
+    match = _FILE_TIMESTAMP.search(os.path.basename(path))
+    if match:
+        return datetime.strptime(match.group(1), "%Y%m%d_%H%M%S").strftime("%Y-%m-%d %H:%M:%S")
+    return datetime.fromtimestamp(os.path.getmtime(path)).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _normalize(record, scraped_at):
+    if not isinstance(record, dict):
+        return None
+    record.setdefault("scraped_at", scraped_at)
+    for field, placeholders in _PLACEHOLDERS.items():
+        if record.get(field) in placeholders:
+            record[field] = None
+    if not record.get("job_id"):
+        record["job_id"] = parse_job_id(record.get("url"))
+    if not record["job_id"]:
+        record.pop("job_id")
+    return record if job_key(record) else None
+
+
+def iter_file_records(path, offset=0):
+    """Yields (job dict, resume offset) from one historical output file of any supported format."""
+    scraped_at = _file_scraped_at(path)
+    with _open_binary(path) as stream:
+        parse = iter_txt_records if path.endswith(".txt") else iter_json_records
+        for record, end in parse(stream, offset):
+            job = _normalize(record, scraped_at)
+            if job is not None:
+                yield job, end
+
+
+def _run_name(path):
+    """The part of an output file name that identifies its run: "<prefix>_<YYYYMMDD_HHMMSS>"."""
+    name = os.path.basename(path)
+    match = _FILE_TIMESTAMP.search(name)
+    return os.path.join(os.path.dirname(path), name[:match.end()]) if match else None
+
+
+def expand_paths(paths):
+    """Turns files, directories (searched for DEFAULT_PATTERNS) and glob patterns into a sorted file list.
+
+    The "txt" format truncates descriptions, so a .txt file is left out when a
+    JSON or JSON Lines copy of the same run is present, and .txt files come last.
+    """
+    found = set()
+    for path in paths or ["."]:
+        if os.path.isdir(path):
+            for pattern in DEFAULT_PATTERNS:
+                found.update(glob.glob(os.path.join(path, pattern)))
+        else:
+            found.update(glob.glob(path) or ([path] if os.path.exists(path) else []))
+    found = {os.path.abspath(path) for path in found}
+    full_runs = {_run_name(path) for path in found if not path.endswith(".txt")}
+    for path in sorted(found):
+        if path.endswith(".txt") and _run_name(path) in full_runs - {None}:
+            logging.info(f"Skipping {path}: a full copy of the same run is being compacted")
+            found.discard(path)
+    return sorted(found, key=lambda path: (path.endswith(".txt"), path))
+
+
+def compact(paths, store, batch_size=500):
+    """Merges historical output files into the job store, keeping the latest copy of every job.
+
+    Files are streamed record by record, so they may be larger than memory.
+    Records from .txt files only add jobs the store doesn't have yet: their
+    descriptions are cut short, so they never replace a fuller copy.
+    Progress is checkpointed after every batch; running again skips finished
+    files and resumes unfinished ones at their last checkpoint (a file that
+    changed since is read again from the start). Returns the number of records read.
+    """
+    total = 0
+    for path in expand_paths(paths):
+        stat = os.stat(path)
+        progress = store.load_progress(path)
+        offset = 0
+        if progress and progress["size"] == stat.st_size and progress["mtime_ns"] == stat.st_mtime_ns:
+            if progress["done"]:
+                logging.info(f"Already compacted: {path}")
+                continue
+            offset = progress["offset"]
+            logging.info(f"Resuming {path} at byte {offset}")
+        else:
+            logging.info(f"Compacting {path}")
+
+        overwrite = not path.endswith(".txt")
+        batch, read = [], 0
+        try:
+            for job, end in iter_file_records(path, offset):
+                batch.append(job)
+                read += 1
+                if len(batch) >= batch_size:
+                    # Upserts are idempotent, so a crash between these two steps only repeats one batch
+                    store.upsert_many(batch, overwrite=overwrite)
+                    store.save_progress(path, stat.st_size, stat.st_mtime_ns, end)
+                    batch = []
+            store.upsert_many(batch, overwrite=overwrite)
+            store.save_progress(path, stat.st_size, stat.st_mtime_ns, stat.st_size, done=True)
+        except Exception as e:
+            logging.error(f"Could not compact {path}: {e}")
+            continue
+        logging.info(f"{path}: {read} records")
+        total += read
+    logging.info(f"Compaction finished: {total} records read, {store.count()} unique jobs stored in {store.db_path}")
+    return total
+
+
+def main(argv=None):
+    """CLI: python -m src.compaction [files, directories or globs] --db linkedin_jobs.sqlite3"""
+    parser = argparse.ArgumentParser(description="Merge historical output files into one deduplicated job store.")
+    parser.add_argument("paths", nargs="*", help=f"Files, globs or directories (default: . with {DEFAULT_PATTERNS})")
+    parser.add_argument("--db", default="linkedin_jobs.sqlite3", help="Job store to merge into")
+    parser.add_argument("--batch-size", type=int, default=500, help="Records per transaction and checkpoint")
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    with JobStore(args.db) as store:
+        compact(args.paths, store, batch_size=args.batch_size)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,11 +15,77 @@ DEFAULT_CONFIG = {
     },
     "scraping": {
         "max_pages": 3,
-        "easy_apply_only": True
+        "easy_apply_only": True,
+        "mode": "details",
+        "detail_tabs": 1,
+        "http_details": {
+            "enabled": False,
+            "pool_size": 4,
+            "timeout": 15
+        },
+        "pipeline": {
+            "enabled": False,
+            "detail_workers": 2,
+            "queue_size": 50
+        }
+    },
+    "job_filters": {
+        "title_include": [],
+        "title_exclude": [],
+        "company_blocklist": [],
+        "max_age_days": None
+    },
+    "dedup": {
+        "enabled": True,
+        "db_path": "seen_jobs.sqlite3",
+        "incremental": False,
+        "stop_known_ratio": 0.8
     },
     "output": {
         "save_to_file": True,
-        "file_format": "json"
+        "file_format": "json",
+        "jsonl": {
+            "compression": None,
+            "buffer_kb": 64,
+            "fsync_every": 50,
+            "fsync_seconds": 5.0,
+            "rotate_mb": None,
+            "rotate_minutes": None
+        },
+        "sqlite": {
+            "db_path": "linkedin_jobs.sqlite3"
+        },
+        "parquet": {
+            "row_group_size": 1000,
+            "compression": "zstd"
+        },
+        "sinks": []
+    },
+    "driver": {
+        "pool_size": 1,
+        "max_uses_per_driver": 20,
+        "capture_network": False,
+        "profile": "default",
+        "blocked_url_patterns": [],
+        "page_load_stats_file": "page_load_stats.json"
+    },
+    "session": {
+        "enabled": True,
+        "cache_dir": ".linkedin_sessions",
+        "max_age_hours": 72
+    },
+    "pacing": {
+        "profile": "normal",
+        "slow_response_seconds": 8.0,
+        "max_idle_tasks": 20
+    },
+    "sharding": {
+        "enabled": False,
+        "workers": 2,
+        "profile_root": ".chrome_profiles",
+        "keep_profiles": False,
+        "queue_size": 1000,
+        "accounts": []
     }
 }
 
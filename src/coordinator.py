@@ -0,0 +1,172 @@
+# src/coordinator.py
+import os
+import copy
+import shutil
+import queue
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from .config_loader import DEFAULT_CONFIG
+from .seen_jobs import SeenJobsIndex, mark_seen_when_saved, stop_marking_seen
+from .utils.logger_setup import setup_logging
+from .utils.pacing import configure_pacing
+
+
+def shard_queries(queries, workers):
+    """Splits the planned queries round-robin into at most `workers` non-empty shards."""
+    workers = max(1, min(int(workers), len(queries)))
+    return [queries[shard::workers] for shard in range(workers)]
+
+
+def worker_credentials(sharding_config, shard, email, password):
+    """Returns the (email, password) a worker logs in with.
+
+    "accounts" lists {"email_env", "password_env"} pairs naming environment
+    variables; they are handed out round-robin. Without accounts (or if the
+    variables are unset) every worker uses the default credentials.
+    """
+    accounts = sharding_config.get("accounts") or []
+    if not accounts:
+        return email, password
+    account = accounts[shard % len(accounts)]
+    account_email = os.getenv(account.get("email_env", ""))
+    account_password = os.getenv(account.get("password_env", ""))
+    if not account_email or not account_password:
+        logging.warning(f"Credentials for worker {shard} ({account.get('email_env')}) are not set. "
+                        "Using the default account.")
+        return email, password
+    return account_email, account_password
+
+
+def worker_config(config, shard):
+    """Copy of the config for one worker process.
+
+    The worker gets its own Chrome profile root, no shared stats file and a
+    read-only seen index: only the coordinator writes to it (see run_sharded).
+    """
+    sharding_config = config.get("sharding", DEFAULT_CONFIG["sharding"])
+    config = copy.deepcopy(config)
+    driver_config = config.setdefault("driver", copy.deepcopy(DEFAULT_CONFIG["driver"]))
+    driver_config["profile_root"] = os.path.abspath(
+        os.path.join(sharding_config.get("profile_root", ".chrome_profiles"), f"worker-{shard}"))
+    # Each process keeps its own page-load summary; the JSON history file is not safe to share
+    driver_config["page_load_stats_file"] = None
+    dedup_config = config.setdefault("dedup", copy.deepcopy(DEFAULT_CONFIG["dedup"]))
+    dedup_config["read_only"] = True
+    return config
+
+
+# Jobs flow from the workers to the coordinator as (shard, job); (shard, None) ends a shard's stream
+_job_queue = None
+
+
+def _init_worker(job_queue):
+    global _job_queue
+    _job_queue = job_queue
+
+
+def _run_shard(shard, config, email, password, queries):
+    """Worker process entry point: scrapes one shard of queries in its own browser session.
+
+    Each job is sent to the coordinator as soon as it is scraped. Returns the
+    number of jobs sent, or None if the session could not be started.
+    """
+    setup_logging()
+    # Imported here so the coordinating process never loads Selenium for nothing
+    from .runner import scrape_session
+    logging.info(f"Worker {shard}: {len(queries)} queries as {email}")
+    configure_pacing(config.get("pacing", DEFAULT_CONFIG["pacing"]))
+    try:
+        return scrape_session(config, email, password, queries, lambda job: _job_queue.put((shard, job)))
+    finally:
+        _job_queue.put((shard, None))
+        # scrape_session has closed its drivers; their throwaway profiles can go
+        if not config.get("sharding", {}).get("keep_profiles", False):
+            shutil.rmtree(config["driver"]["profile_root"], ignore_errors=True)
+
+
+def _job_key(job):
+    return job.get("job_id") or job.get("url")
+
+
+def merge_worker_jobs(job_queue, futures, save, poll_seconds=1.0):
+    """Passes the jobs streaming in from the workers to save(job) as they arrive, once per job ID.
+
+    futures maps each worker's future to its shard. A shard is finished when
+    its end marker arrives or its worker dies without sending one. Returns
+    (jobs saved, duplicates dropped).
+    """
+    streaming = set(futures.values())
+    emitted, duplicates = set(), 0
+    while streaming:
+        try:
+            shard, job = job_queue.get(timeout=poll_seconds)
+        except queue.Empty:
+            for future, shard in futures.items():
+                if shard in streaming and future.done() and future.exception() is not None:
+                    streaming.discard(shard)  # Killed or crashed: no end marker is coming
+            continue
+        if job is None:
+            streaming.discard(shard)
+            continue
+        key = _job_key(job)
+        if key in emitted:
+            duplicates += 1
+            continue
+        if key:
+            emitted.add(key)
+        save(job)
+    return len(emitted), duplicates
+
+
+def run_sharded(config, email, password, queries, sink):
+    """Runs the queries across "sharding.workers" processes and passes their jobs to sink(job).
+
+    Each worker logs in with its own credentials (see worker_credentials) and a
+    Chrome profile under its own directory. Jobs stream back while the shards
+    run and are deduplicated by job ID, so a worker that dies only loses what
+    it had not sent yet. Workers only read the seen index; this process marks
+    each job seen once sink has saved it, so the index has a single writer.
+    Returns the number of jobs emitted, or None only if every worker failed.
+    """
+    sharding_config = config.get("sharding", DEFAULT_CONFIG["sharding"])
+    shards = shard_queries(queries, sharding_config.get("workers", 2))
+    logging.info(f"Sharding {len(queries)} queries across {len(shards)} worker processes.")
+
+    # Opened before the workers start, so the table exists when they open it read-only
+    seen_index = SeenJobsIndex.from_config(config.get("dedup", DEFAULT_CONFIG["dedup"]))
+    save = sink if seen_index is None else mark_seen_when_saved(sink, seen_index)
+    # "spawn" gives every worker a clean interpreter rather than a fork of this one's threads
+    context = multiprocessing.get_context("spawn")
+    # Bounded, so workers wait for a slow sink instead of piling jobs up in memory
+    job_queue = context.Queue(maxsize=sharding_config.get("queue_size", 1000))
+    try:
+        with ProcessPoolExecutor(max_workers=len(shards), mp_context=context,
+                                 initializer=_init_worker, initargs=(job_queue,)) as executor:
+            futures = {}
+            for shard, assigned in enumerate(shards):
+                shard_email, shard_password = worker_credentials(sharding_config, shard, email, password)
+                future = executor.submit(_run_shard, shard, worker_config(config, shard),
+                                         shard_email, shard_password, assigned)
+                futures[future] = shard
+            emitted, duplicates = merge_worker_jobs(job_queue, futures, save)
+            results = [None] * len(shards)
+            for future, shard in futures.items():
+                try:
+                    results[shard] = future.result()
+                except Exception as e:
+                    logging.error(f"Worker {shard} crashed: {e}")
+                if results[shard] is None:
+                    logging.error(f"Worker {shard} produced no results.")
+                else:
+                    logging.info(f"Worker {shard} finished with {results[shard]} jobs.")
+    finally:
+        if seen_index is not None:
+            stop_marking_seen(sink)
+            seen_index.close()
+
+    if all(result is None for result in results):
+        return None
+    logging.info(f"Merged {emitted} unique jobs from {len(shards)} workers ({duplicates} duplicates dropped).")
+    return emitted
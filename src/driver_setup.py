@@ -1,14 +1,44 @@
 # src/driver_setup.py
+import os
 import logging
 import time
 import random
+import threading
+from contextlib import contextmanager
+from functools import partial
 from selenium import webdriver
 # from selenium.webdriver.chrome.service import Service # Kept commented as in original logic if Selenium 4 manages automatically
 # from webdriver_manager.chrome import ChromeDriverManager # Kept commented
 
+# Driver profiles: "default" is the original visible browser, "lean" is a headless
+# text-only profile that skips images, media, fonts and trackers
+DRIVER_PROFILES = ("default", "lean")
+
+# URL patterns blocked in the lean profile (DevTools Network.setBlockedURLs wildcard syntax)
+LEAN_BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3",
+    "*media.licdn.com/dms/image*",
+    "*doubleclick.net*", "*google-analytics.com*", "*px.ads.linkedin.com*",
+]
+
+
 # Directly copied from the provided code
-def setup_driver():
-    """Sets up the Chrome WebDriver."""
+def setup_driver(capture_network=False, profile="default", blocked_url_patterns=None, profile_root=None):
+    """Sets up the Chrome WebDriver.
+
+    With capture_network=True Chrome's performance log and the DevTools Network
+    domain are enabled so API responses can be read back (see network_capture.py).
+    profile="lean" runs headless with an eager page load strategy and blocks images,
+    media, fonts, trackers and any extra blocked_url_patterns. Chrome's user data
+    directory is created under profile_root (default /tmp), so separate worker
+    processes can keep their browser profiles apart.
+    """
+    if profile not in DRIVER_PROFILES:
+        logging.warning(f"Unknown driver profile '{profile}'. Using 'default'.")
+        profile = "default"
+    lean = profile == "lean"
     logging.info("Setting up Chrome WebDriver...")
     try:
         options = webdriver.ChromeOptions()
@@ -33,12 +63,37 @@ def setup_driver():
         options.add_argument("--window-size=1920,1080")
 
         # Create unique profile directory to avoid conflicts
-        unique_dir = f"/tmp/chrome_profile_{int(time.time())}_{random.randint(1000, 9999)}"
+        profile_root = profile_root or "/tmp"
+        os.makedirs(profile_root, exist_ok=True)
+        unique_dir = os.path.join(profile_root, f"chrome_profile_{int(time.time())}_{random.randint(1000, 9999)}")
         options.add_argument(f"--user-data-dir={unique_dir}")
 
+        if lean:
+            # Text-only rendering: no window, no images, and don't wait for subresources
+            options.add_argument("--headless=new")
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2,
+            })
+            options.page_load_strategy = "eager"
+
+        # Record network events in the performance log for response capture
+        if capture_network:
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
         # Selenium 4+ automatically manages drivers
         driver = webdriver.Chrome(options=options)
 
+        # Kept on the driver so every window opened later gets the same settings (see configure_window)
+        driver.network_enabled = capture_network or lean
+        driver.blocked_url_patterns = LEAN_BLOCKED_URL_PATTERNS + list(blocked_url_patterns or []) if lean else []
+        configure_window(driver)
+        if capture_network:
+            logging.info("Network capture enabled.")
+        if lean:
+            logging.info(f"Lean profile active: blocking {len(driver.blocked_url_patterns)} URL patterns.")
+
         # Further anti-detection with JavaScript execution
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
 
@@ -46,4 +101,194 @@ def setup_driver():
         return driver
     except Exception as e:
         logging.error(f"Error setting up WebDriver: {e}")
-        return None
\ No newline at end of file
+        return None
+
+
+def configure_window(driver):
+    """Applies the driver's DevTools network settings (Network.enable, blocked URLs) to its current window.
+
+    CDP commands only reach the current window's target, so every new tab or
+    window needs this once; setup_driver does it for the first window.
+    """
+    if getattr(driver, "network_enabled", False):
+        driver.execute_cdp_cmd("Network.enable", {})
+    patterns = getattr(driver, "blocked_url_patterns", None)
+    if patterns:
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+
+def _is_driver_alive(driver):
+    """Returns True if the WebDriver session still responds to commands."""
+    try:
+        driver.execute_script("return 1")
+        return True
+    except Exception as e:
+        logging.warning(f"WebDriver health check failed: {e}")
+        return False
+
+
+def _reset_driver(driver):
+    """Closes extra windows and leaves the driver on a single blank tab."""
+    try:
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        configure_window(driver)  # The window kept may have been opened after setup_driver
+        driver.get("about:blank")
+        return True
+    except Exception as e:
+        logging.warning(f"Could not reset WebDriver to a blank tab: {e}")
+        return False
+
+
+def _quit_driver(driver):
+    """Quits a driver, ignoring errors from sessions that are already dead."""
+    try:
+        driver.quit()
+    except Exception as e:
+        logging.debug(f"Ignoring error while quitting WebDriver: {e}")
+
+
+class DriverPool:
+    """Keeps a number of Chrome WebDrivers warm and hands them out for reuse.
+
+    Drivers are health-checked and reset to a blank tab when they are returned,
+    and recycled after ``max_uses`` checkouts so long batch runs don't keep a
+    single browser process alive forever.
+    """
+
+    def __init__(self, size=1, max_uses=20, driver_factory=None):
+        self.size = max(1, int(size))
+        self.max_uses = max(1, int(max_uses))
+        self.driver_factory = driver_factory or setup_driver
+        self._idle = []
+        self._uses = {}  # id(driver) -> number of checkouts so far
+        self._checked_out = 0
+        self._lock = threading.Condition()
+        self._closed = False
+
+    @classmethod
+    def from_config(cls, driver_config, driver_factory=None):
+        """Builds a pool from the "driver" section of the configuration."""
+        driver_config = driver_config or {}
+        if driver_factory is None:
+            driver_factory = partial(setup_driver,
+                                     capture_network=driver_config.get("capture_network", False),
+                                     profile=driver_config.get("profile", "default"),
+                                     blocked_url_patterns=driver_config.get("blocked_url_patterns"),
+                                     profile_root=driver_config.get("profile_root"))
+        return cls(size=driver_config.get("pool_size", 1),
+                   max_uses=driver_config.get("max_uses_per_driver", 20),
+                   driver_factory=driver_factory)
+
+    def warm_up(self):
+        """Starts drivers until the pool holds ``size`` instances."""
+        with self._lock:
+            missing = self.size - len(self._idle) - self._checked_out
+        started = 0
+        for _ in range(max(0, missing)):
+            driver = self._start_driver()
+            if not driver:
+                break
+            with self._lock:
+                self._idle.append(driver)
+                self._lock.notify()
+            started += 1
+        logging.info(f"Driver pool warmed up: {started} new, {len(self._idle)} idle.")
+        return started
+
+    def acquire(self, timeout=None):
+        """Hands out a healthy driver, starting one if the pool has spare capacity.
+
+        Returns None if no driver could be started or the timeout expired.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                if self._closed:
+                    logging.error("Driver pool is closed.")
+                    return None
+                if self._idle:
+                    driver = self._idle.pop()
+                elif self._checked_out < self.size:
+                    driver = None
+                else:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        logging.error("Timed out waiting for a free WebDriver from the pool.")
+                        return None
+                    self._lock.wait(remaining)
+                    continue
+                self._checked_out += 1
+
+            if driver is not None and not _is_driver_alive(driver):
+                self._discard(driver)
+                driver = None
+            if driver is None:
+                driver = self._start_driver()
+            if driver is None:
+                with self._lock:
+                    self._checked_out -= 1
+                    self._lock.notify()
+                return None
+
+            with self._lock:
+                self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+            return driver
+
+    def release(self, driver):
+        """Takes a driver back, recycling it if it is unhealthy or worn out."""
+        if driver is None:
+            return
+        with self._lock:
+            self._checked_out = max(0, self._checked_out - 1)
+            worn_out = self._uses.get(id(driver), 0) >= self.max_uses
+            closed = self._closed
+
+        if closed or worn_out or not _is_driver_alive(driver) or not _reset_driver(driver):
+            if worn_out:
+                logging.info(f"Recycling WebDriver after {self.max_uses} uses.")
+            self._discard(driver)
+        else:
+            with self._lock:
+                self._idle.append(driver)
+        with self._lock:
+            self._lock.notify()
+
+    def spare(self):
+        """Number of drivers that can still be checked out without waiting for a release."""
+        with self._lock:
+            return max(0, self.size - self._checked_out)
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """Context manager that acquires a driver and always releases it."""
+        driver = self.acquire(timeout=timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self):
+        """Quits every idle driver; drivers released later are quit as well."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._lock.notify_all()
+        for driver in idle:
+            self._discard(driver)
+        logging.info("Driver pool closed.")
+
+    def _start_driver(self):
+        driver = self.driver_factory()
+        if driver:
+            with self._lock:
+                self._uses[id(driver)] = 0
+        return driver
+
+    def _discard(self, driver):
+        with self._lock:
+            self._uses.pop(id(driver), None)
+        _quit_driver(driver)
@@ -0,0 +1,126 @@
+# src/http_fetcher.py
+import logging
+
+import urllib3
+
+try:
+    import lxml.html
+    from cssselect import SelectorError
+except ImportError:  # Optional: without lxml/cssselect the browser does all detail fetching
+    lxml = None
+
+from .linkedin_actions.scrape import parse_job_id, merge_card_data
+from .linkedin_actions.selectors import JOB_DETAIL_FIELD_SELECTORS, JOB_DETAIL_FIELD_DEFAULTS, EASY_APPLY_SELECTORS
+from .utils.pacing import get_pacer
+
+LINKEDIN_BASE_URL = "https://www.linkedin.com"
+JOB_VIEW_PATH = "/jobs/view/{job_id}/"
+
+
+def _select(doc, selector):
+    """Runs one CSS selector, treating selectors lxml can't compile as no match."""
+    try:
+        return doc.cssselect(selector)
+    except SelectorError:
+        return []
+
+
+def parse_job_html(html, url=None):
+    """Parses a job page with the same selector lists the browser scraper uses.
+
+    Returns a job dict, or None when the page has no recognizable job title
+    (login wall, captcha, layout change), so the caller can fall back to the browser.
+    """
+    if lxml is None:
+        raise RuntimeError("lxml and cssselect are required to parse job pages without a browser")
+    doc = lxml.html.fromstring(html)
+
+    fields = {}
+    for name, selectors in JOB_DETAIL_FIELD_SELECTORS.items():
+        for selector in selectors:
+            nodes = _select(doc, selector)
+            text = nodes[0].text_content().strip() if nodes else ""
+            if text:
+                fields[name] = " ".join(text.split()) if name != "description" else text
+                break
+    if "title" not in fields:
+        return None
+
+    job_info = {name: fields.get(name) or default for name, default in JOB_DETAIL_FIELD_DEFAULTS.items()}
+    job_info["url"] = url
+    job_info["job_id"] = parse_job_id(url)
+    job_info["easy_apply"] = any(_select(doc, selector) for selector in EASY_APPLY_SELECTORS)
+    return job_info
+
+
+class HttpJobFetcher:
+    """Downloads job pages over a keep-alive connection pool using the browser's session cookies."""
+
+    def __init__(self, cookies, user_agent=None, base_url=LINKEDIN_BASE_URL, pool_size=4, timeout=15):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.headers = {
+            "accept": "text/html,application/xhtml+xml",
+            "accept-language": "en-US,en;q=0.9",
+            "cookie": "; ".join(f"{c['name']}={c['value']}" for c in cookies),
+        }
+        if user_agent:
+            self.headers["user-agent"] = user_agent
+        self.http = urllib3.PoolManager(
+            maxsize=pool_size, block=True, retries=urllib3.Retry(total=2, backoff_factor=0.5, redirect=False))
+
+    @classmethod
+    def from_driver(cls, driver, http_config=None):
+        """Builds a fetcher from the WebDriver's authenticated cookies, or None if it can't be used."""
+        if lxml is None:
+            logging.warning("lxml/cssselect not installed. HTTP detail fetching disabled.")
+            return None
+        http_config = http_config or {}
+        try:
+            cookies = [c for c in driver.get_cookies() if "linkedin.com" in c.get("domain", "")]
+            user_agent = driver.execute_script("return navigator.userAgent")
+        except Exception as e:
+            logging.warning(f"Could not export cookies from WebDriver: {e}")
+            return None
+        logging.info(f"HTTP detail fetcher using {len(cookies)} cookies from the WebDriver session.")
+        return cls(cookies, user_agent,
+                   base_url=http_config.get("base_url", LINKEDIN_BASE_URL),
+                   pool_size=http_config.get("pool_size", 4),
+                   timeout=http_config.get("timeout", 15))
+
+    def job_url(self, job_id):
+        return self.base_url + JOB_VIEW_PATH.format(job_id=job_id)
+
+    def fetch_html(self, job_id):
+        """Returns the job page HTML, or None on any non-200 response (redirects mean the session was refused)."""
+        url = self.job_url(job_id)
+        pacer = get_pacer()
+        pacer.wait("page_load")
+        try:
+            response = self.http.request("GET", url, headers=self.headers, timeout=self.timeout, redirect=False)
+        except Exception as e:
+            logging.warning(f"HTTP fetch failed for job {job_id}: {e}")
+            return None
+        if response.status != 200:
+            logging.warning(f"HTTP fetch for job {job_id} returned {response.status}")
+            if response.status in (429, 999):
+                pacer.observe("throttled")
+            else:
+                pacer.observe_url(response.headers.get("Location"))
+            return None
+        return response.data.decode("utf-8", errors="replace")
+
+    def fetch(self, card):
+        """Fetches and parses one job; returns None so the caller can fall back to the browser."""
+        html = self.fetch_html(card["job_id"])
+        if html is None:
+            return None
+        job_info = parse_job_html(html, self.job_url(card["job_id"]))
+        if job_info is None:
+            logging.info(f"Could not parse job {card['job_id']} from HTML. Falling back to the browser.")
+            return None
+        job_info["job_id"] = job_info["job_id"] or card["job_id"]
+        return merge_card_data(job_info, card)
+
+    def close(self):
+        self.http.clear()
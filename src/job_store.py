@@ -0,0 +1,318 @@
+# src/job_store.py
+import os
+import sys
+import json
+import sqlite3
+import logging
+import argparse
+import threading
+from datetime import datetime, timedelta
+
+from .linkedin_actions.predicates import parse_posted_age_days
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS companies (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS locations (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    title TEXT,
+    company_id INTEGER REFERENCES companies(id),
+    location_id INTEGER REFERENCES locations(id),
+    description TEXT,
+    url TEXT,
+    easy_apply INTEGER,
+    date_posted TEXT,
+    posted_date TEXT,
+    search_query TEXT,
+    first_scraped_at TEXT NOT NULL,
+    scraped_at TEXT NOT NULL,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_company ON jobs(company_id);
+CREATE INDEX IF NOT EXISTS jobs_location ON jobs(location_id);
+CREATE INDEX IF NOT EXISTS jobs_posted_date ON jobs(posted_date);
+
+CREATE TABLE IF NOT EXISTS import_progress (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    done INTEGER NOT NULL
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, description, content='jobs', content_rowid='rowid'
+);
+CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts(rowid, title, description) VALUES (new.rowid, new.title, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, description) VALUES ('delete', old.rowid, old.title, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, description) VALUES ('delete', old.rowid, old.title, old.description);
+    INSERT INTO jobs_fts(rowid, title, description) VALUES (new.rowid, new.title, new.description);
+END;
+"""
+
+# Job fields stored in their own columns; anything else is kept as JSON in "extra"
+_COLUMNS = ("job_id", "title", "company", "location", "description", "url", "easy_apply",
+            "date_posted", "posted_on", "search_query", "scraped_at")
+
+_UPSERT_SQL = """
+INSERT INTO jobs (job_id, title, company_id, location_id, description, url, easy_apply,
+                  date_posted, posted_date, search_query, first_scraped_at, scraped_at, extra)
+VALUES (:job_id, :title, :company_id, :location_id, :description, :url, :easy_apply,
+        :date_posted, :posted_date, :search_query, :scraped_at, :scraped_at, :extra)
+ON CONFLICT(job_id) DO UPDATE SET
+    title = excluded.title,
+    company_id = excluded.company_id,
+    location_id = excluded.location_id,
+    description = COALESCE(excluded.description, jobs.description),
+    url = excluded.url,
+    easy_apply = excluded.easy_apply,
+    date_posted = excluded.date_posted,
+    posted_date = COALESCE(excluded.posted_date, jobs.posted_date),
+    search_query = COALESCE(excluded.search_query, jobs.search_query),
+    scraped_at = excluded.scraped_at,
+    extra = excluded.extra
+WHERE excluded.scraped_at >= jobs.scraped_at
+"""
+
+# For lossy copies (see src/compaction.py): only adds jobs the store doesn't have yet
+_INSERT_NEW_SQL = _UPSERT_SQL[:_UPSERT_SQL.index("ON CONFLICT")] + "ON CONFLICT(job_id) DO NOTHING"
+
+_SELECT_SQL = """
+SELECT j.job_id, j.title, c.name AS company, l.name AS location, j.url, j.easy_apply,
+       j.date_posted, j.posted_date, j.search_query, j.first_scraped_at, j.scraped_at
+FROM jobs j
+LEFT JOIN companies c ON c.id = j.company_id
+LEFT JOIN locations l ON l.id = j.location_id
+"""
+
+
+def job_key(job):
+    """The store's primary key for a job: its LinkedIn ID, else its URL."""
+    return str(job.get("job_id") or job.get("url") or "") or None
+
+
+def posted_date(job):
+    """Best-effort calendar date (YYYY-MM-DD) the job was posted, or None."""
+    if job.get("posted_on"):
+        return str(job["posted_on"])[:10]
+    age_days = parse_posted_age_days(job.get("date_posted"))
+    if age_days is None:
+        return None
+    try:
+        scraped_at = datetime.strptime(job.get("scraped_at", ""), "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        scraped_at = datetime.now()
+    return (scraped_at - timedelta(days=age_days)).strftime("%Y-%m-%d")
+
+
+def fts_query(text):
+    """Turns plain search terms into an FTS5 query matching all of them.
+
+    Every whitespace-separated term becomes a quoted phrase, so input such as
+    "C++" or "Python + Kubernetes" can't be read as FTS5 operators.
+    """
+    return " ".join('"' + term.replace('"', '""') + '"' for term in text.split())
+
+
+class JobStore:
+    """SQLite store of scraped jobs keyed by job ID, with full-text search over title and description.
+
+    Companies and locations are normalized into their own tables. Upserting a
+    job that is already stored keeps its first_scraped_at and only replaces it
+    with a copy scraped at the same time or later. Safe to share between threads.
+    """
+
+    def __init__(self, db_path="linkedin_jobs.sqlite3"):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+        self._names = {"companies": {}, "locations": {}}  # table -> name -> id
+
+    @classmethod
+    def from_config(cls, output_config):
+        """Opens the store described by the "output" config section (its "sqlite" sub-section)."""
+        sqlite_config = (output_config or {}).get("sqlite", {})
+        return cls(sqlite_config.get("db_path", "linkedin_jobs.sqlite3"))
+
+    def _name_id(self, table, name):
+        if not name:
+            return None
+        cache = self._names[table]
+        if name not in cache:
+            self.conn.execute(f"INSERT OR IGNORE INTO {table} (name) VALUES (?)", (name,))
+            cache[name] = self.conn.execute(f"SELECT id FROM {table} WHERE name = ?", (name,)).fetchone()[0]
+        return cache[name]
+
+    def _row(self, job):
+        extra = {key: value for key, value in job.items() if key not in _COLUMNS}
+        return {
+            "job_id": job_key(job),
+            "title": job.get("title"),
+            "company_id": self._name_id("companies", job.get("company")),
+            "location_id": self._name_id("locations", job.get("location")),
+            "description": job.get("description"),
+            "url": job.get("url"),
+            "easy_apply": None if job.get("easy_apply") is None else int(bool(job["easy_apply"])),
+            "date_posted": job.get("date_posted"),
+            "posted_date": posted_date(job),
+            "search_query": job.get("search_query"),
+            "scraped_at": job.get("scraped_at") or datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "extra": json.dumps(extra, ensure_ascii=False) if extra else None,
+        }
+
+    def upsert_many(self, jobs, overwrite=True):
+        """Inserts or updates jobs in one transaction; returns how many had a usable key.
+
+        With overwrite=False jobs that are already stored are left untouched.
+        """
+        sql = _UPSERT_SQL if overwrite else _INSERT_NEW_SQL
+        stored = 0
+        with self._lock:
+            try:
+                with self.conn:
+                    for job in jobs:
+                        if not job_key(job):
+                            logging.debug(f"Skipping job without ID or URL: {job.get('title')}")
+                            continue
+                        self.conn.execute(sql, self._row(job))
+                        stored += 1
+            except Exception:
+                self._names = {"companies": {}, "locations": {}}  # Cached IDs may have been rolled back
+                raise
+        return stored
+
+    def upsert(self, job):
+        return self.upsert_many([job]) == 1
+
+    # Output writer interface (see output_handler.OUTPUT_WRITERS)
+    def write(self, job):
+        self.upsert(job)
+
+    def write_many(self, jobs):
+        self.upsert_many(jobs)
+
+    def flush(self):
+        """No-op: every upsert_many is its own committed transaction."""
+
+    def search(self, text=None, company=None, location=None, since_days=None, easy_apply=None, limit=50,
+               raw=False):
+        """Finds jobs whose title or description contains every term of text (results ranked by relevance).
+
+        With raw, text is passed through as FTS5 query syntax (AND, OR, NEAR, prefix*, ...).
+        """
+        clauses, params = [], []
+        if text and not raw:
+            text = fts_query(text)
+        if text:
+            clauses.append("jobs_fts MATCH ?")
+            params.append(text)
+        if company:
+            clauses.append("c.name LIKE ?")
+            params.append(f"%{company}%")
+        if location:
+            clauses.append("l.name LIKE ?")
+            params.append(f"%{location}%")
+        if since_days is not None:
+            clauses.append("j.posted_date >= ?")
+            params.append((datetime.now() - timedelta(days=since_days)).strftime("%Y-%m-%d"))
+        if easy_apply is not None:
+            clauses.append("j.easy_apply = ?")
+            params.append(int(easy_apply))
+        sql = _SELECT_SQL
+        if text:
+            sql += "JOIN jobs_fts ON jobs_fts.rowid = j.rowid\n"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        if text:
+            sql += " ORDER BY bm25(jobs_fts)"
+        else:
+            sql += " ORDER BY j.posted_date DESC, j.scraped_at DESC"
+        sql += " LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def load_progress(self, path):
+        """Returns the import checkpoint for a source file as a dict, or None."""
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM import_progress WHERE path = ?", (path,)).fetchone()
+        return dict(row) if row else None
+
+    def save_progress(self, path, size, mtime_ns, offset, done=False):
+        """Records how far a source file has been imported (see src/compaction.py)."""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO import_progress (path, size, mtime_ns, offset, done) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(path) DO UPDATE SET size = excluded.size, mtime_ns = excluded.mtime_ns, "
+                "offset = excluded.offset, done = excluded.done",
+                (path, size, mtime_ns, offset, int(done)),
+            )
+
+    def count(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def main(argv=None):
+    """Query CLI: python -m src.job_store "python kubernetes" --location Bengaluru --days 7"""
+    parser = argparse.ArgumentParser(description="Search the SQLite job store.")
+    parser.add_argument("text", nargs="?", help="Terms that must all appear in the title or description")
+    parser.add_argument("--raw", action="store_true", help="Treat text as an FTS5 query (AND, OR, NEAR, prefix*)")
+    parser.add_argument("--db", default="linkedin_jobs.sqlite3", help="Path to the job store")
+    parser.add_argument("--company", help="Company name contains")
+    parser.add_argument("--location", help="Location contains")
+    parser.add_argument("--days", type=float, help="Posted within the last N days")
+    parser.add_argument("--easy-apply", action="store_true", help="Only Easy Apply jobs")
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON lines")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.db):
+        print(f"No job store at {args.db}", file=sys.stderr)
+        return 1
+    with JobStore(args.db) as store:
+        try:
+            rows = store.search(args.text, company=args.company, location=args.location, since_days=args.days,
+                                easy_apply=True if args.easy_apply else None, limit=args.limit, raw=args.raw)
+        except sqlite3.OperationalError as e:
+            print(f"Invalid query: {e}", file=sys.stderr)
+            return 2
+        for row in rows:
+            if args.json:
+                print(json.dumps(row, ensure_ascii=False))
+            else:
+                print(f"{row['posted_date'] or '????-??-??'}  {row['title']} | {row['company']} | "
+                      f"{row['location']} | {row['url']}")
+        print(f"{len(rows)} of {store.count()} stored jobs matched.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
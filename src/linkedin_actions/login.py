@@ -8,6 +8,7 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 # Import helper from the utils directory
 from ..utils.helpers import human_delay
+from ..utils.pacing import get_pacer
 
 # Define URL here or pass as argument, keeping it local for now
 LINKEDIN_LOGIN_URL = "https://www.linkedin.com/login"
@@ -71,6 +72,7 @@ def login_to_linkedin(driver, email, password):
             logging.info("Login Successful! Redirected to the feed.")
             return True
         elif "checkpoint" in current_url or "challenge" in current_url:
+            get_pacer().observe("checkpoint")
             logging.warning(
                 "Login Alert: LinkedIn is asking for a security check (CAPTCHA, phone verification, etc.).")
             logging.info("Please complete the verification in the browser window...")
@@ -7,6 +7,7 @@ from selenium.common.exceptions import TimeoutException
 
 # Import helper from the utils directory
 from ..utils.helpers import human_delay
+from ..utils.pacing import get_pacer
 
 # Define URL here or pass as argument
 LINKEDIN_JOBS_URL = "https://www.linkedin.com/jobs/"
@@ -16,6 +17,7 @@ def navigate_to_jobs_page(driver):
     """Navigates to the LinkedIn Jobs page."""
     logging.info("Navigating to the Jobs page...")
     try:
+        get_pacer().wait("page_load")
         driver.get(LINKEDIN_JOBS_URL)
         # Wait for jobs page to load - looking for the search boxes (using original selector)
         WebDriverWait(driver, 15).until(
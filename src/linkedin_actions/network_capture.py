@@ -0,0 +1,212 @@
+# src/linkedin_actions/network_capture.py
+import json
+import time
+import logging
+from datetime import datetime
+
+from ..utils.helpers import human_delay
+from ..utils.waits import wait_for_any
+from .predicates import rejection_reason
+from .scrape import LINKEDIN_JOB_VIEW_URL, JOB_LIST_SELECTORS, load_all_cards, click_job_card, go_to_page
+
+# Path fragments of the XHR endpoints that carry job list cards and job postings
+JOB_API_PATTERNS = [
+    "/voyager/api/voyagerJobsDashJobCards",
+    "/voyager/api/jobs/jobPostings",
+    "/voyager/api/jobs/search",
+    "/voyager/api/graphql",
+]
+
+
+def _is_job_api(url):
+    return any(pattern in url for pattern in JOB_API_PATTERNS)
+
+
+def _urn_id(urn):
+    """"urn:li:fsd_jobPosting:123" -> "123"."""
+    return urn.rsplit(":", 1)[-1] if isinstance(urn, str) and ":" in urn else None
+
+
+def _text(value):
+    """LinkedIn wraps most strings as {"text": ...}."""
+    if isinstance(value, dict):
+        return value.get("text")
+    return value if isinstance(value, str) else None
+
+
+def drain_job_responses(driver):
+    """Reads the performance log and returns the JSON bodies of captured job API responses.
+
+    Each call consumes the log, so every response is returned once.
+    """
+    payloads = []
+    try:
+        entries = driver.get_log("performance")
+    except Exception as e:
+        logging.warning(f"Could not read performance log (was capture_network enabled?): {e}")
+        return payloads
+
+    for entry in entries:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, ValueError):
+            continue
+        if message.get("method") != "Network.responseReceived":
+            continue
+        response = message["params"]["response"]
+        if not _is_job_api(response.get("url", "")) or "json" not in response.get("mimeType", ""):
+            continue
+        try:
+            body = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": message["params"]["requestId"]})
+            payloads.append(json.loads(body.get("body") or "null"))
+        except Exception as e:
+            # The body may already be evicted from Chrome's buffer; the next drain can pick it up again
+            logging.debug(f"Could not read response body for {response.get('url')}: {e}")
+    return payloads
+
+
+def _walk_entities(payload):
+    """Yields every dict in a (normalized) Voyager response that declares a $type."""
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if "$type" in node:
+                yield node
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+
+
+def records_from_payload(payload):
+    """Turns one job API response into {job_id: partial job record}.
+
+    Handles job list cards (JobPostingCard) and job postings (JobPosting);
+    company names referenced by URN are resolved from the same response.
+    """
+    entities = list(_walk_entities(payload))
+    companies = {e.get("entityUrn"): e.get("name") for e in entities
+                 if e.get("$type", "").endswith("Company") and e.get("name")}
+    records = {}
+
+    for entity in entities:
+        entity_type = entity.get("$type", "")
+        if entity_type.endswith("JobPostingCard"):
+            job_id = _urn_id(entity.get("jobPostingUrn") or entity.get("*jobPosting") or entity.get("entityUrn"))
+            if not job_id:
+                continue
+            # Card data only fills gaps; the full posting is authoritative
+            record = records.setdefault(job_id, {"job_id": job_id})
+            record.setdefault("title", _text(entity.get("jobPostingTitle")) or _text(entity.get("title")))
+            record.setdefault("company", _text(entity.get("primaryDescription")))
+            record.setdefault("location", _text(entity.get("secondaryDescription")))
+            footer_items = entity.get("footerItems") or []
+            for item in footer_items:
+                if item.get("type") == "EASY_APPLY_TEXT":
+                    record["easy_apply"] = True
+                elif item.get("type") == "LISTED_DATE" and item.get("timeAt"):
+                    record.setdefault("posted_on", datetime.fromtimestamp(item["timeAt"] / 1000).isoformat())
+            if footer_items:
+                record.setdefault("easy_apply", False)  # Without footer items the card can't tell
+
+        elif entity_type.endswith("JobPosting"):
+            job_id = _urn_id(entity.get("entityUrn")) or str(entity.get("jobPostingId") or "") or None
+            if not job_id:
+                continue
+            record = records.setdefault(job_id, {"job_id": job_id})
+            record["title"] = entity.get("title") or record.get("title")
+            record["description"] = _text(entity.get("description")) or record.get("description")
+            record["location"] = entity.get("formattedLocation") or record.get("location")
+            company_urn = entity.get("*company") or entity.get("companyUrn")
+            record["company"] = companies.get(company_urn) or entity.get("companyName") or record.get("company")
+            if entity.get("listedAt"):
+                record["posted_on"] = datetime.fromtimestamp(entity["listedAt"] / 1000).isoformat()
+            # Easy Apply postings use an OnsiteApply method (Simple/Complex); external ones use OffsiteApply
+            apply_method = entity.get("applyMethod") or {}
+            if isinstance(apply_method, dict) and apply_method:
+                record["easy_apply"] = any("OnsiteApply" in key for key in apply_method) or \
+                    "OnsiteApply" in str(apply_method.get("$type", ""))
+
+    for record in records.values():
+        for key in [key for key, value in record.items() if value is None]:
+            del record[key]
+    return records
+
+
+def collect_captured_records(driver, records=None):
+    """Drains the performance log and merges every captured job into `records` (job_id -> dict)."""
+    records = {} if records is None else records
+    for payload in drain_job_responses(driver):
+        for job_id, record in records_from_payload(payload).items():
+            records.setdefault(job_id, {}).update(record)
+    return records
+
+
+def _finish_record(record):
+    record.setdefault("title", "Unknown Title")
+    record.setdefault("company", "Unknown Company")
+    record.setdefault("location", "Unknown Location")
+    record.setdefault("date_posted", record.get("posted_on", "Unknown"))
+    record["url"] = LINKEDIN_JOB_VIEW_URL.format(job_id=record["job_id"])
+    record["scraped_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return record
+
+
+def iter_captured_jobs(driver, max_pages=3, easy_apply_only=True, with_descriptions=True, job_filters=None,
+                       seen_index=None, detail_timeout=10):
+    """Scrapes jobs from the JSON the page itself downloads instead of from the rendered DOM.
+
+    The driver must have been created with capture_network=True. List cards come
+    from the responses triggered by loading and scrolling each results page; with
+    with_descriptions, each card is clicked only to trigger its posting request and
+    the description is read from that response. Jobs already in seen_index are
+    skipped; marking new ones as seen is left to the caller, once they are saved.
+    """
+    criteria = dict(job_filters or {})
+    criteria.setdefault("easy_apply_only", easy_apply_only)
+
+    for page_number in range(1, max_pages + 1):
+        if page_number > 1 and not go_to_page(driver, page_number):
+            break
+        if not wait_for_any(driver, JOB_LIST_SELECTORS, timeout=15)[0]:
+            logging.error("Timed out waiting for the job list container.")
+            break
+
+        # Scrolling the list makes the page request the remaining cards
+        page_ids = load_all_cards(driver)
+        records = collect_captured_records(driver)
+        order = page_ids or list(records)
+        logging.info(f"Page {page_number}: captured {len(records)} job records for {len(order)} cards.")
+        if not order:
+            break
+
+        for index, job_id in enumerate(order):
+            record = records.get(job_id, {"job_id": job_id})
+            if seen_index is not None and job_id in seen_index:
+                continue
+            reason = rejection_reason(record, criteria)
+            if reason:
+                logging.info(f"Job {index + 1}: Skipping, {reason}")
+                continue
+
+            if with_descriptions and "description" not in record:
+                if click_job_card(driver, job_id):
+                    deadline = time.monotonic() + detail_timeout
+                    while "description" not in record and time.monotonic() < deadline:
+                        time.sleep(0.25)
+                        collect_captured_records(driver, records)
+                        record = records.get(job_id, record)
+                if "description" not in record:
+                    logging.warning(f"No posting response captured for job {job_id}")
+                reason = rejection_reason(record, criteria)
+                if reason:
+                    logging.info(f"Job {index + 1}: Skipping, {reason}")
+                    continue
+                human_delay(1.0, 2.0) # Pacing between card clicks
+
+            job_info = _finish_record(dict(record))
+            logging.info(f"Job {index + 1}: Captured {job_info['title']} at {job_info['company']}")
+            yield job_info
+
+        # Consume what this page still has in the log so the next page starts from its own responses
+        collect_captured_records(driver, records)
@@ -0,0 +1,81 @@
+# src/linkedin_actions/predicates.py
+import re
+import logging
+from datetime import datetime
+
+from .selectors import JOB_DETAIL_FIELD_DEFAULTS
+
+# "3 days ago", "Reposted 1 week ago", "30+ days ago", "2 hours ago"
+_AGE_PATTERN = re.compile(r"(\d+)\+?\s*(minute|hour|day|week|month|year)s?\s+ago", re.IGNORECASE)
+_AGE_UNIT_DAYS = {
+    "minute": 1 / 1440,
+    "hour": 1 / 24,
+    "day": 1,
+    "week": 7,
+    "month": 30,
+    "year": 365,
+}
+
+
+def _known(value):
+    """Treats missing values and the scraper's placeholder defaults as unknown."""
+    return bool(value) and value not in JOB_DETAIL_FIELD_DEFAULTS.values()
+
+
+def parse_posted_age_days(date_posted=None, posted_on=None):
+    """Returns how many days ago a job was posted, or None if it can't be told.
+
+    Uses the card's ISO date (posted_on) when available, otherwise the relative text.
+    """
+    if posted_on:
+        try:
+            return max(0.0, (datetime.now() - datetime.fromisoformat(posted_on)).total_seconds() / 86400)
+        except ValueError:
+            logging.debug(f"Unrecognized posted_on date: {posted_on}")
+    if not date_posted:
+        return None
+    text = date_posted.lower()
+    if "just now" in text or "moments ago" in text:
+        return 0.0
+    match = _AGE_PATTERN.search(text)
+    if not match:
+        return None
+    return int(match.group(1)) * _AGE_UNIT_DAYS[match.group(2).lower()]
+
+
+def rejection_reason(job, criteria):
+    """Checks a card or job dict against the job filters and returns why it is rejected, or None.
+
+    Fields the dict doesn't know yet are never held against it, so the same
+    criteria can run on list-card data first and on the full details later.
+    """
+    if not criteria:
+        return None
+
+    if criteria.get("easy_apply_only") and job.get("easy_apply") is False:
+        return "not Easy Apply"
+
+    title = job.get("title")
+    if _known(title):
+        title_lower = title.lower()
+        include = [keyword.lower() for keyword in criteria.get("title_include") or []]
+        if include and not any(keyword in title_lower for keyword in include):
+            return f"title '{title}' has none of the required keywords"
+        for keyword in criteria.get("title_exclude") or []:
+            if keyword.lower() in title_lower:
+                return f"title '{title}' contains excluded keyword '{keyword}'"
+
+    company = job.get("company")
+    if _known(company):
+        company_lower = company.lower()
+        for blocked in criteria.get("company_blocklist") or []:
+            if blocked.lower() in company_lower:
+                return f"company '{company}' is blocklisted"
+
+    max_age_days = criteria.get("max_age_days")
+    if max_age_days is not None:
+        age_days = parse_posted_age_days(job.get("date_posted"), job.get("posted_on"))
+        if age_days is not None and age_days > max_age_days:
+            return f"posted {age_days:.0f} days ago (limit {max_age_days})"
+
+    return None
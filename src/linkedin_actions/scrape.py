@@ -1,252 +1,627 @@
 # src/linkedin_actions/scrape.py
+import re
 import logging
-import time
+from collections import deque
 from datetime import datetime
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException, StaleElementReferenceException
 
 # Import helper from the utils directory
+from ..driver_setup import configure_window
 from ..utils.helpers import human_delay
+from ..utils.waits import wait_for_any
+from ..utils.page_load_stats import record_page_load
+from ..utils.pacing import get_pacer
+from .predicates import rejection_reason
+from .selectors import (
+    JOB_LIST_SELECTORS, JOB_CARD_SELECTORS, JOB_DETAILS_SELECTORS, EASY_APPLY_SELECTORS,
+    JOB_DETAIL_FIELD_SELECTORS, JOB_DETAIL_FIELD_DEFAULTS, CARD_FIELD_SELECTORS, CARD_EASY_APPLY_SELECTORS,
+)
 
-# Directly copied from the provided code
-def scrape_jobs_on_page(driver, easy_apply_only=True):
-    """Scrapes job listings from the current page."""
-    # Note: The original code only scrapes the *first page* and has a hardcoded limit.
-    # This function replicates that behavior exactly. Pagination logic was not in the provided scrape function.
-    logging.info("\n--- Starting Job Scraping Process (Page 1) ---") # Original Log Message
-    logging.info("Starting to scrape jobs on the current page...") # Original Log Message
-    job_data = []
+LINKEDIN_JOB_VIEW_URL = "https://www.linkedin.com/jobs/view/{job_id}/"
+
+# Supported scraping.mode values: "details" clicks every card, "list" only reads the result cards
+SCRAPE_MODES = ("details", "list")
+
+# Evaluates every fallback selector for every field inside the page in one round-trip.
+# Returns {"fields": {name: text}, "matched": {name: selector}, "has_easy_apply": bool, "url": str}.
+_EXTRACT_JOB_DETAILS_JS = """
+var fieldSelectors = arguments[0];
+var easyApplySelectors = arguments[1];
+
+function query(selector) {
+    try { return document.querySelectorAll(selector); } catch (e) { return []; }  // Skip invalid CSS
+}
+
+var fields = {}, matched = {};
+for (var name in fieldSelectors) {
+    var selectors = fieldSelectors[name];
+    for (var i = 0; i < selectors.length; i++) {
+        var nodes = query(selectors[i]);
+        if (!nodes.length) { continue; }
+        var text = (nodes[0].innerText || "").trim();
+        if (text) { fields[name] = text; matched[name] = selectors[i]; break; }
+    }
+}
+
+var hasEasyApply = false;
+for (var j = 0; j < easyApplySelectors.length; j++) {
+    if (query(easyApplySelectors[j]).length) { hasEasyApply = true; break; }
+}
+return {fields: fields, matched: matched, has_easy_apply: hasEasyApply, url: window.location.href};
+"""
+
+# Scrolls the (virtualized) results list inside the page until every card has rendered
+# or the count stops changing, then returns the job IDs of all cards in list order.
+# Cards are "li.occludable-update" placeholders that only get content once scrolled into view.
+_LOAD_ALL_CARDS_JS = """
+var listSelectors = arguments[0];
+var budgetMs = arguments[1];
+var stableRounds = arguments[2];
+var done = arguments[arguments.length - 1];
+var started = Date.now();
+
+function first(selectors) {
+    for (var i = 0; i < selectors.length; i++) {
+        try { var el = document.querySelector(selectors[i]); if (el) { return el; } } catch (e) {}
+    }
+    return null;
+}
+
+function scrollerFor(el) {
+    for (var node = el; node && node !== document.body; node = node.parentElement) {
+        var style = window.getComputedStyle(node);
+        if (/(auto|scroll)/.test(style.overflowY) && node.scrollHeight > node.clientHeight) { return node; }
+    }
+    return document.scrollingElement || document.documentElement;
+}
+
+function snapshot() {
+    var ids = [], seen = {}, materialized = 0;
+    var cards = document.querySelectorAll("[data-occludable-job-id], [data-job-id]");
+    for (var i = 0; i < cards.length; i++) {
+        var id = cards[i].getAttribute("data-occludable-job-id") || cards[i].getAttribute("data-job-id");
+        if (!id || seen[id]) { continue; }
+        seen[id] = true;
+        ids.push(id);
+        if ((cards[i].innerText || "").trim()) { materialized++; }
+    }
+    return {ids: ids, materialized: materialized};
+}
+
+var list = first(listSelectors);
+if (!list) { done({ids: [], total: 0, materialized: 0, complete: false}); return; }
+var scroller = scrollerFor(list);
+var lastCount = -1, stable = 0;
+
+(function step() {
+    var snap = snapshot();
+    var atBottom = scroller.scrollTop + scroller.clientHeight >= scroller.scrollHeight - 2;
+    stable = (snap.materialized === lastCount) ? stable + 1 : 0;
+    lastCount = snap.materialized;
+    var complete = atBottom && snap.ids.length > 0 && snap.materialized >= snap.ids.length;
+    if (complete || (atBottom && stable >= stableRounds) || Date.now() - started > budgetMs) {
+        scroller.scrollTop = 0;
+        done({ids: snap.ids, total: snap.ids.length, materialized: snap.materialized, complete: complete});
+        return;
+    }
+    scroller.scrollTop += Math.max(200, Math.floor(scroller.clientHeight * 0.8));
+    setTimeout(step, 150);
+})();
+"""
+
+# Scrolls a job card into view and clicks it in one call; returns false if the card is gone
+_CLICK_CARD_JS = """
+var jobId = arguments[0];
+var card = document.querySelector("[data-occludable-job-id='" + jobId + "'], [data-job-id='" + jobId + "']");
+if (!card) { return false; }
+card.scrollIntoView({block: "center"});
+var target = card.querySelector("a[href*='/jobs/view/'], .job-card-container--clickable, [data-job-id]") || card;
+target.click();
+return true;
+"""
+
+# Reads the metadata of every rendered result card in one call, in list order
+_HARVEST_CARDS_JS = """
+var fieldSelectors = arguments[0];
+var easyApplySelectors = arguments[1];
+
+function query(root, selector) {
+    try { return root.querySelectorAll(selector); } catch (e) { return []; }
+}
+
+function firstText(root, selectors) {
+    for (var i = 0; i < selectors.length; i++) {
+        var nodes = query(root, selectors[i]);
+        for (var j = 0; j < nodes.length; j++) {
+            var text = (nodes[j].innerText || "").trim().split("\\n")[0].trim();
+            if (text) { return text; }
+        }
+    }
+    return null;
+}
+
+var cards = [], seen = {};
+var nodes = document.querySelectorAll("[data-occludable-job-id], [data-job-id]");
+for (var i = 0; i < nodes.length; i++) {
+    var card = nodes[i];
+    var id = card.getAttribute("data-occludable-job-id") || card.getAttribute("data-job-id");
+    if (!id || seen[id]) { continue; }
+    seen[id] = true;
+    var record = {job_id: id};
+    for (var name in fieldSelectors) { record[name] = firstText(card, fieldSelectors[name]); }
+    var time = card.querySelector("time[datetime]");
+    record.posted_on = time ? time.getAttribute("datetime") : null;
+    // null = no footer selector matched, so the card can't tell; the details pane decides later
+    record.easy_apply = null;
+    for (var k = 0; k < easyApplySelectors.length && !record.easy_apply; k++) {
+        var items = query(card, easyApplySelectors[k]);
+        for (var m = 0; m < items.length; m++) {
+            record.easy_apply = (items[m].innerText || "").indexOf("Easy Apply") !== -1;
+            if (record.easy_apply) { break; }
+        }
+    }
+    cards.push(record);
+}
+return cards;
+"""
+
+# LinkedIn shows 25 results per page and pages via the "start" offset
+RESULTS_PER_PAGE = 25
+
+_JOB_ID_PATTERNS = [
+    re.compile(r"[?&]currentJobId=(\d+)"),
+    re.compile(r"/jobs/view/(\d+)"),
+]
+
+
+def parse_job_id(url):
+    """Pulls the LinkedIn job ID out of a search or job view URL, or returns None."""
+    for pattern in _JOB_ID_PATTERNS:
+        match = pattern.search(url or "")
+        if match:
+            return match.group(1)
+    return None
+
+
+def extract_job_details(driver):
+    """Extracts all job detail fields with a single execute_script call.
+
+    Returns a job dict with the original field names and defaults, plus
+    "easy_apply" and "matched_selectors" (field -> selector that produced it).
+    """
+    result = driver.execute_script(_EXTRACT_JOB_DETAILS_JS, JOB_DETAIL_FIELD_SELECTORS, EASY_APPLY_SELECTORS) or {}
+    fields = result.get("fields") or {}
 
+    job_info = {}
+    for name, default in JOB_DETAIL_FIELD_DEFAULTS.items():
+        job_info[name] = fields.get(name) or default
+    job_info["url"] = result.get("url") or driver.current_url
+    job_info["job_id"] = parse_job_id(job_info["url"])
+    job_info["easy_apply"] = bool(result.get("has_easy_apply"))
+    job_info["matched_selectors"] = result.get("matched") or {}
+
+    missing = [name for name in JOB_DETAIL_FIELD_DEFAULTS if name not in fields]
+    if missing:
+        logging.warning(f"No selector matched for: {', '.join(missing)}")
+    return job_info
+
+
+def load_all_cards(driver, timeout=20, stable_rounds=4):
+    """Materializes every lazy-loaded card on the results page and returns their job IDs.
+
+    Runs as a single async script; returns an empty list if the list can't be found.
+    """
     try:
-        # Wait for job list container - trying multiple possible selectors (Original logic)
-        job_list_selectors = [
-            "div.scaffold-layout__list > ul",  # Original selector
-            ".jobs-search-results-list",      # Alternative from original
-            ".scaffold-layout__list",          # Detected in logs (from original comments)
-            "div[data-view-name='job-serp-jobs-list']" # Another possibility (from original comments)
-        ]
-        job_list_container = None
-        for selector in job_list_selectors:
-            try:
-                job_list_container = WebDriverWait(driver, 15).until( # Original timeout: 15s
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
-                break
-            except TimeoutException: continue
-
-        if not job_list_container:
-            logging.error("Timed out waiting for the job list container.")
-            return job_data # Original return
-
-        # Find all job cards - multiple possible selectors (Original logic)
-        job_card_selectors = [
-            ".jobs-search-results__list-item", # Original selector
-            "li.occludable-update",           # Original selector
-            "li.scaffold-layout__list-item", # Original selector
-            "div[data-job-id]"                # Original selector
-        ]
-        job_cards = []
-        for selector in job_card_selectors:
+        result = driver.execute_async_script(
+            _LOAD_ALL_CARDS_JS, JOB_LIST_SELECTORS, int(timeout * 1000), stable_rounds) or {}
+    except Exception as e:
+        logging.warning(f"Could not load job cards in-page: {e}")
+        return []
+    job_ids = result.get("ids") or []
+    if not result.get("complete"):
+        logging.info(f"Card loader stopped with {result.get('materialized', 0)}/{len(job_ids)} cards rendered.")
+    return job_ids
+
+
+def harvest_list_cards(driver):
+    """Returns metadata for every rendered result card on the page in one round-trip.
+
+    Each card dict has job_id, title, company, location, date_posted, posted_on,
+    easy_apply and url; fields the card doesn't show are None (easy_apply too,
+    when no footer selector matched).
+    """
+    try:
+        cards = driver.execute_script(_HARVEST_CARDS_JS, CARD_FIELD_SELECTORS, CARD_EASY_APPLY_SELECTORS) or []
+    except Exception as e:
+        logging.warning(f"Could not harvest job cards: {e}")
+        return []
+    for card in cards:
+        card["url"] = LINKEDIN_JOB_VIEW_URL.format(job_id=card["job_id"])
+    return cards
+
+
+def click_job_card(driver, job_id):
+    """Scrolls to and clicks the card for job_id in one round-trip."""
+    get_pacer().wait("click")
+    try:
+        return bool(driver.execute_script(_CLICK_CARD_JS, job_id))
+    except Exception as e:
+        logging.warning(f"Could not click job card {job_id}: {e}")
+        return False
+
+
+def collect_page_cards(driver, page_number=1):
+    """Materializes the results list and returns the metadata of every card on the page."""
+    # Wait for job list container - trying multiple possible selectors (Original logic)
+    job_list_container, _ = wait_for_any(driver, JOB_LIST_SELECTORS, timeout=15)
+    if not job_list_container:
+        logging.error("Timed out waiting for the job list container.")
+        return []
+
+    # Materialize every lazy-loaded card, then read all of them in one call
+    job_ids = load_all_cards(driver)
+    cards = harvest_list_cards(driver)
+    if not cards and job_ids:
+        cards = [{"job_id": job_id, "url": LINKEDIN_JOB_VIEW_URL.format(job_id=job_id)} for job_id in job_ids]
+    if not cards:
+        # Fall back to the original element-based card lookup
+        for selector in JOB_CARD_SELECTORS:
             job_cards = driver.find_elements(By.CSS_SELECTOR, selector)
             if job_cards:
                 logging.info(f"Found {len(job_cards)} job listings using selector: {selector}") # Original log
+                for card in job_cards:
+                    job_id = card.get_attribute("data-occludable-job-id") or card.get_attribute("data-job-id")
+                    if job_id:
+                        cards.append({"job_id": job_id, "url": LINKEDIN_JOB_VIEW_URL.format(job_id=job_id)})
                 break
 
-        if not job_cards:
-            logging.warning("No job cards found on this page.") # Original log
-            return job_data # Original return
+    if cards:
+        logging.info(f"Found {len(cards)} job listings on page {page_number}")
+        get_pacer().observe("ok")
+    else:
+        logging.warning("No job cards found on this page.") # Original log
+        get_pacer().observe("empty_results")
+    return cards
+
+
+def card_to_job(card):
+    """Turns list-card metadata into a job record, filling the usual defaults.
+
+    easy_apply stays None when the card couldn't tell.
+    """
+    job_info = dict(card)
+    for name, default in JOB_DETAIL_FIELD_DEFAULTS.items():
+        if name != "description" and not job_info.get(name):
+            job_info[name] = default
+    job_info["easy_apply"] = job_info.get("easy_apply")
+    return job_info
+
+
+def merge_card_data(job_info, card):
+    """Fills fields the details page lacked from the list card the job came from."""
+    for name, default in JOB_DETAIL_FIELD_DEFAULTS.items():
+        if job_info.get(name) == default and card.get(name):
+            job_info[name] = card[name]
+    job_info["job_id"] = job_info.get("job_id") or card["job_id"]
+    job_info["easy_apply"] = bool(job_info["easy_apply"] or card.get("easy_apply"))
+    if card.get("posted_on"):
+        job_info["posted_on"] = card["posted_on"]
+    return job_info
+
 
-        # Process each job card (Using original limit and logic)
-        # !!! Original code had a hardcoded limit for testing: [:10] !!!
-        # Keep this limit to exactly match the provided code's behavior.
-        # Remove or change [:10] if you want to scrape all found cards on the page.
-        for index, job_card in enumerate(job_cards[:10]):
+def fetch_job_details(driver, card, index=0):
+    """Clicks a card and extracts the full details pane, using card data for fields the pane lacks.
+
+    Returns the job dict, or None if the card couldn't be opened.
+    """
+    # Click on the job card to view details
+    if not click_job_card(driver, card["job_id"]):
+        logging.warning(f"Could not click job card {index + 1}") # Original log
+        return None
+    human_delay(1.0, 2.0) # Using helper
+
+    # Wait for job details to load (Original logic)
+    details_panel, _ = wait_for_any(driver, JOB_DETAILS_SELECTORS, timeout=10)
+    if not details_panel:
+        logging.warning(f"Could not load details for job {index + 1}") # Original log
+        return None
+
+    # Extract every field (and the Easy Apply check) in one round-trip
+    job_info = extract_job_details(driver)
+    # Selector bookkeeping is for debugging only, keep it out of the saved results
+    logging.debug(f"Job {index + 1}: matched selectors {job_info.pop('matched_selectors')}")
+    return merge_card_data(job_info, card)
+
+
+def fetch_job_view_details(driver, card, index=0):
+    """Loads the card's standalone /jobs/view/ page in this driver and extracts its details.
+
+    Returns the job dict, or None if the page didn't render. Used by drivers other
+    than the one holding the search results, so the results page is never disturbed.
+    """
+    get_pacer().wait("page_load")
+    driver.get(LINKEDIN_JOB_VIEW_URL.format(job_id=card["job_id"]))
+    details_panel, _ = wait_for_any(driver, JOB_DETAILS_SELECTORS, timeout=15)
+    if not details_panel:
+        logging.warning(f"Could not load details for job {index + 1}") # Original log
+        get_pacer().observe_url(driver.current_url)
+        return None
+    record_page_load(driver, "job_view")
+    job_info = extract_job_details(driver)
+    logging.debug(f"Job {index + 1}: matched selectors {job_info.pop('matched_selectors')}")
+    return merge_card_data(job_info, card)
+
+
+def _prefetch_task(http_fetcher, card, prefetched, pending):
+    """Idle task that fetches `card` ahead of time, unless the loop has already reached it."""
+    def prefetch():
+        if any(queued is card for _, queued in pending):
+            prefetched[card["job_id"]] = http_fetcher.fetch(card)
+    return prefetch
+
+
+def _fetch_sequential(driver, indexed_cards, http_fetcher=None):
+    """Opens each card in the results pane in turn; yields (index, card, job_info or None).
+
+    With an http_fetcher the job page is downloaded without the browser first,
+    and the card is only clicked when that fails. The next card's page is
+    downloaded and parsed during the pacing pause after each job.
+    """
+    prefetched = {}  # job_id -> parsed job (or None) fetched during an idle window
+    pending = deque(indexed_cards)
+    while pending:
+        index, card = pending.popleft()
+        try:
+            if card["job_id"] in prefetched:
+                job_info = prefetched.pop(card["job_id"])
+            else:
+                job_info = http_fetcher.fetch(card) if http_fetcher is not None else None
+            if job_info is None:
+                job_info = fetch_job_details(driver, card, index)
+        except Exception as e:
+            logging.error(f"Error processing job card {index + 1}: {e}") # Original log
+            job_info = None
+        yield index, card, job_info
+        if job_info is not None:
+            if http_fetcher is not None and pending:
+                get_pacer().when_idle(_prefetch_task(http_fetcher, pending[0][1], prefetched, pending),
+                                      name="prefetch_job")
+            human_delay(1.0, 2.0) # Using helper, original position
+
+
+def _wait_for_job_page(driver, job_id, timeout=15):
+    """Waits until the tab has left about:blank for job_id's page; False on timeout or another job."""
+    try:
+        WebDriverWait(driver, timeout).until(lambda d: not d.current_url.startswith("about:"))
+    except Exception:
+        return False
+    shown = parse_job_id(driver.current_url)
+    return shown is None or shown == job_id
+
+
+def fetch_details_in_tabs(driver, indexed_cards, tabs=3):
+    """Loads job view pages in several tabs of the same driver so page loads overlap.
+
+    Navigation is started without blocking, and tabs are visited round-robin:
+    while one tab is being extracted the others keep loading. Yields
+    (index, card, job_info or None) in the original card order. The driver
+    must not be used for anything else until the generator is exhausted or closed.
+    """
+    origin = driver.current_window_handle
+    handles = []
+    pending = deque()  # (handle, index, card) in the order navigation was started
+    cards = iter(indexed_cards)
+
+    def start_next(handle):
+        for index, card in cards:
+            try:
+                get_pacer().wait("page_load")
+                driver.switch_to.window(handle)
+                # Blank the tab first so the previous job's panel can't be mistaken for this one
+                driver.get("about:blank")
+                driver.execute_script("window.location.href = arguments[0];",
+                                      LINKEDIN_JOB_VIEW_URL.format(job_id=card["job_id"]))
+                pending.append((handle, index, card))
+                return
+            except Exception as e:
+                logging.warning(f"Could not open job {index + 1} in a tab: {e}")
+
+    try:
+        for _ in range(max(1, tabs)):
+            driver.switch_to.new_window("tab")
+            configure_window(driver)  # A new tab doesn't inherit the lean profile's blocked URLs
+            handles.append(driver.current_window_handle)
+        for handle in handles:
+            start_next(handle)
+
+        while pending:
+            handle, index, card = pending.popleft()
+            job_info = None
             try:
-                # Click on the job card to view details (Original logic)
-                try:
-                    driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", job_card) # Original scroll
-                    human_delay(0.5, 1.0) # Using helper
-
-                    # Try clicking normally first (Original logic)
-                    try: job_card.click()
-                    except: driver.execute_script("arguments[0].click();", job_card) # Original JS fallback
-
-                    human_delay(1.0, 2.0) # Using helper
-                except Exception as e:
-                    logging.warning(f"Could not click job card {index + 1}: {e}") # Original log
-                    continue # Original skip
-
-                # Wait for job details to load (Original logic)
-                job_details_loaded = False
-                details_selectors = [
-                    ".jobs-unified-top-card__content-container", # Original selector
-                    ".jobs-details",                             # Original selector
-                    "h2.jobs-unified-top-card__job-title"       # Original selector
-                ]
-                for selector in details_selectors:
-                    try:
-                        WebDriverWait(driver, 10).until( # Original timeout: 10s
-                            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                        )
-                        job_details_loaded = True
-                        break
-                    except: continue
-
-                if not job_details_loaded:
+                driver.switch_to.window(handle)
+                details_panel = None
+                if _wait_for_job_page(driver, card["job_id"], timeout=15):
+                    details_panel, _ = wait_for_any(driver, JOB_DETAILS_SELECTORS, timeout=15)
+                if details_panel:
+                    job_info = extract_job_details(driver)
+                    logging.debug(f"Job {index + 1}: matched selectors {job_info.pop('matched_selectors')}")
+                    if job_info["job_id"] and job_info["job_id"] != card["job_id"]:
+                        logging.warning(f"Job {index + 1}: tab shows job {job_info['job_id']} "
+                                        f"instead of {card['job_id']}. Skipping.")
+                        job_info = None
+                    else:
+                        job_info = merge_card_data(job_info, card)
+                else:
                     logging.warning(f"Could not load details for job {index + 1}") # Original log
-                    continue # Original skip
-
-                # Check if Easy Apply button exists (if easy_apply_only is True) (Original logic)
-                if easy_apply_only:
-                    easy_apply_selectors = [
-                        "button.jobs-apply-button",         # Original selector
-                        "button[aria-label*='Easy Apply']", # Original selector
-                        "button span[text()='Easy Apply']", # Original selector typo? (text() is XPath), keeping as is. Should be: //button[.//span[text()='Easy Apply']] or similar
-                        ".jobs-s-apply button"              # Original selector
-                    ]
-                    has_easy_apply = False
-                    for selector in easy_apply_selectors:
-                        # Need to handle XPath vs CSS selectors based on the string
-                        elements = []
-                        try:
-                           if selector.startswith("//") or selector.startswith("(//"):
-                               elements = driver.find_elements(By.XPATH, selector)
-                           else:
-                               elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                        except Exception as find_ex:
-                             logging.debug(f"Error finding easy apply with selector {selector}: {find_ex}")
-
-                        if len(elements) > 0:
-                            has_easy_apply = True
-                            break
-
-                    if not has_easy_apply:
-                        logging.info(f"Job {index + 1}: Skipping as it's not Easy Apply") # Original log
-                        continue # Original skip
-
-                # Extract job details (Original logic and selectors)
-                job_info = {}
-
-                # Title
-                try:
-                    title_selectors = [
-                        "h2.jobs-unified-top-card__job-title", # Original selector
-                        ".jobs-unified-top-card__job-title",   # Original selector
-                        "h2.t-24"                              # Original selector
-                    ]
-                    for selector in title_selectors:
-                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                        if elements:
-                            job_info["title"] = elements[0].text.strip()
-                            break
-                    # Check if title was found, add default if not (added for safety, original didn't explicitly handle missing title)
-                    if "title" not in job_info:
-                        job_info["title"] = "Unknown Title"
-                except Exception as e:
-                    logging.warning(f"Could not extract job title: {e}") # Original log
-                    job_info["title"] = "Unknown Title" # Original assignment in except block
-
-                # Company
-                try:
-                    company_selectors = [
-                        ".jobs-unified-top-card__company-name",             # Original selector
-                        "a.ember-view.t-black.t-normal",                    # Original selector (Potentially fragile Ember class)
-                        "span.jobs-unified-top-card__subtitle-primary-grouping a" # Original selector
-                    ]
-                    for selector in company_selectors:
-                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                        if elements:
-                             # Check for empty text which sometimes happens
-                             text = elements[0].text.strip()
-                             if text:
-                                 job_info["company"] = text
-                                 break
-                    if "company" not in job_info: job_info["company"] = "Unknown Company" # Added default if loop completes without finding
-                except Exception as e:
-                    logging.warning(f"Could not extract company name: {e}") # Original log
-                    job_info["company"] = "Unknown Company" # Original assignment in except
-
-                # Location
-                try:
-                    location_selectors = [
-                        ".jobs-unified-top-card__bullet",                                # Original selector
-                        ".jobs-unified-top-card__subtitle-primary-grouping .jobs-unified-top-card__bullet", # Original selector
-                        "span.jobs-unified-top-card__location"                          # Original selector
-                    ]
-                    for selector in location_selectors:
-                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                        if elements:
-                            text = elements[0].text.strip()
-                            if text: # Check if text is not empty
-                                job_info["location"] = text
-                                break
-                    if "location" not in job_info: job_info["location"] = "Unknown Location" # Added default
-                except Exception as e:
-                    logging.warning(f"Could not extract location: {e}") # Original log
-                    job_info["location"] = "Unknown Location" # Original assignment in except
-
-                # Job URL - get current URL as it should be the job details page (Original logic)
-                job_info["url"] = driver.current_url
-
-                # Job Description - try multiple selectors (Original logic)
-                try:
-                    desc_selectors = [
-                        ".jobs-description__content", # Original selector
-                        ".jobs-description-content", # Original selector
-                        ".jobs-box__html-content"    # Original selector
-                    ]
-                    desc_found = False
-                    for selector in desc_selectors:
-                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                        if elements:
-                            job_info["description"] = elements[0].text.strip()
-                            desc_found = True
-                            break
-
-                    if not desc_found: # Original fallback logic
-                        # If specific selectors fail, try to get all job details text
-                        job_info["description"] = driver.find_element(By.CSS_SELECTOR, ".jobs-details").text # Original fallback selector
-                except Exception as e:
-                    logging.warning(f"Could not extract job description: {e}") # Original log
-                    job_info["description"] = "Description not available" # Original assignment in except
-
-                # Date Posted/Listed - Often appears in the job details (Original logic)
-                try:
-                    date_selectors = [
-                        ".jobs-unified-top-card__subtitle-secondary-grouping .jobs-unified-top-card__posted-date", # Original selector
-                        ".jobs-posted-time-status", # Original selector
-                        "span.jobs-unified-top-card__posted-date" # Original selector
-                    ]
-                    date_found = False
-                    for selector in date_selectors:
-                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                        if elements:
-                            job_info["date_posted"] = elements[0].text.strip()
-                            date_found = True
-                            break
-                    if not date_found: job_info["date_posted"] = "Unknown" # Default if not found
-                except Exception as e:
-                    logging.warning(f"Could not extract date posted: {e}") # Original log
-                    job_info["date_posted"] = "Unknown" # Original assignment in except
-
-                # Add a timestamp (Original logic)
-                job_info["scraped_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S") # Original format
-
-                logging.info(f"Job {index + 1}: Scraped {job_info.get('title', 'Unknown')} at {job_info.get('company', 'Unknown')}") # Original log
-                job_data.append(job_info)
-
-                human_delay(1.0, 2.0) # Using helper, original position
+                    get_pacer().observe_url(driver.current_url)
             except Exception as e:
                 logging.error(f"Error processing job card {index + 1}: {e}") # Original log
+            # Kick off the next load in this tab before handing the result back
+            start_next(handle)
+            yield index, card, job_info
+            if job_info is not None:
+                human_delay(1.0, 2.0) # Pacing; the other tabs keep loading meanwhile
+    finally:
+        for handle in handles:
+            try:
+                driver.switch_to.window(handle)
+                driver.close()
+            except Exception as e:
+                logging.debug(f"Could not close detail tab: {e}")
+        driver.switch_to.window(origin)
+
+
+def _accepted_cards(cards, criteria, seen_index=None, page_stats=None):
+    """Yields (index, card) for cards that are neither already seen nor rejected by the job filters."""
+    for index, card in enumerate(cards):
+        # Jobs scraped by an earlier run cost nothing beyond the card harvest
+        if seen_index is not None and card.get("job_id") in seen_index:
+            if page_stats is not None:
+                page_stats["known"] += 1
+            logging.debug(f"Job {index + 1}: Skipping, already seen ({card['job_id']})")
+            continue
+
+        # Reject on list-card data first so filtered jobs never cost a click or details load
+        reason = rejection_reason(card, criteria)
+        if reason:
+            logging.info(f"Job {index + 1}: Skipping, {reason}")
+            continue
+        yield index, card
+
+
+def iter_jobs_on_page(driver, easy_apply_only=True, page_number=1, mode="details", job_filters=None,
+                      seen_index=None, page_stats=None, detail_tabs=1, http_fetcher=None):
+    """Scrapes every job card on the current results page, yielding each job as soon as it is extracted.
+
+    In "list" mode jobs are built from the result cards alone, without opening any details pane.
+    job_filters (see predicates.rejection_reason) are checked against the card data before
+    a card is clicked, and again against the full details. A card whose footer shows no Easy
+    Apply is rejected right away; one without a recognizable footer (easy_apply None) is judged
+    on its details. Cards whose job ID is already in
+    seen_index are skipped; if given, page_stats is filled with the "cards" and "known" counts.
+    seen_index is only read here: callers mark a job as seen once it has been saved.
+    With detail_tabs > 1 details are loaded from job view pages in that many tabs at once;
+    otherwise an http_fetcher (see src/http_fetcher.py) is tried before clicking each card.
+    """
+    criteria = dict(job_filters or {})
+    criteria.setdefault("easy_apply_only", easy_apply_only)
+    logging.info(f"\n--- Starting Job Scraping Process (Page {page_number}) ---") # Original Log Message
+    logging.info("Starting to scrape jobs on the current page...") # Original Log Message
+    scraped = 0
+
+    try:
+        cards = collect_page_cards(driver, page_number)
+        if page_stats is not None:
+            page_stats["cards"] = len(cards)
+            page_stats["known"] = 0
+
+        accepted = _accepted_cards(cards, criteria, seen_index, page_stats)
+        if mode == "list":
+            results = ((index, card, card_to_job(card)) for index, card in accepted)
+        elif detail_tabs > 1:
+            results = fetch_details_in_tabs(driver, accepted, tabs=detail_tabs)
+        else:
+            results = _fetch_sequential(driver, accepted, http_fetcher=http_fetcher)
+
+        # Process every job card on the page
+        for index, card, job_info in results:
+            if job_info is None:
                 continue # Original skip
 
-        logging.info("\n--- Scraping Complete for First Page ---") # Original log
+            # The details page can reveal fields the card didn't show
+            if mode != "list":
+                reason = rejection_reason(job_info, criteria)
+                if reason:
+                    logging.info(f"Job {index + 1}: Skipping, {reason}")
+                    continue
+
+            # Add a timestamp (Original logic)
+            job_info["scraped_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S") # Original format
+
+            logging.info(f"Job {index + 1}: Scraped {job_info.get('title', 'Unknown')} at {job_info.get('company', 'Unknown')}") # Original log
+            scraped += 1
+            yield job_info
+
+        logging.info(f"\n--- Scraping Complete for Page {page_number} ({scraped} jobs) ---") # Original log
     except Exception as e:
         logging.error(f"Error during job scraping: {e}") # Original log
 
-    if not job_data:
-        logging.warning("No job data was collected from the first page. Check logs and selectors.") # Original log
+    if not scraped:
+        logging.warning(f"No job data was collected from page {page_number}. Check logs and selectors.") # Original log
+
+
+def scrape_jobs_on_page(driver, easy_apply_only=True, mode="details", job_filters=None):
+    """Scrapes job listings from the current page."""
+    return list(iter_jobs_on_page(driver, easy_apply_only=easy_apply_only, mode=mode, job_filters=job_filters))
+
+
+def go_to_page(driver, page_number):
+    """Moves the results list to the given page, clicking the pager first and loading the URL as a fallback."""
+    start = (page_number - 1) * RESULTS_PER_PAGE
+    pager_button, _ = wait_for_any(driver, [
+        f"button[aria-label='Page {page_number}']",
+        f"li[data-test-pagination-page-btn='{page_number}'] button",
+    ], timeout=3, visible=True)
+
+    get_pacer().wait("page_load")
+    if pager_button:
+        try:
+            driver.execute_script("arguments[0].click();", pager_button)
+            WebDriverWait(driver, 10).until(lambda d: f"start={start}" in d.current_url)
+            logging.info(f"Moved to results page {page_number} via the pager.")
+            return True
+        except Exception as e:
+            logging.warning(f"Pager click for page {page_number} did not navigate: {e}")
+
+    # No (working) pager button: rewrite the start offset in the current search URL
+    parts = urlsplit(driver.current_url)
+    if "jobs/search" not in parts.path:
+        logging.warning(f"Cannot reach page {page_number}: not on a search results URL.")
+        return False
+    query = [(k, v) for k, v in parse_qsl(parts.query) if k not in ("start", "currentJobId")]
+    query.append(("start", str(start)))
+    driver.get(urlunsplit(parts._replace(query=urlencode(query))))
+    record_page_load(driver, "search")
+    logging.info(f"Moved to results page {page_number} via URL.")
+    return True
+
+
+def iter_jobs(driver, max_pages=3, easy_apply_only=True, mode="details", job_filters=None,
+              seen_index=None, incremental=False, stop_known_ratio=0.8, detail_tabs=1, http_fetcher=None):
+    """Walks up to max_pages result pages, yielding every scraped job as it is extracted.
+
+    Jobs are streamed so callers can start saving before the crawl ends and
+    memory stays flat regardless of how many pages are walked. Pagination ends
+    at the first page (page 1 included) that has no result cards at all; a page
+    whose cards were all filtered out or already seen does not end it. In incremental mode pagination
+    stops once at least stop_known_ratio of a page's cards are already in
+    seen_index, since results are sorted and older pages will be known too.
+    """
+    if mode not in SCRAPE_MODES:
+        logging.warning(f"Unknown scraping mode '{mode}'. Using 'details'.")
+        mode = "details"
+    for page_number in range(1, max_pages + 1):
+        if page_number > 1 and not go_to_page(driver, page_number):
+            break
+        page_jobs = 0
+        page_stats = {}
+        for job_info in iter_jobs_on_page(driver, easy_apply_only=easy_apply_only,
+                                          page_number=page_number, mode=mode, job_filters=job_filters,
+                                          seen_index=seen_index, page_stats=page_stats,
+                                          detail_tabs=detail_tabs, http_fetcher=http_fetcher):
+            page_jobs += 1
+            yield job_info
 
-    return job_data # Original return
\ No newline at end of file
+        cards, known = page_stats.get("cards", 0), page_stats.get("known", 0)
+        if seen_index is not None and cards:
+            logging.info(f"Page {page_number}: {known}/{cards} jobs already seen.")
+        if incremental and cards and known / cards >= stop_known_ratio:
+            logging.info(f"Page {page_number} is mostly known. Stopping incremental crawl.")
+            break
+        if cards == 0:
+            logging.info(f"Page {page_number} has no result cards. Stopping pagination.")
+            break
+        if page_jobs == 0 and cards:
+            logging.info(f"Page {page_number}: none of its {cards} jobs were kept. Continuing to the next page.")
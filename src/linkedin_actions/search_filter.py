@@ -1,6 +1,7 @@
 # src/linkedin_actions/search_filter.py
 import logging
 import time
+from urllib.parse import urlencode, quote
 from selenium.webdriver import Keys
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -9,6 +10,102 @@ from selenium.common.exceptions import TimeoutException, ElementClickIntercepted
 
 # Import helper from the utils directory
 from ..utils.helpers import human_delay
+from ..utils.waits import wait_for_any, wait_for_dom_settle, wait_for_dom_change, wait_for_gone
+from ..utils.page_load_stats import record_page_load
+from ..utils.pacing import get_pacer
+
+LINKEDIN_JOBS_SEARCH_URL = "https://www.linkedin.com/jobs/search/"
+
+# Query parameter values LinkedIn uses for the filter dialog options (keys are lower-cased labels)
+DATE_POSTED_PARAMS = {
+    "any time": None,
+    "past 24 hours": "r86400",
+    "past week": "r604800",
+    "past month": "r2592000",
+}
+EXPERIENCE_LEVEL_PARAMS = {
+    "internship": "1",
+    "entry level": "2",
+    "associate": "3",
+    "mid-senior level": "4",
+    "director": "5",
+    "executive": "6",
+}
+
+# Containers watched for "results stopped changing" after a search or filter change
+RESULTS_SETTLE_SELECTORS = [
+    ".jobs-search-results-list",
+    ".scaffold-layout__list",
+    "main",
+]
+
+# Elements that show up once a search results page has rendered
+SEARCH_RESULTS_READY_SELECTORS = [
+    "div.scaffold-layout__list > ul",
+    ".jobs-search-results-list",
+    ".scaffold-layout__list",
+    ".jobs-search-no-results",
+]
+
+
+def build_search_url(keywords, location, date_posted=None, experience_levels=None, easy_apply_only=False, start=0):
+    """Builds a jobs/search URL with the search criteria and filters as query parameters.
+
+    Raises ValueError for a date posted or experience level label that has no known parameter value.
+    """
+    params = {}
+    if keywords:
+        params["keywords"] = keywords
+    if location:
+        params["location"] = location
+    if date_posted:
+        key = date_posted.strip().lower()
+        if key not in DATE_POSTED_PARAMS:
+            raise ValueError(f"Unknown 'Date Posted' option: {date_posted}")
+        if DATE_POSTED_PARAMS[key]:
+            params["f_TPR"] = DATE_POSTED_PARAMS[key]
+    if experience_levels:
+        codes = []
+        for level in experience_levels:
+            key = level.strip().lower()
+            if key not in EXPERIENCE_LEVEL_PARAMS:
+                raise ValueError(f"Unknown 'Experience Level' option: {level}")
+            codes.append(EXPERIENCE_LEVEL_PARAMS[key])
+        params["f_E"] = ",".join(codes)
+    if easy_apply_only:
+        params["f_AL"] = "true"
+    if start:
+        params["start"] = str(start)
+    return f"{LINKEDIN_JOBS_SEARCH_URL}?{urlencode(params, quote_via=quote)}"
+
+
+def search_via_url(driver, keywords, location, date_posted=None, experience_levels=None, easy_apply_only=False):
+    """Loads filtered search results with a single driver.get instead of typing and clicking.
+
+    Returns False when the filters can't be encoded or the results page doesn't render,
+    so the caller can fall back to perform_job_search/apply_filters.
+    """
+    try:
+        url = build_search_url(keywords, location, date_posted, experience_levels, easy_apply_only)
+    except ValueError as e:
+        logging.warning(f"Cannot build direct search URL: {e}")
+        return False
+
+    logging.info(f"Loading search results directly: {url}")
+    try:
+        get_pacer().wait("page_load")
+        driver.get(url)
+        element, matched = wait_for_any(driver, SEARCH_RESULTS_READY_SELECTORS, timeout=15)
+        if not element:
+            logging.warning("Timed out waiting for search results loaded from URL.")
+            get_pacer().observe_url(driver.current_url)
+            return False
+        logging.info(f"Search results page loaded from URL ({matched['name']}).")
+        record_page_load(driver, "search")
+        return True
+    except Exception as e:
+        logging.warning(f"Error loading search results from URL: {e}")
+        return False
 
 # Directly copied from the provided code
 def perform_job_search(driver, keywords, location):
@@ -53,24 +150,14 @@ def perform_job_search(driver, keywords, location):
             {"type": "xpath", "value": "//div[contains(@class, 'jobs-search-results-grid')]", "name": "Jobs results grid"} # Added in original's code
         ]
 
-        # Try each selector with a short timeout (Exact loop from original)
-        for selector in possible_selectors:
-            try:
-                logging.info(f"Trying to locate {selector['name']}: {selector['value']}")
-                if selector['type'] == 'css':
-                    WebDriverWait(driver, 8).until( # Original timeout: 8s
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector['value']))
-                    )
-                else:
-                    WebDriverWait(driver, 8).until( # Original timeout: 8s
-                        EC.presence_of_element_located((By.XPATH, selector['value']))
-                    )
-                logging.info(f"Search results page detected using {selector['name']}!")
-                human_delay() # Using helper
-                return True
-            except TimeoutException:
-                logging.warning(f"Could not find {selector['name']} within timeout")
-                continue
+        # Race all selectors in one wait so the fastest signal wins instead of 8s per selector
+        logging.info(f"Waiting for any of {len(possible_selectors)} results page indicators...")
+        element, matched = wait_for_any(driver, possible_selectors, timeout=20)
+        if element:
+            logging.info(f"Search results page detected using {matched['name']}!")
+            human_delay() # Using helper
+            return True
+        logging.warning("Could not find any results page indicator within timeout")
 
         # If direct selectors don't work, try a URL-based approach (Exact logic from original)
         try:
@@ -87,14 +174,10 @@ def perform_job_search(driver, keywords, location):
         except TimeoutException:
             logging.warning("URL-based detection also failed")
 
-        # Final fallback: check if page structure changed significantly (Exact logic from original)
+        # Final fallback: watch the page for changes in-browser instead of diffing page_source twice
         logging.info("Trying generic page change detection...")
-        old_source_len = len(driver.page_source)
-        human_delay(5.0, 7.0)  # Wait longer (using helper)
-        new_source_len = len(driver.page_source)
-
-        if abs(new_source_len - old_source_len) > 5000:  # Significant change threshold (original value)
-            logging.info("Page content changed significantly. Assuming results loaded.")
+        if wait_for_dom_change(driver, ["main"], timeout=7) and wait_for_dom_settle(driver, ["main"], timeout=10):
+            logging.info("Page content changed and settled. Assuming results loaded.")
             screenshot_path = f"generic_change_results_{time.strftime('%Y%m%d%H%M%S')}.png"
             driver.save_screenshot(screenshot_path) # Save screenshot exactly as in original
             logging.info(f"Saved screenshot to {screenshot_path}")
@@ -129,8 +212,8 @@ def apply_filters(driver, date_posted=None, experience_levels=None):
     logging.info("Applying filters...")
     filters_applied = False
 
-    # Wait for page to stabilize after search (using original delay logic)
-    human_delay(3.0, 5.0) # Using helper
+    # Wait for page to stabilize after search: returns as soon as the results stop changing
+    wait_for_dom_settle(driver, RESULTS_SETTLE_SELECTORS, quiet_ms=750, timeout=10)
 
     # ---- Apply Date Posted filter ---- (Exact logic from original)
     if date_posted:
@@ -143,14 +226,7 @@ def apply_filters(driver, date_posted=None, experience_levels=None):
                 "//div[text()='Date posted']//ancestor::button",
                 "//span[text()='Date posted']//ancestor::button"
             ]
-            date_button = None
-            for selector in date_filter_button_selectors:
-                try:
-                    date_button = WebDriverWait(driver, 5).until( # Original timeout: 5s
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
-                    break
-                except: continue
+            date_button, _ = wait_for_any(driver, date_filter_button_selectors, timeout=5, visible=True)
 
             if not date_button:
                 logging.warning("Could not find Date Posted filter button. Skipping this filter.")
@@ -170,16 +246,11 @@ def apply_filters(driver, date_posted=None, experience_levels=None):
                         f"//span[contains(text(), '{date_posted}')]/ancestor::label",
                         f"//div[contains(text(), '{date_posted}')]/ancestor::label"
                     ]
-                    for label_xpath in option_labels:
-                        try:
-                            option_label = WebDriverWait(driver, 5).until( # Original timeout: 5s
-                                EC.element_to_be_clickable((By.XPATH, label_xpath))
-                            )
-                            option_label.click()
-                            human_delay() # Using helper
-                            option_found = True
-                            break
-                        except: continue
+                    option_label, _ = wait_for_any(driver, option_labels, timeout=5, visible=True)
+                    if option_label:
+                        option_label.click()
+                        human_delay() # Using helper
+                        option_found = True
                 except Exception as e: logging.warning(f"Error with standard checkbox approach: {e}")
 
                 # Method 2: Dropdown selection (Exact logic from original)
@@ -229,14 +300,7 @@ def apply_filters(driver, date_posted=None, experience_levels=None):
                 "//div[text()='Experience level']//ancestor::button",
                 "//span[text()='Experience level']//ancestor::button"
             ]
-            exp_button = None
-            for selector in exp_filter_button_selectors:
-                try:
-                    exp_button = WebDriverWait(driver, 5).until( # Original timeout: 5s
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
-                    break
-                except: continue
+            exp_button, _ = wait_for_any(driver, exp_filter_button_selectors, timeout=5, visible=True)
 
             if not exp_button:
                 logging.warning("Could not find Experience Level filter button. Skipping this filter.")
@@ -280,26 +344,19 @@ def apply_filters(driver, date_posted=None, experience_levels=None):
         except Exception as e:
             logging.error(f"Error applying 'Experience Level' filter: {e}")
 
-    # Wait for filter results to apply (Exact logic from original)
+    # Wait for filter results to apply: loaders gone, then the results list settled
     try:
         loading_indicators = [
             "//div[contains(@class, 'jobs-search-results-list__loader')]",
             "//div[contains(@class, 'artdeco-loader')]"
         ]
-        for indicator in loading_indicators:
-            try:
-                elements = driver.find_elements(By.XPATH, indicator)
-                if elements:
-                    WebDriverWait(driver, 15).until( # Original timeout: 15s
-                        EC.invisibility_of_element_located((By.XPATH, indicator))
-                    )
-                    break
-            except: continue
+        if not wait_for_gone(driver, loading_indicators, timeout=15): # Original timeout: 15s
+            logging.warning("Loading indicator still visible after 15s.")
     except Exception as e:
         logging.error(f"Error waiting for filters to apply: {e}")
 
     if not filters_applied: # Checking the flag set within this function
         logging.warning("Some filters could not be applied. Check logs.") # Original log based on flag
 
-    human_delay(2.0, 4.0) # Original final delay
+    wait_for_dom_settle(driver, RESULTS_SETTLE_SELECTORS, quiet_ms=750, timeout=10)
     return filters_applied # Return the flag
\ No newline at end of file
@@ -0,0 +1,131 @@
+# src/linkedin_actions/selectors.py
+# Selector fallback lists shared by the browser scraper and the in-page extraction scripts.
+# Order matters: the first selector that yields text wins.
+
+# Job list container on the search results page
+JOB_LIST_SELECTORS = [
+    "div.scaffold-layout__list > ul",  # Original selector
+    ".jobs-search-results-list",      # Alternative from original
+    ".scaffold-layout__list",          # Detected in logs (from original comments)
+    "div[data-view-name='job-serp-jobs-list']" # Another possibility (from original comments)
+]
+
+# Individual job cards in the results list
+JOB_CARD_SELECTORS = [
+    ".jobs-search-results__list-item", # Original selector
+    "li.occludable-update",           # Original selector
+    "li.scaffold-layout__list-item", # Original selector
+    "div[data-job-id]"                # Original selector
+]
+
+# Elements that show the job details pane has rendered
+JOB_DETAILS_SELECTORS = [
+    ".jobs-unified-top-card__content-container", # Original selector
+    ".jobs-details",                             # Original selector
+    "h2.jobs-unified-top-card__job-title",      # Original selector
+    ".job-details-jobs-unified-top-card__job-title", # Standalone /jobs/view/ page
+    ".top-card-layout__title"                       # Server-rendered job page (HTTP fetch)
+]
+
+EASY_APPLY_SELECTORS = [
+    "button.jobs-apply-button",         # Original selector
+    "button[aria-label*='Easy Apply']", # Original selector
+    "button span[text()='Easy Apply']", # Original selector (not valid CSS, skipped at evaluation time)
+    ".jobs-s-apply button",             # Original selector
+    "[data-tracking-control-name*='easy_apply']" # Server-rendered job page (HTTP fetch)
+]
+
+TITLE_SELECTORS = [
+    "h2.jobs-unified-top-card__job-title", # Original selector
+    ".jobs-unified-top-card__job-title",   # Original selector
+    "h2.t-24",                             # Original selector
+    ".job-details-jobs-unified-top-card__job-title", # Standalone /jobs/view/ page
+    ".top-card-layout__title"                       # Server-rendered job page (HTTP fetch)
+]
+
+COMPANY_SELECTORS = [
+    ".jobs-unified-top-card__company-name",             # Original selector
+    "a.ember-view.t-black.t-normal",                    # Original selector (Potentially fragile Ember class)
+    "span.jobs-unified-top-card__subtitle-primary-grouping a", # Original selector
+    ".job-details-jobs-unified-top-card__company-name", # Standalone /jobs/view/ page
+    ".topcard__org-name-link"                          # Server-rendered job page (HTTP fetch)
+]
+
+LOCATION_SELECTORS = [
+    ".jobs-unified-top-card__bullet",                                # Original selector
+    ".jobs-unified-top-card__subtitle-primary-grouping .jobs-unified-top-card__bullet", # Original selector
+    "span.jobs-unified-top-card__location",                         # Original selector
+    ".topcard__flavor--bullet"                                      # Server-rendered job page (HTTP fetch)
+]
+
+DESCRIPTION_SELECTORS = [
+    ".jobs-description__content", # Original selector
+    ".jobs-description-content", # Original selector
+    ".jobs-box__html-content",   # Original selector
+    ".show-more-less-html__markup", # Server-rendered job page (HTTP fetch)
+    ".jobs-details"              # Original last-resort fallback: all job details text
+]
+
+DATE_POSTED_SELECTORS = [
+    ".jobs-unified-top-card__subtitle-secondary-grouping .jobs-unified-top-card__posted-date", # Original selector
+    ".jobs-posted-time-status", # Original selector
+    "span.jobs-unified-top-card__posted-date", # Original selector
+    ".posted-time-ago__text"                  # Server-rendered job page (HTTP fetch)
+]
+
+# Field name -> selector list, used by the single-call extraction script
+JOB_DETAIL_FIELD_SELECTORS = {
+    "title": TITLE_SELECTORS,
+    "company": COMPANY_SELECTORS,
+    "location": LOCATION_SELECTORS,
+    "description": DESCRIPTION_SELECTORS,
+    "date_posted": DATE_POSTED_SELECTORS,
+}
+
+# Defaults used when no selector produced text for a field (same values as the original scraper)
+JOB_DETAIL_FIELD_DEFAULTS = {
+    "title": "Unknown Title",
+    "company": "Unknown Company",
+    "location": "Unknown Location",
+    "description": "Description not available",
+    "date_posted": "Unknown",
+}
+
+# Fields inside a results list card (left-hand pane), used for list-only harvesting
+CARD_TITLE_SELECTORS = [
+    ".job-card-list__title",
+    "a.job-card-container__link",
+    ".artdeco-entity-lockup__title"
+]
+
+CARD_COMPANY_SELECTORS = [
+    ".job-card-container__primary-description",
+    ".job-card-container__company-name",
+    ".artdeco-entity-lockup__subtitle"
+]
+
+CARD_LOCATION_SELECTORS = [
+    ".job-card-container__metadata-item",
+    ".job-card-container__metadata-wrapper li",
+    ".artdeco-entity-lockup__caption"
+]
+
+CARD_DATE_POSTED_SELECTORS = [
+    "time",
+    ".job-card-container__listed-time",
+    ".job-card-list__footer-wrapper time"
+]
+
+CARD_FIELD_SELECTORS = {
+    "title": CARD_TITLE_SELECTORS,
+    "company": CARD_COMPANY_SELECTORS,
+    "location": CARD_LOCATION_SELECTORS,
+    "date_posted": CARD_DATE_POSTED_SELECTORS,
+}
+
+# Card footer items; a card is Easy Apply when one of them reads "Easy Apply"
+CARD_EASY_APPLY_SELECTORS = [
+    ".job-card-container__apply-method",
+    ".job-card-container__footer-item",
+    ".job-card-list__footer-wrapper li"
+]
@@ -0,0 +1,154 @@
+# src/linkedin_actions/session.py
+import os
+import time
+import pickle
+import tempfile
+import hashlib
+import logging
+
+from .login import login_with_retry
+
+# A tiny same-origin page to land on before cookies/local storage can be set
+LINKEDIN_BLANK_URL = "https://www.linkedin.com/robots.txt"
+# Cheap authenticated endpoint used to validate a restored session
+LINKEDIN_SESSION_CHECK_PATH = "/voyager/api/me"
+
+# Reads every localStorage key of the current origin into a plain object
+_READ_LOCAL_STORAGE_JS = """
+var data = {};
+for (var i = 0; i < window.localStorage.length; i++) {
+    var key = window.localStorage.key(i);
+    data[key] = window.localStorage.getItem(key);
+}
+return data;
+"""
+
+_WRITE_LOCAL_STORAGE_JS = """
+var data = arguments[0];
+for (var key in data) { window.localStorage.setItem(key, data[key]); }
+"""
+
+# Issues one authenticated fetch and reports the HTTP status back to Selenium
+_CHECK_SESSION_JS = """
+var path = arguments[0];
+var done = arguments[arguments.length - 1];
+var match = document.cookie.match(/JSESSIONID="?([^";]+)"?/);
+var headers = {"accept": "application/json"};
+if (match) { headers["csrf-token"] = match[1]; }
+fetch(path, {credentials: "include", headers: headers})
+    .then(function (r) { done(r.status); })
+    .catch(function () { done(0); });
+"""
+
+
+def session_file_path(cache_dir, email):
+    """Returns the cache file used for an account (the email itself is not written to disk)."""
+    account_key = hashlib.sha256(email.strip().lower().encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir, f"session_{account_key}.pkl")
+
+
+def save_session(driver, email, cache_dir):
+    """Stores the driver's LinkedIn cookies and local storage for the account."""
+    try:
+        session = {
+            "saved_at": time.time(),
+            "cookies": driver.get_cookies(),
+            "local_storage": driver.execute_script(_READ_LOCAL_STORAGE_JS) or {},
+        }
+        os.makedirs(cache_dir, exist_ok=True)
+        path = session_file_path(cache_dir, email)
+        # A unique temp file, so sharded workers saving at once never write into the same one
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(session, f)
+            os.replace(tmp_path, path)  # Never leave a half-written session behind
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        logging.info(f"Saved session ({len(session['cookies'])} cookies) to {path}")
+        return True
+    except Exception as e:
+        logging.warning(f"Could not save session: {e}")
+        return False
+
+
+def load_session(email, cache_dir, max_age_hours=None):
+    """Loads a cached session for the account, or None if missing/expired/corrupt."""
+    path = session_file_path(cache_dir, email)
+    if not os.path.exists(path):
+        logging.info("No cached session found for this account.")
+        return None
+    try:
+        with open(path, "rb") as f:
+            session = pickle.load(f)
+    except Exception as e:
+        logging.warning(f"Could not read cached session {path}: {e}")
+        return None
+
+    age_hours = (time.time() - session.get("saved_at", 0)) / 3600
+    if max_age_hours is not None and age_hours > max_age_hours:
+        logging.info(f"Cached session is {age_hours:.1f}h old (limit {max_age_hours}h). Ignoring it.")
+        return None
+    return session
+
+
+def restore_session(driver, session):
+    """Injects cached cookies and local storage into the driver."""
+    try:
+        driver.get(LINKEDIN_BLANK_URL)
+        restored = 0
+        for cookie in session.get("cookies", []):
+            cookie = dict(cookie)
+            # Selenium rejects sameSite values it doesn't know and float expiries
+            if cookie.get("sameSite") not in ("Strict", "Lax", "None"):
+                cookie.pop("sameSite", None)
+            if "expiry" in cookie:
+                cookie["expiry"] = int(cookie["expiry"])
+            try:
+                driver.add_cookie(cookie)
+                restored += 1
+            except Exception as e:
+                logging.debug(f"Skipping cookie {cookie.get('name')}: {e}")
+        if session.get("local_storage"):
+            driver.execute_script(_WRITE_LOCAL_STORAGE_JS, session["local_storage"])
+        logging.info(f"Restored {restored} cookies from cached session.")
+        return restored > 0
+    except Exception as e:
+        logging.warning(f"Could not restore cached session: {e}")
+        return False
+
+
+def is_session_valid(driver):
+    """Checks the restored session with a single authenticated API request."""
+    try:
+        status = driver.execute_async_script(_CHECK_SESSION_JS, LINKEDIN_SESSION_CHECK_PATH)
+    except Exception as e:
+        logging.warning(f"Session validation request failed: {e}")
+        return False
+    logging.info(f"Session validation returned HTTP {status}")
+    return status == 200
+
+
+def login_with_session_cache(driver, email, password, session_config=None):
+    """Logs in by restoring a cached session, falling back to a full login when it is stale."""
+    session_config = session_config or {}
+    if not session_config.get("enabled", True):
+        return login_with_retry(driver, email, password)
+
+    cache_dir = session_config.get("cache_dir", ".linkedin_sessions")
+    session = load_session(email, cache_dir, session_config.get("max_age_hours"))
+    if session and restore_session(driver, session) and is_session_valid(driver):
+        logging.info("Reusing cached LinkedIn session. Skipping login.")
+        return True
+    if session:
+        logging.info("Cached session is stale. Falling back to full login.")
+        try:
+            driver.delete_all_cookies()
+        except Exception as e:
+            logging.debug(f"Could not clear stale cookies: {e}")
+
+    if not login_with_retry(driver, email, password):
+        return False
+    save_session(driver, email, cache_dir)
+    return True
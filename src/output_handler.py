@@ -1,46 +1,391 @@
 # src/output_handler.py
+import os
+import gzip
 import json
+import time
 import logging
+import threading
 from datetime import datetime
 # No CSV import needed as it wasn't in the original save_results
 
+from .job_store import JobStore
+
+try:
+    import zstandard
+except ImportError:  # Optional: only needed for zstd-compressed JSONL output
+    zstandard = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Optional: only needed for Parquet output
+    pa = pq = None
+
+JSONL_COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+
+class JsonlWriter:
+    """Streams jobs to a JSON Lines file as they are scraped.
+
+    Lines go through a write buffer of buffer_kb; the file is flushed and
+    fsync'ed every fsync_every jobs or fsync_seconds, whichever comes first, so
+    a crash loses at most that much. With rotate_mb or rotate_minutes a new
+    part file is started once the current one has that many (uncompressed)
+    megabytes or is that old. compression is None, "gzip" or "zstd" (needs
+    the zstandard package); a compressed part cut short by a crash can still be
+    decompressed up to its last flush (e.g. with zcat).
+    Safe to share between threads.
+    """
+
+    def __init__(self, prefix="linkedin_jobs", compression=None, buffer_kb=64, fsync_every=50, fsync_seconds=5.0,
+                 rotate_mb=None, rotate_minutes=None):
+        if compression not in JSONL_COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unsupported JSONL compression: {compression}")
+        if compression == "zstd" and zstandard is None:
+            raise ValueError("zstd compression requires the 'zstandard' package")
+        self.prefix = prefix
+        self.compression = compression
+        self.buffer_size = int(buffer_kb * 1024)
+        self.fsync_every = max(1, int(fsync_every))
+        self.fsync_seconds = fsync_seconds
+        self.rotate_bytes = int(rotate_mb * 1024 * 1024) if rotate_mb else None
+        self.rotate_seconds = rotate_minutes * 60 if rotate_minutes else None
+        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S") # Original format
+        self.paths = []
+        self.jobs_written = 0
+        self._lock = threading.Lock()
+        self._raw = None
+        self._stream = None
+        self._part = 0
+        self._unsynced = 0  # The first part is opened by the first write, so empty runs leave no file
+
+    @classmethod
+    def from_config(cls, output_config):
+        """Builds a writer from the "output" config section (its "jsonl" sub-section)."""
+        jsonl_config = (output_config or {}).get("jsonl", {})
+        return cls(compression=jsonl_config.get("compression"),
+                   buffer_kb=jsonl_config.get("buffer_kb", 64),
+                   fsync_every=jsonl_config.get("fsync_every", 50),
+                   fsync_seconds=jsonl_config.get("fsync_seconds", 5.0),
+                   rotate_mb=jsonl_config.get("rotate_mb"),
+                   rotate_minutes=jsonl_config.get("rotate_minutes"))
+
+    def _open_part(self):
+        self._part += 1
+        rotating = self.rotate_bytes or self.rotate_seconds
+        name = f"{self.prefix}_{self.timestamp}" + (f"_part{self._part:03d}" if rotating else "")
+        path = name + ".jsonl" + JSONL_COMPRESSION_SUFFIXES[self.compression]
+        self._raw = open(path, "ab", buffering=self.buffer_size)
+        if self.compression == "gzip":
+            self._stream = gzip.GzipFile(fileobj=self._raw, mode="ab")
+        elif self.compression == "zstd":
+            self._stream = zstandard.ZstdCompressor().stream_writer(self._raw, closefd=False)
+        else:
+            self._stream = self._raw
+        self.paths.append(path)
+        self._part_bytes = 0
+        self._part_started = time.monotonic()
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        logging.info(f"Streaming job data to {path}")
+
+    def _sync(self):
+        """Pushes everything written so far to disk (compressed streams are block-flushed first)."""
+        if self._stream is not self._raw:
+            self._stream.flush()  # gzip: Z_SYNC_FLUSH; zstd: end the current block
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _close_part(self):
+        self._sync()
+        if self._stream is not self._raw:
+            self._stream.close()
+        self._raw.close()
+
+    def write(self, job):
+        """Appends one job as a JSON line."""
+        line = (json.dumps(job, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            if self._raw is None:
+                self._open_part()
+            self._stream.write(line)
+            self.jobs_written += 1
+            self._part_bytes += len(line)
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_seconds:
+                self._sync()
+            if (self.rotate_bytes and self._part_bytes >= self.rotate_bytes) or \
+                    (self.rotate_seconds and time.monotonic() - self._part_started >= self.rotate_seconds):
+                self._close_part()
+                self._open_part()
+
+    def write_many(self, jobs):
+        for job in jobs:
+            self.write(job)
+
+    def flush(self):
+        """Syncs pending lines to disk; cheap when nothing was written since the last sync."""
+        with self._lock:
+            if self._unsynced:
+                self._sync()
+
+    def close(self):
+        with self._lock:
+            if self._raw is None:
+                return
+            self._close_part()
+            self._raw = self._stream = None
+        logging.info(f"Job data saved to {', '.join(self.paths)} ({self.jobs_written} jobs)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+# Columns of the Parquet export; low-cardinality text columns are dictionary-encoded
+PARQUET_DICTIONARY_COLUMNS = ("company", "location", "search_query")
+PARQUET_STRING_COLUMNS = ("job_id", "title", "description", "url", "date_posted", "posted_on", "scraped_at")
+
+
+def _parquet_schema():
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ("job_id", pa.string()),
+        ("title", pa.string()),
+        ("company", dictionary),
+        ("location", dictionary),
+        ("description", pa.string()),
+        ("url", pa.string()),
+        ("easy_apply", pa.bool_()),
+        ("date_posted", pa.string()),
+        ("posted_on", pa.string()),
+        ("search_query", dictionary),
+        ("scraped_at", pa.string()),
+    ])
+
+
+class ParquetWriter:
+    """Streams jobs into a Parquet file, one row group per row_group_size jobs.
+
+    Only the current row group is held in memory. company, location and
+    search_query are dictionary-encoded. Parquet's footer is written on close(),
+    so unlike JSONL a crashed run leaves no readable file. Safe to share between threads.
+    """
+
+    def __init__(self, prefix="linkedin_jobs", row_group_size=1000, compression="zstd"):
+        if pa is None:
+            raise ValueError("Parquet output requires the 'pyarrow' package")
+        self.schema = _parquet_schema()
+        self.row_group_size = max(1, int(row_group_size))
+        self.path = f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet" # Original timestamp format
+        self.jobs_written = 0
+        self._rows = []
+        self.compression = compression
+        self._lock = threading.Lock()
+        self._writer = None  # Opened with the first row group, so empty runs leave no file
+
+    @classmethod
+    def from_config(cls, output_config):
+        """Builds a writer from the "output" config section (its "parquet" sub-section)."""
+        parquet_config = (output_config or {}).get("parquet", {})
+        return cls(row_group_size=parquet_config.get("row_group_size", 1000),
+                   compression=parquet_config.get("compression", "zstd"))
+
+    def _write_row_group(self):
+        columns = {}
+        for name in PARQUET_STRING_COLUMNS + PARQUET_DICTIONARY_COLUMNS:
+            columns[name] = [None if job.get(name) is None else str(job[name]) for job in self._rows]
+        columns["easy_apply"] = [None if job.get("easy_apply") is None else bool(job["easy_apply"])
+                                 for job in self._rows]
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, self.schema, compression=self.compression,
+                                            use_dictionary=list(PARQUET_DICTIONARY_COLUMNS))
+            logging.info(f"Streaming job data to {self.path}")
+        self._writer.write_table(pa.Table.from_pydict(columns, schema=self.schema))
+        self.jobs_written += len(self._rows)
+        self._rows = []
+
+    def write(self, job):
+        with self._lock:
+            self._rows.append(job)
+            if len(self._rows) >= self.row_group_size:
+                self._write_row_group()
+
+    def write_many(self, jobs):
+        for job in jobs:
+            self.write(job)
+
+    def flush(self):
+        """No-op: row groups are only written once full, to keep them large."""
+
+    def close(self):
+        with self._lock:
+            if self._rows:
+                self._write_row_group()
+            if self._writer is None:
+                return
+            self._writer.close()
+            self._writer = None
+        logging.info(f"Job data saved to {self.path} ({self.jobs_written} jobs)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class JsonArrayWriter:
+    """Streams jobs into the original "json" output: one indented JSON array per run.
+
+    Each job is appended as it arrives, producing the same text as the original
+    json.dump(job_data, indent=2); the closing bracket is written by close().
+    """
+
+    def __init__(self, prefix="linkedin_jobs"):
+        self.path = f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json" # Original filename format
+        self.jobs_written = 0
+        self._file = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, output_config):
+        return cls()
+
+    def write(self, job):
+        item = json.dumps(job, indent=2, ensure_ascii=False).replace("\n", "\n  ") # Original dump settings
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "w", encoding="utf-8")
+                self._file.write("[\n  " + item)
+            else:
+                self._file.write(",\n  " + item)
+            self.jobs_written += 1
+
+    def write_many(self, jobs):
+        for job in jobs:
+            self.write(job)
+
+    def flush(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write("\n]")
+            self._file.close()
+            self._file = None
+        logging.info(f"Job data saved to {self.path}") # Original log
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class TxtWriter:
+    """Streams jobs into the original human-readable "txt" output."""
+
+    def __init__(self, prefix="linkedin_jobs"):
+        self.path = f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt" # Original filename format
+        self.jobs_written = 0
+        self._file = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, output_config):
+        return cls()
+
+    def write(self, job):
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "w", encoding="utf-8")
+            f = self._file
+            # Original writing logic
+            f.write(f"Title: {job.get('title', 'Unknown')}\n")
+            f.write(f"Company: {job.get('company', 'Unknown')}\n")
+            f.write(f"Location: {job.get('location', 'Unknown')}\n")
+            f.write(f"Posted: {job.get('date_posted', 'Unknown')}\n")
+            f.write(f"URL: {job.get('url', '')}\n")
+            # Original description slicing and formatting
+            f.write(f"Description: {job.get('description', 'No description available')[:500]}...\n")
+            f.write("\n" + "-" * 80 + "\n\n")
+            self.jobs_written += 1
+
+    def write_many(self, jobs):
+        for job in jobs:
+            self.write(job)
+
+    def flush(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._file = None
+        logging.info(f"Job data saved to {self.path}") # Original log
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+# file_format -> writer; every writer takes jobs as they are scraped (write/write_many/flush/close)
+OUTPUT_WRITERS = {
+    "json": JsonArrayWriter,
+    "txt": TxtWriter,
+    "jsonl": JsonlWriter,
+    "parquet": ParquetWriter,
+    "sqlite": JobStore,
+}
+
+
+def open_output_writer(file_format, output_config=None):
+    """Returns the writer for file_format, or None if the format is unknown.
+
+    Raises ValueError when the format needs an optional package that is missing.
+    """
+    writer_class = OUTPUT_WRITERS.get(file_format.lower())
+    return writer_class.from_config(output_config) if writer_class else None
+
+
 # Directly copied from the provided code
-def save_results(job_data, file_format="json"):
-    """Saves the scraped job data to a file."""
+def save_results(job_data, file_format="json", output_config=None):
+    """Saves the scraped job data to a file.
+
+    Any format in OUTPUT_WRITERS works; writer options come from output_config.
+    """
     if not job_data:
         logging.warning("No job data to save.") # Original log
         return False
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S") # Original format
-
-    if file_format.lower() == "json":
-        filename = f"linkedin_jobs_{timestamp}.json" # Original filename format
-        try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(job_data, f, indent=2, ensure_ascii=False) # Original dump settings
-            logging.info(f"Job data saved to {filename}") # Original log
-            return True
-        except Exception as e:
-            logging.error(f"Error saving job data to JSON: {e}") # Original log
-            return False
-    elif file_format.lower() == "txt":
-        filename = f"linkedin_jobs_{timestamp}.txt" # Original filename format
-        try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                for job in job_data: # Original iteration and writing logic
-                    f.write(f"Title: {job.get('title', 'Unknown')}\n")
-                    f.write(f"Company: {job.get('company', 'Unknown')}\n")
-                    f.write(f"Location: {job.get('location', 'Unknown')}\n")
-                    f.write(f"Posted: {job.get('date_posted', 'Unknown')}\n")
-                    f.write(f"URL: {job.get('url', '')}\n")
-                    # Original description slicing and formatting
-                    f.write(f"Description: {job.get('description', 'No description available')[:500]}...\n")
-                    f.write("\n" + "-" * 80 + "\n\n")
-            logging.info(f"Job data saved to {filename}") # Original log
-            return True
-        except Exception as e:
-            logging.error(f"Error saving job data to TXT: {e}") # Original log
-            return False
-    else:
+    try:
+        writer = open_output_writer(file_format, output_config)
+    except ValueError as e:
+        logging.error(f"Cannot save job data as {file_format}: {e}")
+        return False
+    if writer is None:
         logging.error(f"Unsupported file format: {file_format}") # Original log
-        return False
\ No newline at end of file
+        return False
+
+    try:
+        with writer:
+            writer.write_many(job_data)
+        return True
+    except Exception as e:
+        logging.error(f"Error saving job data to {file_format.upper()}: {e}") # Original log
+        return False
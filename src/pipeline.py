@@ -0,0 +1,301 @@
+# src/pipeline.py
+import time
+import queue
+import logging
+import threading
+from datetime import datetime
+
+from .linkedin_actions.scrape import iter_jobs, fetch_job_view_details
+from .linkedin_actions.predicates import rejection_reason
+from .linkedin_actions.session import login_with_session_cache
+
+# Marks the end of a stage's input; one is queued per downstream worker
+_END = object()
+
+
+class StageStats:
+    """Per-stage counters used for the throughput report."""
+
+    def __init__(self, name, workers):
+        self.name = name
+        self.workers = workers
+        self.items_in = 0
+        self.items_out = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.started_at = None
+        self.finished_at = None
+        self._lock = threading.Lock()
+
+    def record(self, emitted, busy_seconds, failed=False):
+        with self._lock:
+            self.items_in += 1
+            self.items_out += 1 if emitted else 0
+            self.errors += 1 if failed else 0
+            self.busy_seconds += busy_seconds
+
+    def summary(self):
+        elapsed = (self.finished_at or time.monotonic()) - (self.started_at or time.monotonic())
+        rate = self.items_out / elapsed if elapsed > 0 else 0.0
+        return (f"Stage '{self.name}' ({self.workers} worker(s)): {self.items_in} in, {self.items_out} out, "
+                f"{self.errors} errors, {rate:.2f} items/s over {elapsed:.1f}s, busy {self.busy_seconds:.1f}s")
+
+
+class Pipeline:
+    """Runs a source generator and a chain of stages on threads connected by bounded queues.
+
+    Every stage function takes one item and returns the item to pass on, or None
+    to drop it. A full queue blocks its producer (backpressure), so a slow stage
+    throttles the ones in front of it instead of letting items pile up in memory.
+    """
+
+    def __init__(self, name="pipeline", queue_size=50, stop_event=None):
+        self.name = name
+        self.queue_size = queue_size
+        self.stop_event = stop_event or threading.Event()  # Set it to stop the source early
+        self._source = None
+        self._stages = []  # dicts: name, func, workers, on_worker_exit, stats
+
+    def source(self, name, iterable_factory):
+        """Sets the producer: a callable returning an iterable of items (run on its own thread)."""
+        self._source = {"name": name, "factory": iterable_factory, "stats": StageStats(name, 1)}
+        return self
+
+    def stage(self, name, func, workers=1, on_worker_exit=None):
+        """Appends a stage; on_worker_exit runs on each worker thread as it finishes."""
+        self._stages.append({
+            "name": name,
+            "func": func,
+            "workers": max(1, int(workers)),
+            "on_worker_exit": on_worker_exit,
+            "stats": StageStats(name, max(1, int(workers))),
+        })
+        return self
+
+    def run(self):
+        """Runs until the source is exhausted and every item has left the last stage."""
+        if self._source is None:
+            raise ValueError("Pipeline has no source")
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self._stages]
+        threads = []
+
+        source_thread = threading.Thread(
+            target=self._run_source, args=(queues[0] if queues else None,), name=f"{self.name}-source", daemon=True)
+        threads.append(source_thread)
+
+        for position, stage in enumerate(self._stages):
+            inbox = queues[position]
+            outbox = queues[position + 1] if position + 1 < len(queues) else None
+            remaining = {"count": stage["workers"], "lock": threading.Lock()}
+            for worker in range(stage["workers"]):
+                threads.append(threading.Thread(
+                    target=self._run_worker, args=(position, stage, inbox, outbox, remaining),
+                    name=f"{self.name}-{stage['name']}-{worker}", daemon=True))
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for stats in [self._source["stats"]] + [stage["stats"] for stage in self._stages]:
+            logging.info(stats.summary())
+
+    def _downstream_workers(self, position):
+        """Number of workers reading the queue after stage `position` (-1 is the source)."""
+        following = position + 1
+        return self._stages[following]["workers"] if following < len(self._stages) else 0
+
+    def _run_source(self, outbox):
+        stats = self._source["stats"]
+        stats.started_at = time.monotonic()
+        try:
+            iterator = iter(self._source["factory"]())
+            while not self.stop_event.is_set():
+                started = time.monotonic()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                stats.record(True, time.monotonic() - started)
+                if outbox is not None:
+                    outbox.put(item)
+        except Exception as e:
+            logging.error(f"Pipeline source '{self._source['name']}' failed: {e}", exc_info=True)
+        finally:
+            stats.finished_at = time.monotonic()
+            if outbox is not None:
+                for _ in range(self._downstream_workers(-1)):
+                    outbox.put(_END)
+
+    def _run_worker(self, position, stage, inbox, outbox, remaining):
+        stats = stage["stats"]
+        if stats.started_at is None:
+            stats.started_at = time.monotonic()
+        try:
+            while True:
+                item = inbox.get()
+                if item is _END:
+                    break
+                started = time.monotonic()
+                result, failed = None, False
+                try:
+                    result = stage["func"](item)
+                except Exception as e:
+                    failed = True
+                    logging.error(f"Pipeline stage '{stage['name']}' failed on an item: {e}")
+                stats.record(result is not None, time.monotonic() - started, failed)
+                if result is not None and outbox is not None:
+                    outbox.put(result)
+        finally:
+            if stage["on_worker_exit"]:
+                try:
+                    stage["on_worker_exit"]()
+                except Exception as e:
+                    logging.warning(f"Pipeline stage '{stage['name']}' cleanup failed: {e}")
+            with remaining["lock"]:
+                remaining["count"] -= 1
+                last_worker = remaining["count"] == 0
+            if last_worker:
+                stats.finished_at = time.monotonic()
+                if outbox is not None:
+                    for _ in range(self._downstream_workers(position)):
+                        outbox.put(_END)
+
+
+class _DetailFetcher:
+    """Detail-extractor stage: each worker thread logs in its own pooled driver on first use."""
+
+    def __init__(self, driver_pool, email, password, session_config, http_fetcher=None):
+        self.driver_pool = driver_pool
+        self.http_fetcher = http_fetcher
+        self.email = email
+        self.password = password
+        self.session_config = session_config
+        self._local = threading.local()
+
+    def _driver(self):
+        driver = getattr(self._local, "driver", None)
+        if driver is None:
+            driver = self.driver_pool.acquire(timeout=60)
+            if driver is None:
+                raise RuntimeError("No WebDriver available for detail extraction")
+            if not login_with_session_cache(driver, self.email, self.password, self.session_config):
+                self.driver_pool.release(driver)
+                raise RuntimeError("Detail worker could not log in")
+            self._local.driver = driver
+        return driver
+
+    def __call__(self, card):
+        if self.http_fetcher is not None:
+            job_info = self.http_fetcher.fetch(card)
+            if job_info is not None:
+                return job_info
+        return fetch_job_view_details(self._driver(), card)
+
+    def release(self):
+        driver = getattr(self._local, "driver", None)
+        if driver is not None:
+            self.driver_pool.release(driver)
+            self._local.driver = None
+
+
+def scrape_with_pipeline(driver, driver_pool, email, password, config, sink, seen_index=None, http_fetcher=None,
+                         stop_event=None):
+    """Crawls result pages, extracts details, enriches and saves jobs as overlapping stages.
+
+    The crawler walks the result pages on `driver` and only harvests list cards;
+    up to "detail_workers" pooled drivers load the job view pages in parallel, and
+    `sink(job)` receives each finished job. When the pool has no driver to spare
+    besides the crawler's, the crawler extracts details itself. Per-stage
+    throughput is logged at the end. An http_fetcher, if given, is tried before
+    a detail worker touches its browser. seen_index is only read; setting
+    stop_event stops the crawl early.
+    """
+    scraping_config = config.get("scraping", {})
+    pipeline_config = scraping_config.get("pipeline", {})
+    dedup_config = config.get("dedup", {})
+    criteria = dict(config.get("job_filters", {}))
+    criteria.setdefault("easy_apply_only", scraping_config.get("easy_apply_only", True))
+    wants_details = scraping_config.get("mode", "details") != "list"
+
+    # The detail stage needs drivers of its own; the crawler's can't be shared across threads
+    detail_workers = 0
+    if wants_details:
+        detail_workers = min(max(1, int(pipeline_config.get("detail_workers", 2))), driver_pool.spare())
+        if detail_workers == 0:
+            logging.warning("No spare WebDriver for detail workers. The crawler extracts details itself.")
+    crawl_mode = "list" if detail_workers else scraping_config.get("mode", "details")
+
+    def crawl():
+        return iter_jobs(driver,
+                         max_pages=scraping_config.get("max_pages", 1),
+                         easy_apply_only=criteria["easy_apply_only"],
+                         mode=crawl_mode,
+                         job_filters=criteria,
+                         seen_index=seen_index,
+                         incremental=dedup_config.get("incremental", False),
+                         stop_known_ratio=dedup_config.get("stop_known_ratio", 0.8),
+                         detail_tabs=1 if detail_workers else scraping_config.get("detail_tabs", 1),
+                         http_fetcher=None if detail_workers else http_fetcher)
+
+    def enrich(job_info):
+        reason = rejection_reason(job_info, criteria)
+        if reason:
+            logging.info(f"Job {job_info.get('job_id')}: Skipping, {reason}")
+            return None
+        job_info["scraped_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return job_info
+
+    def save(job_info):
+        sink(job_info)
+        return job_info
+
+    pipeline = Pipeline("scrape", queue_size=pipeline_config.get("queue_size", 50), stop_event=stop_event)
+    pipeline.source("crawl", crawl)
+    if detail_workers:
+        fetcher = _DetailFetcher(driver_pool, email, password, config.get("session", {}), http_fetcher)
+        pipeline.stage("details", fetcher, workers=detail_workers, on_worker_exit=fetcher.release)
+    pipeline.stage("enrich", enrich)
+    pipeline.stage("sink", save)
+    pipeline.run()
+
+
+def iter_pipeline_jobs(driver, driver_pool, email, password, config, seen_index=None, http_fetcher=None):
+    """Runs scrape_with_pipeline on a background thread and yields each job as its sink stage receives it.
+
+    For callers that consume an iterable of jobs (see query_planner.run_query_plan):
+    they save every job while the crawl and detail stages keep running. Closing
+    the generator early stops the crawl; jobs still in flight are dropped.
+    """
+    queue_size = config.get("scraping", {}).get("pipeline", {}).get("queue_size", 50)
+    handoff = queue.Queue(maxsize=queue_size)
+    stop_event = threading.Event()
+
+    def hand_off(job):
+        while not stop_event.is_set():
+            try:
+                handoff.put(job, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    def run():
+        try:
+            scrape_with_pipeline(driver, driver_pool, email, password, config, hand_off,
+                                 seen_index=seen_index, http_fetcher=http_fetcher, stop_event=stop_event)
+        except Exception as e:
+            logging.error(f"Pipeline failed: {e}", exc_info=True)
+        finally:
+            hand_off(_END)
+
+    thread = threading.Thread(target=run, name="scrape-pipeline", daemon=True)
+    thread.start()
+    try:
+        while True:
+            job = handoff.get()
+            if job is _END:
+                break
+            yield job
+    finally:
+        stop_event.set()
+        thread.join()
@@ -0,0 +1,158 @@
+# src/query_planner.py
+import time
+import logging
+from itertools import product
+
+from .linkedin_actions.navigation import navigate_to_jobs_page
+from .linkedin_actions.search_filter import search_via_url, perform_job_search, apply_filters
+from .utils.helpers import human_delay
+
+
+def _as_list(value):
+    if value is None:
+        return [None]
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+def _make_query(keywords, location, base_filters, filter_overrides=None):
+    filters = dict(base_filters or {})
+    filters.update(filter_overrides or {})
+    query = {
+        "keywords": keywords,
+        "location": location,
+        "date_posted": filters.get("date_posted"),
+        "experience_level": list(filters.get("experience_level") or []),
+    }
+    parts = [keywords or "(any)", location or "(anywhere)"]
+    if filter_overrides:
+        parts.append(", ".join(f"{key}={value}" for key, value in sorted(filter_overrides.items())))
+    query["label"] = " | ".join(str(part) for part in parts)
+    return query
+
+
+def _query_key(query):
+    return (query["keywords"], query["location"], query["date_posted"], tuple(sorted(query["experience_level"])))
+
+
+def plan_queries(search_criteria, filters=None):
+    """Expands the "search_criteria" config section into the list of searches to run.
+
+    Accepts the original single {"keywords", "location"} block, a list of such
+    blocks (each may carry its own "filters" overrides), or a matrix whose
+    "keywords", "locations"/"location" and "filters" entries are lists; the
+    matrix runs every combination. Per-query filters override the top-level
+    "filters" section. Identical searches are only planned once.
+    """
+    if isinstance(search_criteria, dict):
+        blocks = [search_criteria]
+    else:
+        blocks = list(search_criteria or [])
+
+    queries, planned = [], set()
+    for block in blocks:
+        keywords = _as_list(block.get("keywords"))
+        locations = _as_list(block.get("locations", block.get("location")))
+        overrides = block.get("filters")
+        overrides = overrides if isinstance(overrides, list) else [overrides]
+        for keyword, location, override in product(keywords, locations, overrides):
+            query = _make_query(keyword, location, filters, override)
+            if _query_key(query) in planned:
+                continue
+            planned.add(_query_key(query))
+            queries.append(query)
+    return queries
+
+
+def open_search(driver, query, easy_apply_only=False):
+    """Loads the results for one planned query: straight from the search URL, else via the form and filter UI.
+
+    With easy_apply_only the search URL asks LinkedIn for Easy Apply jobs only (f_AL).
+    """
+    if search_via_url(driver, query["keywords"], query["location"],
+                      date_posted=query["date_posted"], experience_levels=query["experience_level"],
+                      easy_apply_only=easy_apply_only):
+        return True
+    logging.info("Direct search URL failed. Falling back to the search form.")
+
+    if not navigate_to_jobs_page(driver):
+        logging.error("Failed to navigate to Jobs page.")
+        return False
+    # Wait for any onboarding dialogs to disappear (original explicit delay)
+    human_delay(2.0, 4.0)
+    if not perform_job_search(driver, query["keywords"], query["location"]):
+        logging.error("Failed to perform job search.")
+        return False
+    apply_filters(driver, date_posted=query["date_posted"], experience_levels=query["experience_level"])
+    return True
+
+
+class QueryStats:
+    """Yield of one planned query, for the end-of-run report."""
+
+    def __init__(self, label):
+        self.label = label
+        self.opened = False
+        self.scraped = 0
+        self.duplicates = 0
+        self.known = 0  # Skipped by the seen index: saved by an earlier run or an earlier query
+        self.seconds = 0.0
+
+    @property
+    def new(self):
+        return self.scraped - self.duplicates
+
+    def summary(self):
+        if not self.opened:
+            return f"Query '{self.label}': search could not be loaded"
+        return (f"Query '{self.label}': {self.scraped} scraped, {self.new} new, "
+                f"{self.duplicates} duplicates of earlier queries, {self.known} skipped as already seen, "
+                f"{self.seconds:.1f}s")
+
+
+def _job_key(job):
+    return job.get("job_id") or job.get("url")
+
+
+def run_query_plan(driver, queries, scrape_query, sink, seen_index=None, easy_apply_only=False):
+    """Runs the planned queries back to back in the driver's logged-in session.
+
+    scrape_query(driver, query) scrapes the currently loaded results and returns
+    an iterable of jobs. Each job is passed to sink(job) once, even when several
+    queries return it. Given the seen_index the scrapers skip against, the jobs
+    it filtered out are reported per query as "skipped as already seen" (with
+    dedup on, that includes jobs an earlier query of this run saved).
+    easy_apply_only is passed to open_search. Logs and returns the per-query QueryStats.
+    """
+    emitted = set()
+    all_stats = []
+    for number, query in enumerate(queries, 1):
+        stats = QueryStats(query["label"])
+        all_stats.append(stats)
+        logging.info(f"--- Query {number}/{len(queries)}: {query['label']} ---")
+        started = time.monotonic()
+        known_before = seen_index.hits if seen_index is not None else 0
+        try:
+            if not open_search(driver, query, easy_apply_only=easy_apply_only):
+                continue
+            stats.opened = True
+            for job in scrape_query(driver, query):
+                stats.scraped += 1
+                key = _job_key(job)
+                if key in emitted:
+                    stats.duplicates += 1
+                    continue
+                if key:
+                    emitted.add(key)
+                job["search_query"] = query["label"]
+                sink(job)
+        except Exception as e:
+            logging.error(f"Query '{query['label']}' failed: {e}")
+        finally:
+            stats.seconds = time.monotonic() - started
+            if seen_index is not None:
+                stats.known = seen_index.hits - known_before
+
+    for stats in all_stats:
+        logging.info(stats.summary())
+    logging.info(f"{len(queries)} queries produced {len(emitted)} unique jobs.")
+    return all_stats
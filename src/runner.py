@@ -0,0 +1,125 @@
+# src/runner.py
+import logging
+
+from .config_loader import DEFAULT_CONFIG
+from .driver_setup import DriverPool
+from .linkedin_actions.session import login_with_session_cache
+from .linkedin_actions.scrape import iter_jobs
+from .linkedin_actions.network_capture import iter_captured_jobs
+from .seen_jobs import SeenJobsIndex, mark_seen_when_saved, stop_marking_seen
+from .pipeline import iter_pipeline_jobs
+from .http_fetcher import HttpJobFetcher
+from .query_planner import run_query_plan
+from .utils.page_load_stats import summarize_page_loads
+from .utils.pacing import get_pacer
+
+
+def scrape_session(config, email, password, queries, sink, driver_pool=None):
+    """Logs in once and runs every planned query in that browser session.
+
+    Each scraped job is passed to sink(job) as soon as it is ready; jobs found
+    by several queries are passed once. Pass a ``DriverPool`` to reuse warm
+    Chrome instances across batch runs; otherwise a pool is created from the
+    "driver" config and shut down at the end. Returns the number of jobs
+    emitted, or None if the session could not be started (no driver, failed
+    login, no search could be loaded).
+    """
+    pacer = get_pacer()
+
+    # Setup WebDriver, reusing a warm instance from the pool when one is available
+    owns_pool = driver_pool is None
+    scraping_config = config.get("scraping", DEFAULT_CONFIG["scraping"])
+    pipeline_config = scraping_config.get("pipeline", {})
+    if owns_pool:
+        driver_config = dict(config.get("driver", DEFAULT_CONFIG["driver"]))
+        if scraping_config.get("mode") == "network":
+            driver_config["capture_network"] = True  # Network mode reads the performance log
+        if pipeline_config.get("enabled", False):
+            # The crawler keeps one driver; every detail worker needs its own
+            driver_config["pool_size"] = max(driver_config.get("pool_size", 1),
+                                             1 + pipeline_config.get("detail_workers", 2))
+        driver_pool = DriverPool.from_config(driver_config)
+    driver = driver_pool.acquire()
+    if not driver:
+        if owns_pool:
+            driver_pool.close()
+        logging.critical("Failed to initialize WebDriver. Exiting.") # Original log
+        return None
+
+    seen_index = None
+    http_fetcher = None
+    output = sink
+    try:
+        # Login to LinkedIn, reusing a cached session when it is still valid
+        session_config = config.get("session", DEFAULT_CONFIG["session"])
+        if not login_with_session_cache(driver, email, password, session_config):
+            logging.critical("Login failed. Exiting.") # Original log
+            return None
+
+        # Skip jobs earlier runs already scraped (dedup.enabled)
+        dedup_config = config.get("dedup", DEFAULT_CONFIG["dedup"])
+        seen_index = SeenJobsIndex.from_config(dedup_config)
+        if seen_index is not None:
+            pacer.add_idle_hook("seen_index_flush", seen_index.flush) # Commit new IDs during pacing pauses
+            if not seen_index.read_only:
+                # Sharded workers only read the index; their coordinator marks what it saves
+                sink = mark_seen_when_saved(output, seen_index)
+
+        if hasattr(output, "flush"):
+            # Hand what is scraped so far to the outputs (and so mark it seen) during pacing pauses
+            pacer.add_idle_hook("output_flush", output.flush)
+
+        # Optionally download job pages over HTTP with the session cookies instead of rendering them
+        http_config = scraping_config.get("http_details", {})
+        http_fetcher = HttpJobFetcher.from_driver(driver, http_config) if http_config.get("enabled", False) else None
+
+        def scrape_query(driver, query):
+            if scraping_config.get("mode") == "network":
+                # Read jobs from the JSON API responses the page loads instead of the DOM
+                return iter_captured_jobs(driver,
+                                          max_pages=scraping_config.get("max_pages", 1),
+                                          easy_apply_only=scraping_config.get("easy_apply_only", True),
+                                          job_filters=config.get("job_filters", DEFAULT_CONFIG["job_filters"]),
+                                          seen_index=seen_index)
+            if pipeline_config.get("enabled", False):
+                # Crawl, detail extraction and enrichment run as overlapping stages, and
+                # every finished job reaches the sink while the crawl goes on
+                return iter_pipeline_jobs(driver, driver_pool, email, password, config,
+                                          seen_index=seen_index, http_fetcher=http_fetcher)
+            # Scrape jobs across up to scraping.max_pages result pages
+            return iter_jobs(driver,
+                             max_pages=scraping_config.get("max_pages", 1),
+                             easy_apply_only=scraping_config.get("easy_apply_only", True),
+                             mode=scraping_config.get("mode", "details"),
+                             job_filters=config.get("job_filters", DEFAULT_CONFIG["job_filters"]),
+                             seen_index=seen_index,
+                             incremental=dedup_config.get("incremental", False),
+                             stop_known_ratio=dedup_config.get("stop_known_ratio", 0.8),
+                             detail_tabs=scraping_config.get("detail_tabs", 1),
+                             http_fetcher=http_fetcher)
+
+        # Run every query in this logged-in session; jobs found by several queries are kept once
+        query_stats = run_query_plan(driver, queries, scrape_query, sink, seen_index=seen_index,
+                                     easy_apply_only=scraping_config.get("easy_apply_only", True))
+        if not any(stats.opened for stats in query_stats):
+            logging.critical("None of the planned searches could be loaded. Exiting.")
+            return None
+        return sum(stats.new for stats in query_stats)
+    finally:
+        pacer.drain_idle_tasks()
+        pacer.remove_idle_hook("output_flush")
+        if seen_index is not None:
+            pacer.remove_idle_hook("seen_index_flush")
+            if not seen_index.read_only:
+                stop_marking_seen(output)
+            seen_index.close()
+        if http_fetcher is not None:
+            http_fetcher.close()
+        pacer.log_idle_summary()
+        # Hand the driver back to the pool; it is only quit when the pool owns its lifetime
+        logging.info("Releasing WebDriver.")
+        driver_pool.release(driver)
+        if owns_pool:
+            driver_pool.close()
+        driver_settings = config.get("driver", DEFAULT_CONFIG["driver"])
+        summarize_page_loads(driver_settings.get("profile", "default"), driver_settings.get("page_load_stats_file"))
@@ -0,0 +1,166 @@
+# src/seen_jobs.py
+import os
+import math
+import sqlite3
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from urllib.request import pathname2url
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings, sized for an expected item count and false-positive rate."""
+
+    def __init__(self, expected_items=100000, false_positive_rate=0.01):
+        expected_items = max(1, int(expected_items))
+        self.num_bits = max(8, int(-expected_items * math.log(false_positive_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / expected_items * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, item):
+        # Double hashing: k positions derived from two 64-bit halves of one digest
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class SeenJobsIndex:
+    """Persistent set of LinkedIn job IDs that earlier runs already scraped.
+
+    IDs live in SQLite; an in-memory Bloom filter answers most "never seen"
+    lookups without touching the database. Safe to share between threads.
+    New IDs are committed in batches of commit_every, or earlier by flush().
+    The database runs in WAL mode, so other processes can read it while one
+    writes. A read_only index (as used by sharded workers, see
+    src/coordinator.py) never writes; add() does nothing.
+    """
+
+    commit_every = 50
+
+    busy_timeout = 30  # Seconds to wait for another process's write lock
+
+    def __init__(self, db_path, expected_items=100000, false_positive_rate=0.01, read_only=False):
+        self.db_path = db_path
+        self.read_only = read_only
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.hits = 0  # Lookups that found a known ID, i.e. jobs skipped as already seen
+        if read_only:
+            # The writer (the coordinating process) has created the table already
+            uri = "file:" + pathname2url(os.path.abspath(db_path)) + "?mode=ro"
+            self.conn = sqlite3.connect(uri, uri=True, timeout=self.busy_timeout, check_same_thread=False)
+        else:
+            directory = os.path.dirname(db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self.conn = sqlite3.connect(db_path, timeout=self.busy_timeout, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS seen_jobs ("
+                "job_id TEXT PRIMARY KEY, first_seen TEXT NOT NULL, last_seen TEXT NOT NULL)"
+            )
+            self.conn.commit()
+
+        count = self.conn.execute("SELECT COUNT(*) FROM seen_jobs").fetchone()[0]
+        self.bloom = BloomFilter(max(expected_items, count * 2), false_positive_rate)
+        for (job_id,) in self.conn.execute("SELECT job_id FROM seen_jobs"):
+            self.bloom.add(job_id)
+        logging.info(f"Loaded {count} known job IDs from {db_path}")
+
+    @classmethod
+    def from_config(cls, dedup_config):
+        """Opens the index described by the "dedup" config section, or returns None when disabled."""
+        dedup_config = dedup_config or {}
+        if not dedup_config.get("enabled", False):
+            return None
+        return cls(dedup_config.get("db_path", "seen_jobs.sqlite3"),
+                   expected_items=dedup_config.get("expected_items", 100000),
+                   read_only=dedup_config.get("read_only", False))
+
+    def __contains__(self, job_id):
+        if not job_id:
+            return False
+        job_id = str(job_id)
+        if job_id not in self.bloom:
+            return False
+        # Possible false positive: confirm against the database
+        with self._lock:
+            row = self.conn.execute("SELECT 1 FROM seen_jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if row is not None:
+                self.hits += 1
+        return row is not None
+
+    def add(self, job_id):
+        """Marks a job ID as seen (refreshing last_seen if it already was)."""
+        if not job_id or self.read_only:
+            return
+        job_id = str(job_id)
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._lock:
+            self.conn.execute(
+                "INSERT INTO seen_jobs (job_id, first_seen, last_seen) VALUES (?, ?, ?) "
+                "ON CONFLICT(job_id) DO UPDATE SET last_seen = excluded.last_seen",
+                (job_id, now, now),
+            )
+            self.bloom.add(job_id)
+            self._pending += 1
+            if self._pending >= self.commit_every:
+                self.conn.commit()
+                self._pending = 0
+
+    def flush(self):
+        """Commits IDs added since the last commit."""
+        with self._lock:
+            if self._pending:
+                self.conn.commit()
+                self._pending = 0
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def mark_seen_when_saved(sink, seen_index):
+    """Makes sure a job's ID is only marked as seen once the job has been saved.
+
+    A FanOutSink reports the jobs its file_format output has written and
+    flushed (see FanOutSink.on_saved); with no output at all nothing is
+    marked. A plain sink(job) function has saved the job when it returns.
+    A job that fails to save stays unseen and is scraped again next run.
+    Returns the sink to pass jobs to.
+    """
+    if hasattr(sink, "on_saved"):
+        def mark(jobs):
+            for job in jobs:
+                seen_index.add(job.get("job_id"))
+        if not sink.on_saved(mark):
+            logging.info("No output configured; jobs are not marked as seen.")
+        return sink
+
+    def save(job):
+        sink(job)
+        seen_index.add(job.get("job_id"))
+    return save
+
+
+def stop_marking_seen(sink):
+    """Waits until the jobs handed to sink are saved and marked, so the seen index can be closed."""
+    if hasattr(sink, "on_saved"):
+        sink.flush(wait=True)
+        sink.on_saved(None)
@@ -0,0 +1,300 @@
+# src/sinks.py
+import re
+import sys
+import json
+import time
+import queue
+import logging
+import threading
+from datetime import datetime
+
+import urllib3
+
+from .output_handler import open_output_writer
+
+# Control messages for a sink's worker thread
+_FLUSH = object()
+_CLOSE = object()
+
+# Shortest flush interval; 0 would make the worker thread spin
+MIN_FLUSH_SECONDS = 0.1
+
+
+class StdoutSink:
+    """Prints every job as one JSON line on stdout (logging goes to stderr)."""
+
+    def write_many(self, jobs):
+        for job in jobs:
+            sys.stdout.write(json.dumps(job, ensure_ascii=False) + "\n")
+
+    def flush(self):
+        sys.stdout.flush()
+
+    def close(self):
+        self.flush()
+
+
+class WebhookSink:
+    """POSTs batches of jobs as {"jobs": [...]} to an HTTP endpoint over pooled connections."""
+
+    def __init__(self, url, pool_size=2, timeout=10, retries=3, headers=None):
+        self.url = url
+        self.timeout = timeout
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+        retry = urllib3.Retry(total=retries, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504],
+                              allowed_methods=frozenset({"POST"}))
+        self.http = urllib3.PoolManager(maxsize=pool_size, retries=retry)
+
+    def write_many(self, jobs):
+        if not jobs:
+            return
+        body = json.dumps({"jobs": jobs}, ensure_ascii=False).encode("utf-8")
+        response = self.http.request("POST", self.url, body=body, headers=self.headers, timeout=self.timeout)
+        if response.status >= 300:
+            raise RuntimeError(f"Webhook {self.url} answered {response.status}")
+
+    def flush(self):
+        """No-op: every batch is delivered by its own request."""
+
+    def close(self):
+        self.http.clear()
+
+
+class AsyncBatchingSink:
+    """Feeds a sink from its own thread in batches, so a slow sink doesn't stall scraping.
+
+    write() only queues the job. The worker thread hands the sink batches of
+    batch_size jobs (or whatever has arrived after flush_seconds) and flushes
+    it every flush_seconds. Up to max_pending jobs may wait; beyond that write()
+    blocks until the sink catches up rather than dropping jobs.
+
+    A batch the sink fails to take is appended to a JSON Lines spill file
+    (linkedin_jobs_unsaved_<name>_<timestamp>.jsonl, which src/compaction.py
+    picks up), so no job is silently lost. on_saved(jobs), if set, is called
+    from the worker thread with the jobs the sink has written and flushed.
+    """
+
+    def __init__(self, name, sink, batch_size=50, flush_seconds=5.0, max_pending=10000, spill_prefix="linkedin_jobs"):
+        self.name = name
+        self.sink = sink
+        self.batch_size = max(1, int(batch_size))
+        self.flush_seconds = max(MIN_FLUSH_SECONDS, float(flush_seconds))
+        self.spill_path = (f"{spill_prefix}_unsaved_{re.sub(r'[^A-Za-z0-9-]+', '-', name)}_"
+                           f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl")
+        self.jobs_written = 0
+        self.failed_batches = 0
+        self.jobs_spilled = 0
+        self.jobs_lost = 0
+        self.on_saved = None
+        self._unflushed = []  # Written since the last flush, not yet reported to on_saved
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._warned_full = False
+        self._thread = threading.Thread(target=self._run, name=f"sink-{name}", daemon=True)
+        self._thread.start()
+
+    def write(self, job):
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            if not self._warned_full:
+                logging.warning(f"Output sink '{self.name}' is falling behind; scraping waits for it.")
+                self._warned_full = True
+            self._queue.put(job)
+
+    def write_many(self, jobs):
+        for job in jobs:
+            self.write(job)
+
+    def flush(self, wait=False):
+        """Asks the worker to deliver and flush what it has; with wait, returns once it has.
+
+        Without wait this never blocks: a full queue means the worker is busy delivering anyway.
+        """
+        if not wait or not self._thread.is_alive():
+            try:
+                self._queue.put_nowait(_FLUSH)
+            except queue.Full:
+                pass
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def close(self):
+        """Delivers everything still queued, then closes the sink."""
+        self._queue.put(_CLOSE)
+        self._thread.join()
+
+    def _deliver(self, batch, flush):
+        if batch:
+            try:
+                self.sink.write_many(batch)
+                self.jobs_written += len(batch)
+                self._unflushed.extend(batch)
+            except Exception as e:
+                self.failed_batches += 1
+                logging.error(f"Output sink '{self.name}' failed to write {len(batch)} jobs: {e}")
+                self._spill(batch)
+        if flush:
+            saved, self._unflushed = self._unflushed, []
+            try:
+                self.sink.flush()
+            except Exception as e:
+                logging.error(f"Output sink '{self.name}' failed to flush: {e}")
+                return
+            if saved and self.on_saved is not None:
+                try:
+                    self.on_saved(saved)
+                except Exception as e:
+                    logging.error(f"Output sink '{self.name}': on_saved callback failed: {e}")
+
+    def _spill(self, batch):
+        try:
+            with open(self.spill_path, "a", encoding="utf-8") as f:
+                for job in batch:
+                    f.write(json.dumps(job, ensure_ascii=False) + "\n")
+            self.jobs_spilled += len(batch)
+            logging.warning(f"Kept {len(batch)} unsaved jobs in {self.spill_path}")
+        except Exception as e:
+            self.jobs_lost += len(batch)
+            logging.error(f"Could not keep {len(batch)} unsaved jobs in {self.spill_path}: {e}")
+
+    def _run(self):
+        batch = []
+        last_flush = time.monotonic()
+        while True:
+            timeout = max(0.0, self.flush_seconds - (time.monotonic() - last_flush))
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if item is _CLOSE:
+                break
+            waiter = item if isinstance(item, threading.Event) else None
+            if item is not None and item is not _FLUSH and waiter is None:
+                batch.append(item)
+            due = item is _FLUSH or waiter is not None or time.monotonic() - last_flush >= self.flush_seconds
+            if due or len(batch) >= self.batch_size:
+                self._deliver(batch, flush=due)
+                batch = []
+                if due:
+                    last_flush = time.monotonic()
+            if waiter is not None:
+                waiter.set()
+        self._deliver(batch, flush=True)
+        try:
+            self.sink.close()
+        except Exception as e:
+            logging.error(f"Output sink '{self.name}' failed to close: {e}")
+
+
+class FanOutSink:
+    """Sends every job to several sinks; callable, so it can be passed wherever a sink(job) function is expected."""
+
+    def __init__(self, sinks):
+        self.sinks = list(sinks)
+        self.jobs_received = 0
+
+    @property
+    def failed_batches(self):
+        """Batches some sink failed to write (they were spilled, see AsyncBatchingSink)."""
+        return sum(sink.failed_batches for sink in self.sinks)
+
+    def write(self, job):
+        self.jobs_received += 1
+        for sink in self.sinks:
+            sink.write(job)
+
+    __call__ = write
+
+    def write_many(self, jobs):
+        for job in jobs:
+            self.write(job)
+
+    def on_saved(self, callback):
+        """Has callback(jobs) called once the first sink (the file_format output) has saved them.
+
+        Pass None to stop. Returns False when there is no sink, so nothing is ever saved.
+        """
+        if not self.sinks:
+            return False
+        self.sinks[0].on_saved = callback
+        return True
+
+    def flush(self, wait=False):
+        for sink in self.sinks:
+            sink.flush(wait=wait)
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+            if sink.failed_batches:
+                logging.error(f"Output sink '{sink.name}': {sink.jobs_written} jobs written, "
+                              f"{sink.failed_batches} failed batches ({sink.jobs_spilled} jobs kept in "
+                              f"{sink.spill_path}, {sink.jobs_lost} lost)")
+            else:
+                logging.info(f"Output sink '{sink.name}': {sink.jobs_written} jobs written")
+
+
+def open_sink(sink_config, output_config=None):
+    """Builds the sink described by one "output.sinks" entry (without the batching wrapper).
+
+    Types: "file" (with "format": json, txt, jsonl, parquet), "sqlite",
+    "stdout" and "webhook" (with "url"). Raises ValueError for unknown types.
+    """
+    sink_type = sink_config.get("type", "file")
+    if sink_type == "file":
+        file_format = sink_config.get("format", "json")
+        writer = open_output_writer(file_format, output_config)
+        if writer is None:
+            raise ValueError(f"Unsupported file format: {file_format}")
+        return writer
+    if sink_type == "sqlite":
+        return open_output_writer("sqlite", {"sqlite": {"db_path": sink_config.get("db_path", "linkedin_jobs.sqlite3")}})
+    if sink_type == "stdout":
+        return StdoutSink()
+    if sink_type == "webhook":
+        if not sink_config.get("url"):
+            raise ValueError("A webhook sink needs a \"url\"")
+        return WebhookSink(sink_config["url"], pool_size=sink_config.get("pool_size", 2),
+                           timeout=sink_config.get("timeout", 10), headers=sink_config.get("headers"))
+    raise ValueError(f"Unknown output sink type: {sink_type}")
+
+
+def build_output_sinks(output_config):
+    """Builds the fan-out for the "output" config section.
+
+    With save_to_file the file_format output is the first sink ("sqlite" opens
+    the job store); every "sinks" entry adds another, each with its own
+    batch_size and flush_seconds. Raises if the file_format output can't be
+    opened; any other sink that can't be opened is logged and skipped.
+    """
+    output_config = output_config or {}
+    configs, primary = [], None
+    if output_config.get("save_to_file", True):
+        file_format = output_config.get("file_format", "json")
+        if file_format == "sqlite":
+            configs.append({"type": "sqlite",
+                            "db_path": output_config.get("sqlite", {}).get("db_path", "linkedin_jobs.sqlite3")})
+        else:
+            configs.append({"type": "file", "format": file_format})
+        primary = configs[0]
+    configs.extend(output_config.get("sinks") or [])
+
+    sinks = []
+    for sink_config in configs:
+        name = sink_config.get("name") or sink_config.get("format") or sink_config.get("type", "file")
+        try:
+            sink = open_sink(sink_config, output_config)
+        except Exception as e:
+            if sink_config is primary:
+                raise ValueError(f"Could not open the '{name}' output: {e}") from e
+            logging.error(f"Could not open output sink '{name}': {e}")
+            continue
+        sinks.append(AsyncBatchingSink(name, sink,
+                                       batch_size=sink_config.get("batch_size", 50),
+                                       flush_seconds=sink_config.get("flush_seconds", 5.0),
+                                       max_pending=sink_config.get("max_pending", 10000)))
+    if not output_config.get("save_to_file", True) and not sinks:
+        logging.info("File saving disabled in config.") # Added clarification
+    return FanOutSink(sinks)
@@ -1,22 +1,31 @@
 # src/utils/helpers.py
-import time
 import random
 
-# Directly copied from the provided code
+from .pacing import get_pacer
+
 def human_delay(min_seconds=1.0, max_seconds=3.0):
-    """Adds a random delay to mimic human behavior."""
-    time.sleep(random.uniform(min_seconds, max_seconds))
+    """Adds a random delay to mimic human behavior, scaled by the active pacing profile."""
+    get_pacer().jitter(min_seconds, max_seconds)
+
+# Performs all scroll steps inside the page so a human-like scroll costs one WebDriver round-trip
+_HUMAN_LIKE_SCROLL_JS = """
+var steps = arguments[0];
+var done = arguments[arguments.length - 1];
+(function next(i) {
+    if (i >= steps.length) { done(); return; }
+    window.scrollBy(0, steps[i][0]);
+    setTimeout(function () { next(i + 1); }, steps[i][1]);
+})(0);
+"""
 
-# Directly copied from the provided code
 def human_like_scroll(driver, scroll_amount=None):
     """Scrolls the page in a human-like way."""
     if scroll_amount is None:
         scroll_amount = random.randint(300, 700)
 
-    # Break scrolling into multiple small movements
+    # Break scrolling into multiple small movements, each with some variation and a short pause
     steps = random.randint(3, 7)
-    for i in range(steps):
-        step_scroll = scroll_amount // steps
-        variation = random.randint(-20, 20)  # Add some variation
-        driver.execute_script(f"window.scrollBy(0, {step_scroll + variation})")
-        time.sleep(random.uniform(0.1, 0.3))
\ No newline at end of file
+    step_scroll = scroll_amount // steps
+    movements = [[step_scroll + random.randint(-20, 20), int(random.uniform(0.1, 0.3) * 1000)]
+                 for _ in range(steps)]
+    driver.execute_async_script(_HUMAN_LIKE_SCROLL_JS, movements)
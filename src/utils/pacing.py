@@ -0,0 +1,265 @@
+# src/utils/pacing.py
+import os
+import time
+import random
+import logging
+import threading
+from collections import deque
+
+# Per-action budgets (actions per minute) and the scale applied to human_delay jitter.
+# "minimal" is for tests and local fixture runs; "cautious" keeps the original full-length pauses.
+PACING_PROFILES = {
+    "minimal": {"page_loads_per_minute": 6000, "clicks_per_minute": 6000, "burst": 100, "delay_scale": 0.0},
+    "normal": {"page_loads_per_minute": 20, "clicks_per_minute": 40, "burst": 3, "delay_scale": 0.5},
+    "cautious": {"page_loads_per_minute": 10, "clicks_per_minute": 20, "burst": 2, "delay_scale": 1.0},
+}
+
+# Environment override so test runs can force a profile without editing config.json
+PACING_PROFILE_ENV = "LINKEDIN_PACING_PROFILE"
+
+# Adaptive slowdown: multiplies every wait; raised by warning signals, decays on success
+_SLOWDOWN_FACTORS = {
+    "checkpoint": 2.0,       # Security check / challenge / authwall redirect
+    "throttled": 2.0,        # HTTP 429 or LinkedIn's 999 status
+    "empty_results": 1.5,    # A results page with no cards
+    "slow_response": 1.25,   # Page took longer than slow_response_seconds
+}
+_MAX_SLOWDOWN = 8.0
+_CHECKPOINT_URL_MARKERS = ("/checkpoint", "/challenge", "/authwall")
+_RECOVERY_FACTOR = 0.95
+
+
+class TokenBucket:
+    """Classic token bucket: `rate_per_minute` tokens refill continuously up to `burst`."""
+
+    def __init__(self, rate_per_minute, burst=1):
+        self.rate_per_second = rate_per_minute / 60.0
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now, slowdown):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate_per_second / slowdown)
+        self.updated = now
+
+    def reserve(self, slowdown=1.0):
+        """Takes one token and returns how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now, slowdown)
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / (self.rate_per_second / slowdown)
+
+
+class Pacer:
+    """Rate-limits browser actions with per-action token buckets and adapts to observed signals."""
+
+    def __init__(self, profile="normal", overrides=None, slow_response_seconds=8.0, max_idle_tasks=20):
+        if profile not in PACING_PROFILES:
+            logging.warning(f"Unknown pacing profile '{profile}'. Using 'normal'.")
+            profile = "normal"
+        settings = dict(PACING_PROFILES[profile])
+        settings.update(overrides or {})
+        self.profile = profile
+        self.delay_scale = settings["delay_scale"]
+        self.slow_response_seconds = slow_response_seconds
+        self.slowdown = 1.0
+        self.buckets = {
+            "page_load": TokenBucket(settings["page_loads_per_minute"], settings["burst"]),
+            "click": TokenBucket(settings["clicks_per_minute"], settings["burst"]),
+        }
+        self._lock = threading.Lock()
+        # Idle work: one-shot tasks belong to the thread that queued them (they may touch its driver);
+        # hooks are thread-safe callables run in every pause on any thread
+        self._local = threading.local()
+        self._idle_hooks = {}
+        self._task_costs = {}  # name -> running estimate of the task's duration in seconds
+        self.max_idle_tasks = max_idle_tasks
+        self.idle_stats = {"pauses": 0, "paused_seconds": 0.0, "tasks": 0, "task_seconds": 0.0, "dropped": 0}
+
+    @classmethod
+    def from_config(cls, pacing_config=None):
+        """Builds a pacer from the "pacing" config section; the environment variable wins."""
+        pacing_config = dict(pacing_config or {})
+        profile = os.getenv(PACING_PROFILE_ENV) or pacing_config.pop("profile", "normal")
+        pacing_config.pop("profile", None)
+        slow_response_seconds = pacing_config.pop("slow_response_seconds", 8.0)
+        max_idle_tasks = pacing_config.pop("max_idle_tasks", 20)
+        return cls(profile, overrides=pacing_config, slow_response_seconds=slow_response_seconds,
+                   max_idle_tasks=max_idle_tasks)
+
+    def when_idle(self, task, name=None):
+        """Queues a one-shot task to run during this thread's next pacing pause.
+
+        A task only starts when its estimated duration fits the remaining
+        pause; tasks that don't fit wait for a later pause without holding up
+        the ones behind them. At most max_idle_tasks wait per thread (the
+        oldest is dropped beyond that); drain_idle_tasks runs the rest.
+        """
+        queue = getattr(self._local, "tasks", None)
+        if queue is None:
+            queue = self._local.tasks = deque()
+        if len(queue) >= self.max_idle_tasks:
+            dropped, _ = queue.popleft()
+            with self._lock:
+                self.idle_stats["dropped"] += 1
+            logging.debug(f"Idle queue full. Dropping task '{dropped}'.")
+        queue.append((name or getattr(task, "__name__", "task"), task))
+
+    def add_idle_hook(self, name, hook):
+        """Registers a thread-safe callable (e.g. an output flush) to run once in every pause."""
+        with self._lock:
+            self._idle_hooks[name] = hook
+
+    def remove_idle_hook(self, name):
+        with self._lock:
+            self._idle_hooks.pop(name, None)
+
+    def _run_task(self, name, task):
+        started = time.monotonic()
+        try:
+            task()
+        except Exception as e:
+            logging.warning(f"Idle task '{name}' failed: {e}")
+        cost = time.monotonic() - started
+        with self._lock:
+            previous = self._task_costs.get(name)
+            self._task_costs[name] = cost if previous is None else 0.7 * previous + 0.3 * cost
+            self.idle_stats["tasks"] += 1
+            self.idle_stats["task_seconds"] += cost
+
+    def _fits(self, name, deadline):
+        return time.monotonic() + self._task_costs.get(name, 0.0) <= deadline
+
+    def run_idle_tasks(self, deadline=None):
+        """Runs queued tasks and hooks that fit before `deadline` (all of them if None).
+
+        Not re-entrant: a task that waits on the pacer itself (e.g. a prefetch
+        taking a page_load token) just sleeps, and that time counts against
+        the window it runs in.
+        """
+        if getattr(self._local, "in_idle", False):
+            return
+        self._local.in_idle = True
+        try:
+            with self._lock:
+                hooks = list(self._idle_hooks.items())
+            for name, hook in hooks:
+                if deadline is None or self._fits(name, deadline):
+                    self._run_task(name, hook)
+            queue = getattr(self._local, "tasks", None)
+            # One pass over what is queued now: run what fits, keep the rest in order for a later pause
+            for _ in range(len(queue or ())):
+                name, task = queue.popleft()
+                if deadline is not None and not self._fits(name, deadline):
+                    queue.append((name, task))
+                    continue
+                self._run_task(name, task)
+        finally:
+            self._local.in_idle = False
+
+    def drain_idle_tasks(self):
+        """Runs every task this thread still has queued, e.g. at the end of a session."""
+        queue = getattr(self._local, "tasks", None)
+        self._local.in_idle = True
+        try:
+            while queue:
+                self._run_task(*queue.popleft())
+        finally:
+            self._local.in_idle = False
+
+    def sleep(self, seconds):
+        """Spends a pacing pause on queued idle work, then sleeps whatever is left of it."""
+        if seconds <= 0:
+            return
+        if getattr(self._local, "in_idle", False):
+            time.sleep(seconds)  # Already inside a pause (an idle task waiting on the pacer)
+            return
+        deadline = time.monotonic() + seconds
+        self.run_idle_tasks(deadline)
+        with self._lock:
+            self.idle_stats["pauses"] += 1
+            self.idle_stats["paused_seconds"] += seconds
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def log_idle_summary(self):
+        """Logs how much of the pacing pauses was spent on useful work."""
+        stats = self.idle_stats
+        if stats["pauses"]:
+            share = min(1.0, stats["task_seconds"] / stats["paused_seconds"]) if stats["paused_seconds"] else 0.0
+            dropped = f", {stats['dropped']} dropped" if stats["dropped"] else ""
+            logging.info(f"Pacing: {stats['pauses']} pauses ({stats['paused_seconds']:.1f}s), "
+                         f"{stats['tasks']} idle tasks used {stats['task_seconds']:.1f}s ({share:.0%}){dropped}")
+
+    def wait(self, action):
+        """Blocks until the action's budget allows one more (e.g. "page_load", "click")."""
+        bucket = self.buckets.get(action)
+        if bucket is None:
+            return 0.0
+        delay = bucket.reserve(self.slowdown)
+        if delay > 0:
+            logging.debug(f"Pacing: waiting {delay:.2f}s before {action}")
+        self.sleep(delay)
+        return delay
+
+    def jitter(self, min_seconds, max_seconds):
+        """Human-like random pause, scaled by the profile and the current slowdown."""
+        delay = random.uniform(min_seconds, max_seconds) * self.delay_scale * self.slowdown
+        self.sleep(delay)
+        return delay
+
+    def observe(self, signal, value=None):
+        """Feeds a signal back into the pacer.
+
+        "checkpoint", "throttled", "empty_results" and "slow_response" slow everything down;
+        "response_time" (seconds) counts as slow above slow_response_seconds;
+        "ok" lets the slowdown decay back towards the profile's pace.
+        """
+        if signal == "response_time":
+            if value is None:
+                return
+            signal = "slow_response" if value > self.slow_response_seconds else "ok"
+        with self._lock:
+            previous = self.slowdown
+            if signal in _SLOWDOWN_FACTORS:
+                self.slowdown = min(_MAX_SLOWDOWN, self.slowdown * _SLOWDOWN_FACTORS[signal])
+            elif signal == "ok":
+                self.slowdown = max(1.0, self.slowdown * _RECOVERY_FACTOR)
+            else:
+                return
+        if signal != "ok" and self.slowdown != previous:
+            logging.info(f"Pacing: '{signal}' observed, slowing down to x{self.slowdown:.2f}")
+
+    def observe_url(self, url):
+        """Signals a checkpoint if `url` is a security check or login wall; returns True if it was."""
+        if url and any(marker in url for marker in _CHECKPOINT_URL_MARKERS):
+            self.observe("checkpoint")
+            return True
+        return False
+
+
+_pacer = None
+_pacer_lock = threading.Lock()
+
+
+def configure_pacing(pacing_config=None):
+    """Installs the process-wide pacer from the "pacing" config section and returns it."""
+    global _pacer
+    with _pacer_lock:
+        _pacer = Pacer.from_config(pacing_config)
+    logging.info(f"Pacing profile: {_pacer.profile}")
+    return _pacer
+
+
+def get_pacer():
+    """Returns the process-wide pacer, creating a default one on first use."""
+    global _pacer
+    with _pacer_lock:
+        if _pacer is None:
+            _pacer = Pacer.from_config()
+        return _pacer
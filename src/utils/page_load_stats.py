@@ -0,0 +1,95 @@
+# src/utils/page_load_stats.py
+import os
+import json
+import logging
+import threading
+
+from .pacing import get_pacer
+
+# Navigation timing of the current document plus totals over its subresources
+_PAGE_TIMING_JS = """
+var nav = performance.getEntriesByType("navigation")[0];
+if (!nav) { return null; }
+var resources = performance.getEntriesByType("resource");
+var resourceBytes = 0;
+for (var i = 0; i < resources.length; i++) { resourceBytes += resources[i].transferSize || 0; }
+return {
+    dom_content_loaded_ms: nav.domContentLoadedEventEnd - nav.startTime,
+    load_ms: nav.loadEventEnd > 0 ? nav.loadEventEnd - nav.startTime : null,
+    bytes: (nav.transferSize || 0) + resourceBytes,
+    requests: resources.length + 1
+};
+"""
+
+_lock = threading.Lock()
+_samples = []
+
+
+def record_page_load(driver, label=""):
+    """Records the timing of the page the driver just loaded and feeds it to the pacer; never raises."""
+    try:
+        timing = driver.execute_script(_PAGE_TIMING_JS)
+    except Exception as e:
+        logging.debug(f"Could not read page timing: {e}")
+        return None
+    if timing:
+        timing["label"] = label
+        with _lock:
+            _samples.append(timing)
+        get_pacer().observe("response_time", timing["dom_content_loaded_ms"] / 1000)
+    return timing
+
+
+def summarize_page_loads(profile, stats_file=None):
+    """Logs this run's page-load averages and the savings against the other profile's history.
+
+    Per-profile running averages are kept in stats_file so a "lean" run can be
+    compared with earlier "default" runs. Returns the run summary (or None).
+    """
+    with _lock:
+        samples, _samples[:] = list(_samples), []
+    if not samples:
+        return None
+
+    summary = {
+        "page_loads": len(samples),
+        "avg_dom_content_loaded_ms": sum(s["dom_content_loaded_ms"] for s in samples) / len(samples),
+        "avg_bytes": sum(s["bytes"] for s in samples) / len(samples),
+        "avg_requests": sum(s["requests"] for s in samples) / len(samples),
+    }
+    logging.info(f"Page loads ({profile} profile): {summary['page_loads']} pages, "
+                 f"avg {summary['avg_dom_content_loaded_ms']:.0f} ms to DOMContentLoaded, "
+                 f"avg {summary['avg_bytes'] / 1024:.0f} KB over {summary['avg_requests']:.0f} requests")
+
+    if not stats_file:
+        return summary
+    history = {}
+    if os.path.exists(stats_file):
+        try:
+            with open(stats_file, "r", encoding="utf-8") as f:
+                history = json.load(f)
+        except Exception as e:
+            logging.warning(f"Could not read page load history {stats_file}: {e}")
+
+    baseline = history.get("default") if profile != "default" else None
+    if baseline and baseline.get("avg_dom_content_loaded_ms"):
+        time_saved = 1 - summary["avg_dom_content_loaded_ms"] / baseline["avg_dom_content_loaded_ms"]
+        bytes_saved = 1 - summary["avg_bytes"] / baseline["avg_bytes"] if baseline.get("avg_bytes") else 0
+        logging.info(f"Savings vs default profile: {time_saved:.0%} load time, {bytes_saved:.0%} bytes per page")
+
+    # Fold this run into the running average for the profile
+    previous = history.get(profile)
+    if previous:
+        total = previous["page_loads"] + summary["page_loads"]
+        for key in ("avg_dom_content_loaded_ms", "avg_bytes", "avg_requests"):
+            summary_total = previous[key] * previous["page_loads"] + summary[key] * summary["page_loads"]
+            previous[key] = summary_total / total
+        previous["page_loads"] = total
+    else:
+        history[profile] = dict(summary)
+    try:
+        with open(stats_file, "w", encoding="utf-8") as f:
+            json.dump(history, f, indent=2)
+    except Exception as e:
+        logging.warning(f"Could not write page load history {stats_file}: {e}")
+    return summary
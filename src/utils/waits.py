@@ -0,0 +1,276 @@
+# src/utils/waits.py
+import time
+import logging
+
+# Polls every candidate selector inside the page and resolves with the first match.
+# Runs for at most `sliceMs` so a navigation can't leave Selenium hanging on a dead script.
+_WAIT_FOR_ANY_JS = """
+var selectors = arguments[0];
+var visibleOnly = arguments[1];
+var sliceMs = arguments[2];
+var pollMs = arguments[3];
+var done = arguments[arguments.length - 1];
+var started = Date.now();
+
+function isVisible(el) {
+    return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+}
+
+function findFirst() {
+    for (var i = 0; i < selectors.length; i++) {
+        var sel = selectors[i];
+        var nodes = [];
+        try {
+            if (sel.type === "xpath") {
+                var result = document.evaluate(sel.value, document, null,
+                    XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                for (var j = 0; j < result.snapshotLength; j++) { nodes.push(result.snapshotItem(j)); }
+            } else {
+                nodes = document.querySelectorAll(sel.value);
+            }
+        } catch (e) { continue; }  // An invalid selector must not break the others
+        for (var k = 0; k < nodes.length; k++) {
+            if (!visibleOnly || isVisible(nodes[k])) { return [i, nodes[k]]; }
+        }
+    }
+    return null;
+}
+
+(function poll() {
+    var match = findFirst();
+    if (match || Date.now() - started >= sliceMs) { done(match); return; }
+    setTimeout(poll, pollMs);
+})();
+"""
+
+
+def normalize_selector(selector):
+    """Turns a selector string or dict into {"type", "value", "name"}.
+
+    Plain strings starting with "//" or "(//" are treated as XPath, anything else as CSS.
+    """
+    if isinstance(selector, dict):
+        normalized = dict(selector)
+        normalized.setdefault("type", "css")
+        normalized.setdefault("name", normalized["value"])
+        return normalized
+    selector_type = "xpath" if selector.startswith("//") or selector.startswith("(//") else "css"
+    return {"type": selector_type, "value": selector, "name": selector}
+
+
+def wait_for_any(driver, selectors, timeout=10, visible=False, poll_interval=0.1, slice_seconds=2.0):
+    """Waits until any of the selectors matches and returns (element, selector).
+
+    All candidates are checked together inside the page, so the wait ends as soon
+    as the fastest one appears instead of running one timeout per selector.
+    Returns (None, None) if nothing matched within the timeout.
+    """
+    candidates = [normalize_selector(selector) for selector in selectors]
+    js_candidates = [{"type": c["type"], "value": c["value"]} for c in candidates]
+    deadline = time.monotonic() + timeout
+
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        slice_ms = int(min(remaining, slice_seconds) * 1000)
+        try:
+            match = driver.execute_async_script(
+                _WAIT_FOR_ANY_JS, js_candidates, visible, slice_ms, int(poll_interval * 1000))
+        except Exception as e:
+            # Usually the page navigated mid-wait; try again on the new document
+            logging.debug(f"wait_for_any poll interrupted: {e}")
+            time.sleep(poll_interval)
+            continue
+        if match:
+            index, element = match
+            winner = candidates[int(index)]
+            logging.debug(f"Matched {winner['name']} ({winner['value']})")
+            return element, winner
+
+    logging.debug(f"None of {len(candidates)} selectors matched within {timeout}s")
+    return None, None
+
+
+# Shared by the observer and signature scripts: the watched subtree and a cheap fingerprint of its content
+_TARGET_SIGNATURE_JS = """
+function findTarget(targetSelectors) {
+    var target = null;
+    for (var i = 0; i < targetSelectors.length && !target; i++) {
+        try { target = document.querySelector(targetSelectors[i]); } catch (e) {}
+    }
+    return target || document.body || document.documentElement;
+}
+
+function signatureOf(target) {
+    var cards = target.querySelectorAll("[data-occludable-job-id], [data-job-id]");
+    var first = cards.length ? (cards[0].getAttribute("data-occludable-job-id") || cards[0].getAttribute("data-job-id")) : null;
+    return {first_job_id: first, cards: cards.length, text_length: (target.innerText || "").length,
+            url: window.location.href};
+}
+"""
+
+# Returns the signature of the first matching selector's subtree (or <body>)
+_SIGNATURE_JS = _TARGET_SIGNATURE_JS + """
+return signatureOf(findTarget(arguments[0]));
+"""
+
+# Watches a subtree with a MutationObserver and the network with a PerformanceObserver.
+# mode "settle": resolves once neither has fired for quietMs (page stopped changing).
+# mode "change": resolves once the content actually differs from `baseline` (another first
+# job card, card count or URL, or a text length change above minTextDelta), so a spinner
+# or a ticking timestamp doesn't count as new results.
+_OBSERVE_DOM_JS = _TARGET_SIGNATURE_JS + """
+var targetSelectors = arguments[0];
+var mode = arguments[1];
+var quietMs = arguments[2];
+var budgetMs = arguments[3];
+var baseline = arguments[4];
+var minTextDelta = arguments[5];
+var done = arguments[arguments.length - 1];
+
+var target = findTarget(targetSelectors);
+
+function differs() {
+    var now = signatureOf(target);
+    return now.first_job_id !== baseline.first_job_id || now.cards !== baseline.cards || now.url !== baseline.url ||
+        Math.abs(now.text_length - baseline.text_length) > minTextDelta;
+}
+
+var started = Date.now(), last = Date.now(), mutations = 0;
+var observer = new MutationObserver(function (records) { mutations += records.length; last = Date.now(); });
+observer.observe(target, {childList: true, subtree: true, attributes: true, characterData: true});
+var network = null;
+try {
+    network = new PerformanceObserver(function () { last = Date.now(); });
+    network.observe({type: "resource"});
+} catch (e) { network = null; }  // Older browsers: DOM activity alone decides
+
+(function check() {
+    var now = Date.now();
+    var ready = mode === "change" ? differs() : now - last >= quietMs;
+    if (ready || now - started >= budgetMs) {
+        observer.disconnect();
+        if (network) { network.disconnect(); }
+        done({ready: ready, mutations: mutations, waited_ms: now - started});
+        return;
+    }
+    setTimeout(check, 50);
+})();
+"""
+
+# Resolves once none of the selectors matches a visible element (e.g. a loader went away)
+_WAIT_FOR_GONE_JS = """
+var selectors = arguments[0];
+var budgetMs = arguments[1];
+var done = arguments[arguments.length - 1];
+var started = Date.now();
+
+function anyVisible() {
+    for (var i = 0; i < selectors.length; i++) {
+        var sel = selectors[i], nodes = [];
+        try {
+            if (sel.type === "xpath") {
+                var result = document.evaluate(sel.value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                for (var j = 0; j < result.snapshotLength; j++) { nodes.push(result.snapshotItem(j)); }
+            } else {
+                nodes = document.querySelectorAll(sel.value);
+            }
+        } catch (e) { continue; }
+        for (var k = 0; k < nodes.length; k++) {
+            var el = nodes[k];
+            if (el.offsetWidth || el.offsetHeight || el.getClientRects().length) { return true; }
+        }
+    }
+    return false;
+}
+
+var finished = false;
+var observer = new MutationObserver(function () {
+    if (!anyVisible()) { finish(true); }
+});
+function finish(gone) {
+    if (finished) { return; }
+    finished = true;
+    observer.disconnect();
+    done(gone);
+}
+if (!anyVisible()) { done(true); return; }
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true});
+setTimeout(function () { finish(!anyVisible()); }, budgetMs);
+"""
+
+
+def _observe(driver, targets, mode, quiet_ms, timeout, slice_seconds, baseline=None, min_text_delta=0):
+    """Runs the observer script in slices until it reports ready or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        budget_ms = int(min(remaining, slice_seconds) * 1000)
+        try:
+            result = driver.execute_async_script(_OBSERVE_DOM_JS, targets, mode, quiet_ms, budget_ms,
+                                                 baseline or {}, min_text_delta)
+        except Exception as e:
+            # A navigation replaced the document; observe the new one
+            logging.debug(f"DOM observer interrupted: {e}")
+            time.sleep(0.1)
+            continue
+        if result and result.get("ready"):
+            logging.debug(f"DOM {mode} after {result.get('waited_ms')} ms ({result.get('mutations')} mutations)")
+            return True
+
+
+def wait_for_dom_settle(driver, selectors=None, quiet_ms=500, timeout=10, slice_seconds=5.0):
+    """Waits until the DOM under the first matching selector (or <body>) and the network go quiet.
+
+    Returns as soon as nothing changed for quiet_ms, instead of sleeping a fixed time.
+    Returns False if the page was still busy when the timeout expired.
+    """
+    return _observe(driver, list(selectors or []), "settle", quiet_ms, timeout, slice_seconds)
+
+
+def page_signature(driver, selectors=None):
+    """Fingerprint of the content under the first matching selector (or <body>), for wait_for_dom_change.
+
+    Take it before the action that should change the page (a click, a submit).
+    Returns None if the page can't be read.
+    """
+    try:
+        return driver.execute_script(_SIGNATURE_JS, list(selectors or []))
+    except Exception as e:
+        logging.debug(f"Could not read page signature: {e}")
+        return None
+
+
+def wait_for_dom_change(driver, selectors=None, timeout=10, slice_seconds=5.0, baseline=None, min_text_delta=200):
+    """Waits until the content under the first matching selector (or <body>) really differs from baseline.
+
+    Mutations alone don't count: the first job card, the card count or the URL must
+    change, or the text length by more than min_text_delta characters. baseline is a
+    page_signature() taken before the triggering action; without one it is taken now.
+    """
+    selectors = list(selectors or [])
+    baseline = baseline or page_signature(driver, selectors)
+    if baseline is None:
+        return False
+    return _observe(driver, selectors, "change", 0, timeout, slice_seconds,
+                    baseline=baseline, min_text_delta=min_text_delta)
+
+
+def wait_for_gone(driver, selectors, timeout=15, slice_seconds=5.0):
+    """Waits until none of the selectors (CSS or XPath) matches a visible element."""
+    candidates = [{"type": c["type"], "value": c["value"]} for c in map(normalize_selector, selectors)]
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        budget_ms = int(min(remaining, slice_seconds) * 1000)
+        try:
+            if driver.execute_async_script(_WAIT_FOR_GONE_JS, candidates, budget_ms):
+                return True
+        except Exception as e:
+            logging.debug(f"wait_for_gone interrupted: {e}")
+            time.sleep(0.1)
@@ -0,0 +1,53 @@
+# tests/test_compaction.py
+import json
+import os
+
+from src.compaction import compact, expand_paths
+from src.job_store import JobStore
+
+FULL = {"job_id": "1", "title": "Python Engineer", "company": "Acme", "location": "Pune",
+        "url": "https://www.linkedin.com/jobs/view/1/", "description": "x" * 900,
+        "date_posted": "2 days ago", "scraped_at": "2026-10-01 09:59:59"}
+
+
+def _write_txt(path, jobs):
+    # Same layout as output_handler.TxtWriter
+    with open(path, "w", encoding="utf-8") as f:
+        for job in jobs:
+            f.write(f"Title: {job.get('title', 'Unknown')}\n")
+            f.write(f"Company: {job.get('company', 'Unknown')}\n")
+            f.write(f"Location: {job.get('location', 'Unknown')}\n")
+            f.write(f"Posted: {job.get('date_posted', 'Unknown')}\n")
+            f.write(f"URL: {job.get('url', '')}\n")
+            f.write(f"Description: {job.get('description', 'No description available')[:500]}...\n")
+            f.write("\n" + "-" * 80 + "\n\n")
+
+
+def _stored(store, job_id):
+    return store.conn.execute(
+        "SELECT j.title, c.name AS company, j.description, j.date_posted FROM jobs j "
+        "LEFT JOIN companies c ON c.id = j.company_id WHERE job_id = ?", (job_id,)).fetchone()
+
+
+def test_txt_copy_of_a_run_is_skipped(tmp_path):
+    for name in ("linkedin_jobs_20261001_100000.json", "linkedin_jobs_20261001_100000.txt",
+                 "linkedin_jobs_20261002_100000.txt"):
+        (tmp_path / name).write_text("[]")
+
+    names = [os.path.basename(path) for path in expand_paths([str(tmp_path)])]
+    assert names == ["linkedin_jobs_20261001_100000.json", "linkedin_jobs_20261002_100000.txt"]
+
+
+def test_txt_records_never_replace_stored_jobs(tmp_path):
+    (tmp_path / "linkedin_jobs_20261001_100000.jsonl").write_text(json.dumps(FULL) + "\n")
+    # A later txt-only run with the same job, plus one job only the txt file has
+    _write_txt(tmp_path / "linkedin_jobs_20261003_100000.txt",
+               [FULL, {"url": "https://www.linkedin.com/jobs/view/2/"}])
+
+    with JobStore(str(tmp_path / "jobs.sqlite3")) as store:
+        compact([str(tmp_path)], store)
+
+        assert _stored(store, "1")["description"] == FULL["description"]
+        txt_only = _stored(store, "2")
+        assert txt_only["title"] is None and txt_only["company"] is None
+        assert txt_only["date_posted"] is None and txt_only["description"] is None
@@ -0,0 +1,49 @@
+# tests/test_coordinator.py
+import queue
+from concurrent.futures import Future
+
+from src.coordinator import merge_worker_jobs, shard_queries, worker_config
+
+
+def _finished(result=None, error=None):
+    future = Future()
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+    return future
+
+
+def test_shards_are_round_robin():
+    assert shard_queries([1, 2, 3, 4, 5], 2) == [[1, 3, 5], [2, 4]]
+    assert shard_queries([1], 4) == [[1]]
+
+
+def test_worker_config_reads_the_seen_index_only(tmp_path):
+    config = worker_config({"sharding": {"profile_root": str(tmp_path)}, "dedup": {"enabled": True}}, 1)
+
+    assert config["dedup"] == {"enabled": True, "read_only": True}
+    assert config["driver"]["profile_root"] == str(tmp_path / "worker-1")
+
+
+def test_merge_saves_each_job_once_as_it_arrives():
+    jobs = queue.Queue()
+    for item in [(0, {"job_id": "1"}), (1, {"job_id": "1"}), (1, {"url": "https://x/2"}),
+                 (0, {"job_id": "3"}), (0, None), (1, {"job_id": "3"}), (1, None)]:
+        jobs.put(item)
+    saved = []
+
+    assert merge_worker_jobs(jobs, {_finished(3): 0, _finished(1): 1}, saved.append) == (3, 2)
+    assert saved == [{"job_id": "1"}, {"url": "https://x/2"}, {"job_id": "3"}]
+
+
+def test_merge_keeps_what_a_dead_worker_sent():
+    jobs = queue.Queue()
+    # Worker 1 was killed before sending its end marker
+    for item in [(1, {"job_id": "1"}), (0, {"job_id": "2"}), (0, None)]:
+        jobs.put(item)
+    saved = []
+
+    futures = {_finished(1): 0, _finished(error=RuntimeError("killed")): 1}
+    assert merge_worker_jobs(jobs, futures, saved.append, poll_seconds=0.01) == (2, 0)
+    assert [job["job_id"] for job in saved] == ["1", "2"]
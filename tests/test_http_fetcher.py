@@ -0,0 +1,117 @@
+# tests/test_http_fetcher.py
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("lxml.html")
+pytest.importorskip("cssselect")
+
+from src.http_fetcher import HttpJobFetcher, parse_job_html  # noqa: E402
+from conftest import read_fixture  # noqa: E402
+
+JOB_ID = "3912345678"
+
+
+def test_parse_job_html_reads_every_field():
+    job = parse_job_html(read_fixture("job_view_guest.html"), f"https://www.linkedin.com/jobs/view/{JOB_ID}/")
+
+    assert job["title"] == "Senior Python Engineer"
+    assert job["company"] == "Acme Analytics"  # Whitespace runs collapsed
+    assert job["location"] == "Bengaluru, Karnataka, India"
+    assert job["date_posted"] == "3 days ago"
+    assert job["description"].startswith("About the role")
+    assert "Kubernetes and C++ extensions" in job["description"]
+    assert job["easy_apply"] is True
+    assert job["job_id"] == JOB_ID
+    assert job["url"] == f"https://www.linkedin.com/jobs/view/{JOB_ID}/"
+
+
+def test_parse_job_html_rejects_pages_without_a_job():
+    assert parse_job_html(read_fixture("authwall.html"), "https://www.linkedin.com/authwall") is None
+
+
+def test_parse_job_html_fills_defaults_and_detects_missing_easy_apply():
+    html = '<html><body><h1 class="top-card-layout__title">Data Engineer</h1></body></html>'
+    job = parse_job_html(html, f"https://www.linkedin.com/jobs/view/{JOB_ID}/")
+
+    assert job["title"] == "Data Engineer"
+    assert job["company"] == "Unknown Company"
+    assert job["description"] == "Description not available"
+    assert job["easy_apply"] is False
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    """Stand-in for linkedin.com: serves the recorded job page and a few failure modes."""
+
+    requests = []
+
+    def do_GET(self):
+        self.requests.append((self.path, self.headers.get("cookie")))
+        if self.path == f"/jobs/view/{JOB_ID}/":
+            self._send(200, read_fixture("job_view_guest.html", "rb"))
+        elif self.path == "/jobs/view/1/":
+            self._send(302, b"", {"Location": "https://www.linkedin.com/authwall?trk=job"})
+        elif self.path == "/jobs/view/2/":
+            self._send(429, b"")
+        elif self.path == "/jobs/view/3/":
+            self._send(200, read_fixture("authwall.html", "rb"))
+        else:
+            self._send(404, b"")
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def fixture_server():
+    _FixtureHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FixtureHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def fetcher(fixture_server):
+    cookies = [{"name": "li_at", "value": "token"}, {"name": "JSESSIONID", "value": "ajax:1"}]
+    fetcher = HttpJobFetcher(cookies, user_agent="test-agent", base_url=fixture_server, timeout=5)
+    yield fetcher
+    fetcher.close()
+
+
+def test_fetch_parses_the_job_and_merges_card_data(fetcher):
+    card = {"job_id": JOB_ID, "title": "Card title", "posted_on": "2026-10-14", "easy_apply": None}
+    job = fetcher.fetch(card)
+
+    assert job["title"] == "Senior Python Engineer"  # The page wins over the card
+    assert job["posted_on"] == "2026-10-14"          # Card-only fields are kept
+    assert job["easy_apply"] is True
+    assert job["url"] == f"{fetcher.base_url}/jobs/view/{JOB_ID}/"
+    assert _FixtureHandler.requests == [(f"/jobs/view/{JOB_ID}/", "li_at=token; JSESSIONID=ajax:1")]
+
+
+def test_fetch_falls_back_on_a_login_redirect(fetcher, minimal_pacing):
+    assert fetcher.fetch({"job_id": "1"}) is None
+    assert minimal_pacing.slowdown > 1.0  # Redirect to the authwall counts as a checkpoint
+
+
+def test_fetch_falls_back_and_slows_down_when_throttled(fetcher, minimal_pacing):
+    assert fetcher.fetch({"job_id": "2"}) is None
+    assert minimal_pacing.slowdown > 1.0
+
+
+def test_fetch_falls_back_on_an_unparseable_page(fetcher):
+    assert fetcher.fetch({"job_id": "3"}) is None
+    assert fetcher.fetch({"job_id": "404"}) is None
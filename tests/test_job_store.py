@@ -0,0 +1,52 @@
+# tests/test_job_store.py
+import sqlite3
+
+import pytest
+
+from src.job_store import JobStore, fts_query, main
+
+JOBS = [
+    {"job_id": "1", "title": "Senior C++ Developer", "company": "Acme", "location": "Pune",
+     "description": "Low-latency C++ and Python services on Kubernetes.", "scraped_at": "2026-10-01 10:00:00"},
+    {"job_id": "2", "title": "Python Engineer", "company": "Globex", "location": "Bengaluru",
+     "description": "Django APIs; some Kubernetes.", "scraped_at": "2026-10-02 10:00:00"},
+    {"job_id": "3", "title": "Go Engineer", "company": "Initech", "location": "Remote",
+     "description": "Go microservices.", "scraped_at": "2026-10-03 10:00:00"},
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    with JobStore(str(tmp_path / "jobs.sqlite3")) as store:
+        store.upsert_many(JOBS)
+        yield store
+
+
+def _ids(rows):
+    return sorted(row["job_id"] for row in rows)
+
+
+def test_fts_query_quotes_every_term():
+    assert fts_query('Python + "K8s"') == '"Python" "+" """K8s"""'
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Python + Kubernetes", ["1", "2"]),
+    ("C++", ["1"]),
+    ("python AND go", []),          # AND is just another term unless raw
+    ("NEAR(", []),
+])
+def test_plain_search_never_raises(store, text, expected):
+    assert _ids(store.search(text)) == expected
+
+
+def test_raw_search_uses_fts5_syntax(store):
+    assert _ids(store.search("python OR go", raw=True)) == ["1", "2", "3"]
+    with pytest.raises(sqlite3.OperationalError):
+        store.search("C++", raw=True)
+
+
+def test_cli_accepts_plain_terms(store, capsys):
+    assert main(["C++ Kubernetes", "--db", store.db_path, "--json"]) == 0
+    out = capsys.readouterr().out
+    assert '"job_id": "1"' in out and '"job_id": "2"' not in out
@@ -0,0 +1,200 @@
+# tests/test_network_capture.py
+import json
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+from urllib.request import urlopen
+
+import pytest
+
+from src.linkedin_actions.network_capture import drain_job_responses, records_from_payload, iter_captured_jobs
+from conftest import read_fixture
+
+CARDS = json.loads(read_fixture("voyager_job_cards.json"))
+POSTINGS = json.loads(read_fixture("voyager_job_postings.json"))
+LISTED_AT = datetime.fromtimestamp(1760400000000 / 1000).isoformat()
+
+
+def _only(payload, job_id):
+    """The payload with just one job's posting (plus every company it could reference)."""
+    included = [entity for entity in payload["included"]
+                if not entity["$type"].endswith("JobPosting") or entity["entityUrn"].endswith(job_id)]
+    return {"data": payload["data"], "included": included}
+
+
+def test_records_from_cards():
+    records = records_from_payload(CARDS)
+
+    assert set(records) == {"3900000001", "3900000002", "3900000003"}
+    assert records["3900000001"] == {
+        "job_id": "3900000001",
+        "title": "Senior Python Engineer",
+        "company": "Acme Analytics",
+        "location": "Bengaluru, Karnataka, India (Hybrid)",
+        "posted_on": LISTED_AT,
+        "easy_apply": True,
+    }
+    assert records["3900000002"]["easy_apply"] is False      # Footer present, no Easy Apply item
+    assert "easy_apply" not in records["3900000003"]          # No footer: unknown, not False
+    assert records["3900000003"]["title"] == "Staff Engineer, Platform"  # Via "*jobPosting" and {"text"}
+
+
+def test_records_from_postings_resolve_included_companies():
+    records = records_from_payload(POSTINGS)
+
+    acme = records["3900000001"]
+    assert acme["company"] == "Acme Analytics Pvt Ltd"  # "*company" URN resolved from "included"
+    assert acme["description"].startswith("We are looking for a Senior Python Engineer.")
+    assert acme["location"] == "Bengaluru, Karnataka, India"
+    assert acme["easy_apply"] is True                    # ComplexOnsiteApply
+    assert records["3900000003"]["easy_apply"] is False  # OffsiteApply
+    assert records["3900000003"]["company"] == "Initech"
+
+
+def test_posting_overrides_card_in_one_payload():
+    combined = {"included": CARDS["included"] + POSTINGS["included"]}
+    record = records_from_payload(combined)["3900000001"]
+
+    assert record["company"] == "Acme Analytics Pvt Ltd"
+    assert record["location"] == "Bengaluru, Karnataka, India"
+    assert "description" in record
+
+
+def test_records_from_payload_ignores_unrelated_json():
+    assert records_from_payload({"data": {"$type": "com.linkedin.voyager.feed.Update", "urn": "x"}}) == {}
+    assert records_from_payload(None) == {}
+    assert records_from_payload([{"$type": "com.linkedin.voyager.dash.jobs.JobPostingCard"}]) == {}
+
+
+class _VoyagerHandler(BaseHTTPRequestHandler):
+    """Stand-in for LinkedIn's Voyager API: serves the recorded card and posting responses."""
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/voyager/api/voyagerJobsDashJobCards":
+            self._send(CARDS)
+        elif path.startswith("/voyager/api/jobs/jobPostings/"):
+            self._send(_only(POSTINGS, path.rsplit("/", 1)[1]))
+        elif path == "/voyager/api/feed/updates":
+            self._send({"included": []})  # Not a job endpoint
+        elif path == "/voyager/api/jobs/search":
+            self._send(CARDS, content_type="text/html; charset=utf-8")  # Job endpoint, but not JSON
+        else:
+            self.send_error(404)
+
+    def _send(self, payload, content_type="application/vnd.linkedin.normalized+json+2.1; charset=utf-8"):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def voyager_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _VoyagerHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class ServedCaptureDriver:
+    """Plays the browser against the fixture server, recording responses the way Chrome's performance log does.
+
+    Loading the results page requests the card endpoint (plus unrelated XHRs);
+    clicking a card requests its posting. Each response becomes a
+    Network.responseReceived entry whose body Network.getResponseBody returns.
+    """
+
+    def __init__(self, server_url):
+        self.server_url = server_url
+        self.current_url = server_url + "/jobs/search/?keywords=python"
+        self.clicked = []
+        self._log = []
+        self._bodies = {}
+        for path in ("/voyager/api/feed/updates", "/voyager/api/jobs/search?start=0",
+                     "/voyager/api/voyagerJobsDashJobCards?q=jobSearch&start=0"):
+            self._request(path)
+        self.card_ids = [entity["entityUrn"].split("(")[1].split(",")[0] for entity in CARDS["included"]]
+
+    def _request(self, path):
+        with urlopen(self.server_url + path, timeout=5) as response:
+            request_id = str(len(self._bodies) + 1)
+            self._bodies[request_id] = response.read().decode("utf-8")
+            # Chrome reports the MIME type without its parameters
+            mime_type = response.headers.get_content_type()
+            message = {"method": "Network.responseReceived",
+                       "params": {"requestId": request_id,
+                                  "response": {"url": response.url, "status": response.status,
+                                               "mimeType": mime_type}}}
+        self._log.append({"message": json.dumps({"message": message})})
+
+    def get_log(self, log_type):
+        entries, self._log = self._log, []
+        return entries
+
+    def execute_cdp_cmd(self, command, params):
+        return {"body": self._bodies[params["requestId"]]}
+
+    def execute_async_script(self, script, *args):
+        if "stableRounds" in script:  # load_all_cards
+            return {"ids": self.card_ids, "total": len(self.card_ids),
+                    "materialized": len(self.card_ids), "complete": True}
+        return [0, object()]          # wait_for_any: the list container is there
+
+    def execute_script(self, script, *args):
+        job_id = args[0]                # click_job_card
+        self.clicked.append(job_id)
+        self._request(f"/voyager/api/jobs/jobPostings/{job_id}")
+        return True
+
+
+@pytest.fixture
+def driver(voyager_server):
+    return ServedCaptureDriver(voyager_server)
+
+
+def test_iter_captured_jobs_filters_on_cards_then_on_postings(driver):
+    jobs = list(iter_captured_jobs(driver, max_pages=1, easy_apply_only=True, seen_index={"3900000002"}))
+
+    assert [job["job_id"] for job in jobs] == ["3900000001"]
+    # 3900000002 is already seen: never clicked. 3900000003's card can't tell, so its
+    # posting is fetched, and the OffsiteApply posting rejects it.
+    assert driver.clicked == ["3900000001", "3900000003"]
+    job = jobs[0]
+    assert job["company"] == "Acme Analytics Pvt Ltd"
+    assert job["description"].startswith("We are looking for")
+    assert job["url"] == "https://www.linkedin.com/jobs/view/3900000001/"
+    assert job["date_posted"] == LISTED_AT
+    assert job["scraped_at"]
+
+
+def test_iter_captured_jobs_rejects_on_card_data_before_clicking(driver):
+    jobs = list(iter_captured_jobs(driver, max_pages=1, easy_apply_only=False,
+                                   job_filters={"company_blocklist": ["globex"], "title_exclude": ["staff"]}))
+
+    assert [job["job_id"] for job in jobs] == ["3900000001"]
+    assert driver.clicked == ["3900000001"]
+
+
+def test_iter_captured_jobs_without_descriptions_uses_cards_only(driver):
+    jobs = list(iter_captured_jobs(driver, max_pages=1, easy_apply_only=True, with_descriptions=False))
+
+    # The Globex card says it isn't Easy Apply; the Initech card can't tell and is kept
+    assert [job["job_id"] for job in jobs] == ["3900000001", "3900000003"]
+    assert driver.clicked == []
+    assert all("description" not in job for job in jobs)
+    assert jobs[1]["company"] == "Initech"
+
+
+def test_only_json_job_responses_are_read(driver):
+    # Three responses on page load: the feed (not a job endpoint), an HTML job endpoint, the cards
+    assert drain_job_responses(driver) == [CARDS]
+    assert driver.get_log("performance") == []  # Draining consumed the log
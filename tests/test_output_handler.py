@@ -0,0 +1,79 @@
+# tests/test_output_handler.py
+import gzip
+import json
+
+import pytest
+
+from src.compaction import iter_file_records
+from src.output_handler import JsonlWriter, ParquetWriter, PARQUET_DICTIONARY_COLUMNS
+
+JOBS = [{"job_id": str(i), "title": f"Engineer {i}", "company": "Acme" if i % 2 else "Globex",
+         "location": "Pune", "easy_apply": bool(i % 2), "description": "x" * 40,
+         "search_query": "python @ Pune", "scraped_at": "2026-10-01 10:00:00"} for i in range(5)]
+
+
+@pytest.fixture(autouse=True)
+def in_tmp_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+
+def _read_lines(path):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_jsonl_rotates_into_parts_by_size():
+    # ~200 bytes per job: every part holds two jobs
+    with JsonlWriter(rotate_mb=300 / (1024 * 1024)) as writer:
+        writer.write_many(JOBS)
+
+    assert [path.rsplit("_", 1)[1] for path in writer.paths] == ["part001.jsonl", "part002.jsonl", "part003.jsonl"]
+    assert [job for path in writer.paths for job in _read_lines(path)] == JOBS
+    assert writer.jobs_written == 5
+
+
+def test_jsonl_without_rotation_writes_one_file():
+    with JsonlWriter() as writer:
+        writer.write_many(JOBS)
+
+    assert len(writer.paths) == 1 and "_part" not in writer.paths[0]
+    assert _read_lines(writer.paths[0]) == JOBS
+
+
+def test_jsonl_gzip_round_trip():
+    with JsonlWriter(compression="gzip") as writer:
+        writer.write_many(JOBS)
+
+    assert writer.paths[0].endswith(".jsonl.gz")
+    assert _read_lines(writer.paths[0]) == JOBS
+
+
+def test_jsonl_gzip_is_readable_up_to_the_last_sync_before_close():
+    writer = JsonlWriter(compression="gzip", fsync_every=2)
+    writer.write_many(JOBS[:3])  # Synced after the second job; the third is still buffered
+
+    recovered = [job for job, _ in iter_file_records(writer.paths[0])]
+    assert recovered[:2] == JOBS[:2]
+    writer.close()
+
+
+def test_jsonl_rejects_unknown_compression():
+    with pytest.raises(ValueError):
+        JsonlWriter(compression="lz4")
+
+
+def test_parquet_row_groups_and_dictionary_columns():
+    pq = pytest.importorskip("pyarrow.parquet")
+    with ParquetWriter(row_group_size=2) as writer:
+        writer.write_many(JOBS)
+        writer.write({"job_id": "5", "easy_apply": None})  # Missing fields become nulls
+
+    parquet_file = pq.ParquetFile(writer.path)
+    assert parquet_file.metadata.num_row_groups == 3
+    table = parquet_file.read()
+    assert table.column("job_id").to_pylist() == [str(i) for i in range(6)]
+    assert table.column("easy_apply").to_pylist() == [False, True, False, True, False, None]
+    for name in PARQUET_DICTIONARY_COLUMNS:
+        assert str(table.schema.field(name).type).startswith("dictionary")
+    assert table.column("company").to_pylist()[:2] == ["Globex", "Acme"]
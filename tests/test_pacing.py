@@ -0,0 +1,52 @@
+# tests/test_pacing.py
+from src.utils.pacing import Pacer
+
+
+def _pacer():
+    # One page load per 60ms after the first; no jitter
+    return Pacer("minimal", overrides={"page_loads_per_minute": 1000, "burst": 1})
+
+
+def test_idle_task_waiting_on_the_pacer_does_not_reenter():
+    pacer = _pacer()
+    ran = []
+
+    def prefetch():
+        ran.append("prefetch start")
+        pacer.wait("page_load")  # Sleeps: must not run the other queued task from inside this one
+        ran.append("prefetch end")
+
+    pacer.wait("page_load")  # Use up the burst
+    pacer.when_idle(prefetch, name="prefetch_job")
+    pacer.when_idle(lambda: ran.append("other"), name="other")
+    pacer.sleep(0.2)
+
+    assert ran == ["prefetch start", "prefetch end", "other"]
+    assert pacer.idle_stats["pauses"] == 1  # The nested wait is not counted as a pause of its own
+
+
+def test_time_an_idle_task_waits_counts_against_the_window():
+    pacer = _pacer()
+    pacer.wait("page_load")
+    pacer.when_idle(lambda: pacer.wait("page_load"), name="prefetch_job")
+
+    pacer.sleep(0.2)
+    assert pacer.idle_stats["task_seconds"] > 0.03  # Its pacing wait was spent inside the window
+
+    # Now estimated to take ~60ms, it waits for a window long enough for it
+    pacer.when_idle(lambda: pacer.wait("page_load"), name="prefetch_job")
+    pacer.sleep(0.001)
+    assert pacer.idle_stats["tasks"] == 1
+
+
+def test_hooks_run_in_every_pause():
+    pacer = _pacer()
+    flushes = []
+    pacer.add_idle_hook("output_flush", lambda: flushes.append(1))
+
+    pacer.sleep(0.01)
+    pacer.sleep(0.01)
+    pacer.remove_idle_hook("output_flush")
+    pacer.sleep(0.01)
+
+    assert len(flushes) == 2
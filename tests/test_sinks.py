@@ -0,0 +1,101 @@
+# tests/test_sinks.py
+import json
+
+import pytest
+
+from src.seen_jobs import SeenJobsIndex, mark_seen_when_saved, stop_marking_seen
+from src.sinks import MIN_FLUSH_SECONDS, AsyncBatchingSink, FanOutSink, build_output_sinks
+
+
+class ListSink:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.jobs = []
+
+    def write_many(self, jobs):
+        if self.fail:
+            raise RuntimeError("endpoint down")
+        self.jobs.extend(jobs)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_failed_batches_are_spilled(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    sink = AsyncBatchingSink("hook/1", ListSink(fail=True), batch_size=2)
+    sink.write_many([{"job_id": str(i)} for i in range(3)])
+    sink.close()
+
+    assert sink.failed_batches == 2 and sink.jobs_spilled == 3 and sink.jobs_lost == 0
+    with open(sink.spill_path, encoding="utf-8") as f:
+        assert [json.loads(line)["job_id"] for line in f] == ["0", "1", "2"]
+    assert sink.spill_path.startswith("linkedin_jobs_unsaved_hook-1_")
+
+
+def test_zero_flush_interval_is_clamped():
+    sink = AsyncBatchingSink("list", ListSink(), flush_seconds=0)
+    sink.write({"job_id": "1"})
+    sink.close()
+
+    assert sink.flush_seconds == MIN_FLUSH_SECONDS
+    assert sink.sink.jobs == [{"job_id": "1"}]
+
+
+def test_primary_output_must_open():
+    with pytest.raises(ValueError, match="xml"):
+        build_output_sinks({"file_format": "xml"})
+
+
+def test_other_sinks_that_fail_to_open_are_skipped(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    sink = build_output_sinks({"file_format": "jsonl", "sinks": [{"type": "webhook"}]})
+    try:
+        assert [s.name for s in sink.sinks] == ["jsonl"]
+    finally:
+        sink.close()
+
+
+@pytest.fixture
+def seen_index(tmp_path):
+    with SeenJobsIndex(str(tmp_path / "seen.sqlite3")) as index:
+        yield index
+
+
+def _scrape_into(sink, seen_index, job_ids):
+    save = mark_seen_when_saved(sink, seen_index)
+    for job_id in job_ids:
+        save({"job_id": job_id})
+    stop_marking_seen(sink)
+
+
+def test_jobs_are_marked_seen_once_saved(tmp_path, monkeypatch, seen_index):
+    monkeypatch.chdir(tmp_path)
+    output = ListSink()
+    # Only the first sink (the file_format output) decides; the failing extra sink doesn't
+    sink = FanOutSink([AsyncBatchingSink("list", output, flush_seconds=60),
+                       AsyncBatchingSink("down", ListSink(fail=True))])
+    _scrape_into(sink, seen_index, ["1", "2"])
+
+    assert output.jobs == [{"job_id": "1"}, {"job_id": "2"}]  # Delivered by the flush, not the 60s timer
+    assert "1" in seen_index and "2" in seen_index
+    sink.close()
+
+
+def test_jobs_that_fail_to_save_stay_unseen(tmp_path, monkeypatch, seen_index):
+    monkeypatch.chdir(tmp_path)
+    sink = FanOutSink([AsyncBatchingSink("down", ListSink(fail=True))])
+    _scrape_into(sink, seen_index, ["1"])
+    sink.close()
+
+    assert "1" not in seen_index
+
+
+def test_nothing_is_marked_seen_without_outputs(seen_index):
+    sink = FanOutSink([])
+    _scrape_into(sink, seen_index, ["1"])
+
+    assert "1" not in seen_index